@@ -43,6 +43,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     
     # Third party apps
     "rest_framework",
@@ -204,6 +205,11 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'EXCEPTION_HANDLER': 'public_api.exception_handlers.custom_exception_handler',
+    # Per user/IP limits for views opting in with ScopedRateThrottle.
+    'DEFAULT_THROTTLE_RATES': {
+        'paper_view': env('PAPER_VIEW_THROTTLE_RATE', default='60/min'),
+        'paper_export': env('PAPER_EXPORT_THROTTLE_RATE', default='20/hour'),
+    },
 }
 
 # Authentication backends
@@ -297,6 +303,55 @@ OPENAI_MODEL = env.str('OPENAI_MODEL', 'gpt-4o-mini')
 INTERNAL_VENUE_MAP_KEY = env.str('INTERNAL_VENUE_MAP_KEY', default='')
 VENUE_OK_AUTO_FUZZY = int(os.environ.get('VENUE_OK_AUTO_FUZZY', '92'))
 
+# List endpoints: exact COUNT(*) results are cached per filter signature for
+# this many seconds; unfiltered tables above the row threshold use the
+# pg_class.reltuples estimate instead (pagination.totalItemsExact = false).
+LIST_COUNT_CACHE_TTL = env.int('LIST_COUNT_CACHE_TTL', default=60)
+LIST_COUNT_ESTIMATE_MIN_ROWS = env.int('LIST_COUNT_ESTIMATE_MIN_ROWS', default=10000)
+
+# Cache backend shared by list counts and the anonymous response cache
+# (public_api.response_cache). Redis when REDIS_URL is set (needs the redis
+# package), a file store when CACHE_FILE_DIR is set, otherwise per-process
+# local memory.
+REDIS_URL = env.str('REDIS_URL', default='')
+CACHE_FILE_DIR = env.str('CACHE_FILE_DIR', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+elif CACHE_FILE_DIR:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_FILE_DIR,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'public-api',
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
+    }
+# Seconds an anonymous GET response stays cached (tag busts evict it earlier).
+RESPONSE_CACHE_TTL = env.int('RESPONSE_CACHE_TTL', default=300)
+# Cache-Control max-age for anonymous detail responses; 0 makes clients
+# revalidate every time (cheap, thanks to ETag/Last-Modified 304s).
+DETAIL_CACHE_MAX_AGE = env.int('DETAIL_CACHE_MAX_AGE', default=0)
+DETAIL_CACHE_VARY = env.list('DETAIL_CACHE_VARY', default=['Authorization', 'Cookie'])
+# Seconds between bulk flushes of buffered paper view/download counts (0 disables
+# the background flusher; counts then only flush at process exit or on demand).
+PAPER_COUNTER_FLUSH_INTERVAL = env.int('PAPER_COUNTER_FLUSH_INTERVAL', default=30)
+# Seconds during which repeat views of a paper by the same user, session or IP
+# are not counted again (0 counts every hit).
+PAPER_VIEW_DEDUPE_SECONDS = env.int('PAPER_VIEW_DEDUPE_SECONDS', default=1800)
+# Most rows a single /api/papers/export/ request streams (?limit= is clamped to it).
+PAPER_EXPORT_MAX_ROWS = env.int('PAPER_EXPORT_MAX_ROWS', default=50000)
+
 # Maximum upload file size (5MB)
 DATA_UPLOAD_MAX_MEMORY_SIZE = None
 
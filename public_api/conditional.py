@@ -0,0 +1,193 @@
+"""
+Conditional GET (ETag / Last-Modified) and Cache-Control for public detail views.
+
+Each detail endpoint has a ``*_version`` function that reads, in one query, the
+``updated_at`` stamps and membership fingerprints of the rows feeding its
+payload. ``conditional_detail`` turns that into Django ``condition``
+validators, so a matching ``If-None-Match`` / ``If-Modified-Since`` gets a 304
+before the view serializes anything.
+
+Last-Modified cannot see rows removed from a relation; the ETag covers those
+through id fingerprints and counts, and wins when a client sends both.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from functools import wraps
+
+from django.conf import settings
+from django.db.models import (
+    CharField,
+    DateTimeField,
+    Exists,
+    F,
+    Func,
+    OuterRef,
+    Subquery,
+)
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .models import (
+    Author,
+    Conference,
+    Dataset,
+    DownloadedPaper,
+    InterestingPaper,
+    Journal,
+    Paper,
+    Task,
+)
+
+DETAIL_CACHE_MAX_AGE = getattr(settings, "DETAIL_CACHE_MAX_AGE", 0)
+DETAIL_CACHE_VARY = getattr(settings, "DETAIL_CACHE_VARY", ["Authorization", "Cookie"])
+
+
+@dataclass(frozen=True)
+class Version:
+    last_modified: datetime | None
+    etag: str
+
+
+class _Latest(Func):
+    template = "MAX(%(expressions)s)"
+    output_field = DateTimeField()
+
+
+class _Fingerprint(Func):
+    """md5 over the sorted ids of a related set; changes on any add or remove."""
+
+    template = "md5(string_agg(%(expressions)s::text, ',' ORDER BY %(expressions)s))"
+    output_field = CharField()
+
+
+def _scalar(queryset, expression):
+    """Correlated scalar subquery computing one aggregate over ``queryset``."""
+    return Subquery(queryset.order_by().annotate(value=expression).values("value")[:1])
+
+
+def _stamps(queryset):
+    """Latest ``updated_at`` and id fingerprint of a related set."""
+    return _scalar(queryset, _Latest("updated_at")), _scalar(queryset, _Fingerprint("id"))
+
+
+def _user(request):
+    user = getattr(request, "user", None)
+    return user if user is not None and user.is_authenticated else None
+
+
+def _load_version(queryset, values: dict, extra=()) -> Version | None:
+    row = queryset.values(**values).first()
+    if row is None:
+        return None
+    times = [value for value in row.values() if isinstance(value, datetime)]
+    digest = hashlib.md5(repr((sorted(row.items()), extra)).encode("utf-8")).hexdigest()
+    return Version(max(times) if times else None, digest)
+
+
+def paper_version(request, paper_id) -> Version | None:
+    authors_updated, authors = _stamps(Author.objects.filter(papers=OuterRef("pk")))
+    datasets_updated, datasets = _stamps(Dataset.objects.filter(papers=OuterRef("pk")))
+    values = {
+        "updated": F("updated_at"),
+        "journal_updated": F("journal__updated_at"),
+        "conference_updated": F("conference__updated_at"),
+        "authors_updated": authors_updated,
+        "authors_ids": authors,
+        "datasets_updated": datasets_updated,
+        "datasets_ids": datasets,
+    }
+    user = _user(request)
+    if user is not None:
+        # is_interesting / is_downloaded are per user.
+        values["interesting"] = Exists(
+            InterestingPaper.objects.filter(user=user, paper=OuterRef("pk"))
+        )
+        values["downloaded"] = Exists(
+            DownloadedPaper.objects.filter(user=user, paper=OuterRef("pk"))
+        )
+    extra = (user.pk,) if user is not None else ()
+    return _load_version(Paper.objects.filter(id=paper_id), values, extra)
+
+
+def _venue_version(venues) -> Version | None:
+    # The venue payload only depends on the venue row and its stored papers_count.
+    return _load_version(
+        venues, {"updated": F("updated_at"), "count": F("papers_count")}
+    )
+
+
+def journal_version(request, journal_id) -> Version | None:
+    return _venue_version(Journal.objects.filter(id=journal_id))
+
+
+def conference_version(request, conference_id) -> Version | None:
+    return _venue_version(Conference.objects.filter(id=conference_id))
+
+
+def dataset_version(request, dataset_id) -> Version | None:
+    papers_updated, papers = _stamps(Paper.objects.filter(datasets=OuterRef("pk")))
+    similar_updated, similar = _stamps(
+        Dataset.objects.filter(related_by_dataset_relations__from_dataset=OuterRef("pk"))
+    )
+    tasks_updated, tasks = _stamps(Task.objects.filter(datasets=OuterRef("pk")))
+    return _load_version(
+        Dataset.objects.filter(id=dataset_id),
+        {
+            "updated": F("updated_at"),
+            "papers_updated": papers_updated,
+            "papers_ids": papers,
+            "similar_updated": similar_updated,
+            "similar_ids": similar,
+            "tasks_updated": tasks_updated,
+            "tasks_ids": tasks,
+        },
+    )
+
+
+def _patch_caching(request, response) -> None:
+    if _user(request) is None:
+        patch_cache_control(response, public=True, max_age=DETAIL_CACHE_MAX_AGE)
+    else:
+        patch_cache_control(response, private=True, max_age=0)
+    patch_cache_control(response, must_revalidate=True)
+    patch_vary_headers(response, DETAIL_CACHE_VARY)
+
+
+def conditional_detail(version_func):
+    """
+    View decorator (wrap with ``method_decorator`` on APIView ``get``) adding
+    ETag/Last-Modified from ``version_func`` and configurable Cache-Control/Vary.
+    The version is computed once per request and shared by both validators.
+    """
+
+    def version(request, *args, **kwargs):
+        if not hasattr(request, "_detail_version"):
+            request._detail_version = version_func(request, *args, **kwargs)
+        return request._detail_version
+
+    def etag(request, *args, **kwargs):
+        current = version(request, *args, **kwargs)
+        return current.etag if current else None
+
+    def last_modified(request, *args, **kwargs):
+        current = version(request, *args, **kwargs)
+        return current.last_modified if current else None
+
+    def decorator(view_func):
+        conditional_view = condition(etag_func=etag, last_modified_func=last_modified)(
+            view_func
+        )
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            _patch_caching(request, response)
+            return response
+
+        return wrapper
+
+    return decorator
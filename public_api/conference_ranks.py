@@ -2,10 +2,18 @@
 
 Ranked tiers (CORE): A*, A, B, C.
 Everything else is treated as unranked for list filters and display.
+``Conference.save()`` stores the normalized rank (a CHECK constraint rejects
+anything else), and the generated ``rank_order`` / ``quartile_order`` columns
+built by ``tier_order`` keep the venue lists index-ordered.
 """
-from django.db.models import Q
+from django.db.models import Case, Q, SmallIntegerField, Value, When
 
-RANKED_VALUES = frozenset({"A*", "A", "B", "C"})
+# Best first; list ordering follows this sequence.
+RANK_TIERS = ("A*", "A", "B", "C")
+QUARTILE_TIERS = ("Q1", "Q2", "Q3", "Q4")
+RANKED_VALUES = frozenset(RANK_TIERS)
+# Sort position of unranked conferences and journals without a quartile.
+UNRANKED_ORDER = 99
 
 # Legacy / import values normalized to unranked (empty string in DB).
 UNRANKED_ALIASES = frozenset(
@@ -49,10 +57,14 @@ def display_conference_rank(rank: str | None) -> str:
 
 
 def unranked_rank_q() -> Q:
-    """Django Q matching every unranked conference rank in the DB."""
-    q = Q(rank__isnull=True) | Q(rank="")
-    for alias in UNRANKED_ALIASES:
-        if alias:
-            q |= Q(rank__iexact=alias)
-    q |= Q(rank__iexact=DISPLAY_UNRANKED)
-    return q
+    """Django Q matching every unranked conference (ranks are stored normalized)."""
+    return Q(rank="")
+
+
+def tier_order(field: str, tiers) -> Case:
+    """``0..n-1`` for ``tiers`` in order, ``UNRANKED_ORDER`` for anything else."""
+    return Case(
+        *(When(**{field: tier}, then=Value(order)) for order, tier in enumerate(tiers)),
+        default=Value(UNRANKED_ORDER),
+        output_field=SmallIntegerField(),
+    )
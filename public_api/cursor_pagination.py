@@ -0,0 +1,148 @@
+"""
+Keyset (cursor) pagination for large list endpoints.
+
+Rows are ordered by ``(<field> DESC, id ASC)`` with PostgreSQL's default
+``NULLS FIRST`` for descending order, i.e. the same order the page/pageSize
+endpoints use. A cursor encodes the boundary row of the previous page, so every
+page is an index range scan from that row instead of ``OFFSET n`` plus a
+``COUNT(*)``: latency stays flat no matter how deep the client pages.
+
+Cursors are opaque to clients (url-safe base64 JSON).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F
+
+DEFAULT_CURSOR_FIELD = "publication_date"
+# Client-supplied ``pageSize`` for cursor pages is clamped to this.
+MAX_CURSOR_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded."""
+
+
+def encode_cursor(value, pk, *, reverse: bool = False) -> str:
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    payload = {"v": value, "id": str(pk), "r": int(reverse)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple:
+    """Return ``(value, pk, reverse)`` for a cursor produced by ``encode_cursor``."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        pk = uuid.UUID(str(payload["id"]))
+        value = payload.get("v")
+        reverse = bool(payload.get("r"))
+    except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as exc:
+        raise InvalidCursor("Malformed cursor.") from exc
+    if value is not None and not isinstance(value, str):
+        raise InvalidCursor("Malformed cursor.")
+    return value, pk, reverse
+
+
+def _field_is_nullable(queryset, field: str) -> bool:
+    try:
+        return queryset.model._meta.get_field(field).null
+    except FieldDoesNotExist:
+        # Annotations (e.g. a bookmark timestamp) are assumed NOT NULL.
+        return False
+
+
+def _segments(queryset, field: str, position, nullable: bool):
+    """
+    Yield ``(queryset, ordering)`` pieces in page order starting after ``position``.
+
+    NULL values form their own segment so each piece stays a plain range
+    predicate on the ``(<field>, id)`` index instead of an OR chain.
+    """
+    isnull = f"{field}__isnull"
+    if position is None:
+        if nullable:
+            yield queryset.filter(**{isnull: True}), ("pk",)
+        yield queryset.filter(**{isnull: False}), (F(field).desc(), "pk")
+        return
+
+    value, pk, reverse = position
+    if not reverse:
+        if value is None:
+            yield queryset.filter(**{isnull: True, "pk__gt": pk}), ("pk",)
+            yield queryset.filter(**{isnull: False}), (F(field).desc(), "pk")
+        else:
+            after = queryset.filter(**{f"{field}__lte": value}).exclude(
+                **{field: value, "pk__lte": pk}
+            )
+            yield after, (F(field).desc(), "pk")
+    else:
+        if value is None:
+            yield queryset.filter(**{isnull: True, "pk__lt": pk}), ("-pk",)
+        else:
+            before = queryset.filter(**{f"{field}__gte": value}).exclude(
+                **{field: value, "pk__gte": pk}
+            )
+            yield before, (F(field).asc(), "-pk")
+            if nullable:
+                yield queryset.filter(**{isnull: True}), ("-pk",)
+
+
+def paginate_by_cursor(
+    queryset,
+    cursor: str | None = None,
+    page_size: int = 20,
+    *,
+    field: str = DEFAULT_CURSOR_FIELD,
+) -> tuple[list, dict]:
+    """
+    Fetch one keyset page of ``queryset``.
+
+    Returns ``(rows, pagination)`` where ``pagination`` carries ``pageSize``,
+    ``nextCursor`` and ``prevCursor`` (``None`` at either end). No COUNT query
+    is issued.
+    """
+    position = decode_cursor(cursor) if cursor else None
+    reverse = bool(position and position[2])
+    nullable = _field_is_nullable(queryset, field)
+
+    rows: list = []
+    wanted = page_size + 1
+    try:
+        for segment, ordering in _segments(queryset, field, position, nullable):
+            rows.extend(segment.order_by(*ordering)[: wanted - len(rows)])
+            if len(rows) >= wanted:
+                break
+    except ValidationError as exc:
+        raise InvalidCursor("Malformed cursor.") from exc
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, position is not None
+
+    next_cursor = prev_cursor = None
+    if rows and has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, field), last.pk)
+    if rows and has_prev:
+        first = rows[0]
+        prev_cursor = encode_cursor(getattr(first, field), first.pk, reverse=True)
+
+    return rows, {
+        "pageSize": page_size,
+        "nextCursor": next_cursor,
+        "prevCursor": prev_cursor,
+    }
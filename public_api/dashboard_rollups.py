@@ -0,0 +1,141 @@
+"""
+Daily rollups behind /api/dashboard/.
+
+``paper_daily_rollup`` counts papers per creation day; ``task_daily_rollup`` and
+``dataset_daily_rollup`` count, per creation day, the papers linked to each
+task / dataset. Days are ``created_at`` dates in ``settings.TIME_ZONE``, so a
+dashboard window of whole days sums rows instead of scanning ``papers`` and the
+M2M tables.
+
+``public_api.signals`` keeps them current with ``INSERT ... ON CONFLICT``
+increments: paper create/delete and the ``tasks`` / ``datasets`` link changes
+(removals are counted in ``pre_remove`` / ``pre_clear`` while the link rows
+still exist, inside the same transaction). Rows may reach zero and are kept.
+``manage.py rebuild_dashboard_rollups`` rebuilds everything, or the days from
+``--since`` on.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Sum
+
+from .models import Dataset, DatasetDailyRollup, PaperDailyRollup, Task, TaskDailyRollup
+
+# ``target`` is the linked model's field on the rollup (``task`` / ``dataset``).
+Rollup = namedtuple("Rollup", "model target through id_type")
+
+TASKS = Rollup(TaskDailyRollup, "task", Task.papers.through, "bigint")
+DATASETS = Rollup(DatasetDailyRollup, "dataset", Dataset.papers.through, "uuid")
+
+_DAY = "(p.created_at AT TIME ZONE %s)::date"
+
+PAPERS_SQL = f"""
+INSERT INTO paper_daily_rollup (day, paper_count)
+SELECT {_DAY}, %s * COUNT(*) FROM papers AS p WHERE {{where}} GROUP BY 1
+ON CONFLICT (day) DO UPDATE
+SET paper_count = paper_daily_rollup.paper_count + EXCLUDED.paper_count
+"""
+
+LINKS_SQL = f"""
+INSERT INTO {{table}} (day, {{column}}, paper_count)
+SELECT {_DAY}, l.{{column}}, %s * COUNT(*)
+FROM {{through}} AS l JOIN papers AS p ON p.id = l.paper_id
+WHERE {{where}}
+GROUP BY 1, 2
+ON CONFLICT (day, {{column}}) DO UPDATE
+SET paper_count = {{table}}.paper_count + EXCLUDED.paper_count
+"""
+
+
+def _links_sql(rollup: Rollup, where: str) -> str:
+    return LINKS_SQL.format(
+        table=rollup.model._meta.db_table,
+        column=f"{rollup.target}_id",
+        through=rollup.through._meta.db_table,
+        where=where,
+    )
+
+
+def adjust_papers(paper_ids, sign: int) -> None:
+    """Count (``sign=1``) or uncount (``-1``) existing papers on their creation day."""
+    paper_ids = [str(paper_id) for paper_id in paper_ids]
+    if not paper_ids:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            PAPERS_SQL.format(where="p.id = ANY(%s::uuid[])"),
+            [settings.TIME_ZONE, sign, paper_ids],
+        )
+
+
+def adjust_links(rollup: Rollup, sign: int, *, paper_ids=None, target_ids=None) -> None:
+    """
+    Count or uncount the existing link rows between ``paper_ids`` and
+    ``target_ids`` (task or dataset ids); None on a side means any.
+    """
+    where, params = [], []
+    for column, ids, id_type in (
+        ("paper_id", paper_ids, "uuid"),
+        (f"{rollup.target}_id", target_ids, rollup.id_type),
+    ):
+        if ids is None:
+            continue
+        ids = [str(value) for value in ids]
+        if not ids:
+            return
+        where.append(f"l.{column} = ANY(%s::{id_type}[])")
+        params.append(ids)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _links_sql(rollup, " AND ".join(where) or "TRUE"),
+            [settings.TIME_ZONE, sign, *params],
+        )
+
+
+def rebuild_dashboard_rollups(since=None) -> dict[str, int]:
+    """
+    Recompute the rollups from ``papers`` and the link tables, for every day
+    or for days from ``since`` (a date) on. Returns rows written per table.
+    """
+    where, params = "TRUE", []
+    if since is not None:
+        where, params = f"{_DAY} >= %s", [settings.TIME_ZONE, since]
+    statements = [(PaperDailyRollup, PAPERS_SQL.format(where=where))]
+    statements += [(rollup.model, _links_sql(rollup, where)) for rollup in (TASKS, DATASETS)]
+    written = {}
+    with transaction.atomic(), connection.cursor() as cursor:
+        for model, sql in statements:
+            stale = model.objects.all() if since is None else model.objects.filter(day__gte=since)
+            stale.delete()
+            cursor.execute(sql, [settings.TIME_ZONE, 1, *params])
+            written[model._meta.db_table] = cursor.rowcount
+    return written
+
+
+def daily_paper_counts(start, end) -> dict:
+    """``{day: papers}`` for days in ``[start, end]`` that have any."""
+    return dict(
+        PaperDailyRollup.objects.filter(day__range=(start, end), paper_count__gt=0)
+        .order_by("day")
+        .values_list("day", "paper_count")
+    )
+
+
+def papers_per(rollup: Rollup, start, end) -> list[dict]:
+    """``[{"id", "name", "filtered_paper_count"}]`` over ``[start, end]``, most papers first."""
+    column, name = f"{rollup.target}_id", f"{rollup.target}__name"
+    rows = (
+        rollup.model.objects.filter(day__range=(start, end))
+        .values(column, name)
+        .annotate(total=Sum("paper_count"))
+        .filter(total__gt=0)
+        .order_by("-total", name)
+    )
+    return [
+        {"id": row[column], "name": row[name], "filtered_paper_count": row["total"]}
+        for row in rows
+    ]
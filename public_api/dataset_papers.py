@@ -0,0 +1,45 @@
+"""
+Papers linked to a dataset, in keyset pages (newest first by ``created_at``).
+
+``DatasetDetail`` embeds the first page as ``relatedPapers``; deeper pages come
+from ``/api/datasets/<id>/papers/?cursor=...``. Venues are joined and author
+names prefetched, so a page is two queries however many papers the dataset
+links.
+"""
+
+from django.db.models import Prefetch
+
+from .cursor_pagination import paginate_by_cursor
+from .models import Author
+
+DATASET_PAPERS_PAGE_SIZE = 20
+# ``?pageSize=`` on the dataset papers endpoint is clamped to this.
+DATASET_PAPERS_MAX_PAGE_SIZE = 100
+DATASET_PAPERS_CURSOR_FIELD = "created_at"
+
+
+def related_paper_payload(paper) -> dict:
+    return {
+        "id": str(paper.id),
+        "title": paper.title,
+        "authors": [author.name for author in paper.authors.all()],
+        "abstract": paper.abstract,
+        "conference": paper.venue_name,
+        "year": paper.publication_date.year if paper.publication_date else None,
+        "field": None,
+        "venue_type": paper.venue_type,
+        "keywords": paper.keywords,
+        "downloadUrl": paper.pdf_url if paper.pdf_url else None,
+        "doi": paper.doi if paper.doi else None,
+    }
+
+
+def dataset_papers_page(dataset, cursor=None, page_size=DATASET_PAPERS_PAGE_SIZE):
+    """``(payloads, pagination)`` for one page; raises ``InvalidCursor``."""
+    papers = dataset.papers.select_related("journal", "conference").prefetch_related(
+        Prefetch("authors", queryset=Author.objects.only("id", "name"))
+    )
+    rows, pagination = paginate_by_cursor(
+        papers, cursor, page_size, field=DATASET_PAPERS_CURSOR_FIELD
+    )
+    return [related_paper_payload(paper) for paper in rows], pagination
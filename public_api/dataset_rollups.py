@@ -0,0 +1,73 @@
+"""
+Denormalized ``Dataset.paper_count`` and ``Dataset.task_names``.
+
+Both are recomputed from the ``papers`` / ``tasks`` M2Ms with one grouped
+``UPDATE`` (optionally limited to some datasets), so list and detail payloads
+read columns instead of running a COUNT and a task query per dataset.
+``public_api.signals`` calls ``refresh_dataset_rollups_on_commit`` whenever
+the links, a task name, or a linked paper change; ``manage.py
+refresh_dataset_rollups`` repairs everything. The UPDATE skips rows that are
+already current and does not touch ``updated_at``.
+
+The signal-driven recount runs after the writer commits. Related-manager
+``add()`` / ``remove()`` run in their own transaction, so a recount inside it
+would miss a concurrent writer's links and then keep that stale value.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+from django.db import connection, transaction
+
+from .response_cache import bust_tags
+
+ROLLUP_SQL = """
+UPDATE public_api_dataset AS d
+SET paper_count = COALESCE(p.total, 0),
+    task_names = COALESCE(t.names, '{{}}')
+FROM public_api_dataset AS src
+LEFT JOIN (
+    SELECT dataset_id, COUNT(*) AS total
+    FROM public_api_dataset_papers {papers_where} GROUP BY dataset_id
+) AS p ON p.dataset_id = src.id
+LEFT JOIN (
+    SELECT td.dataset_id, array_agg(t.name ORDER BY t.name) AS names
+    FROM tasks_datasets AS td JOIN tasks AS t ON t.id = td.task_id
+    {tasks_where} GROUP BY td.dataset_id
+) AS t ON t.dataset_id = src.id
+WHERE d.id = src.id {datasets_where}
+  AND (d.paper_count IS DISTINCT FROM COALESCE(p.total, 0)
+       OR d.task_names IS DISTINCT FROM COALESCE(t.names, '{{}}'))
+"""
+
+
+def refresh_dataset_rollups(dataset_ids=None) -> int:
+    """Recompute rollups for ``dataset_ids`` (all datasets when None); returns rows changed."""
+    params = []
+    where = {"papers_where": "", "tasks_where": "", "datasets_where": ""}
+    if dataset_ids is not None:
+        dataset_ids = [str(dataset_id) for dataset_id in dataset_ids]
+        if not dataset_ids:
+            return 0
+        where = {
+            "papers_where": "WHERE dataset_id = ANY(%s::uuid[])",
+            "tasks_where": "WHERE td.dataset_id = ANY(%s::uuid[])",
+            "datasets_where": "AND d.id = ANY(%s::uuid[])",
+        }
+        params = [dataset_ids] * 3
+    with connection.cursor() as cursor:
+        cursor.execute(ROLLUP_SQL.format(**where), params)
+        return cursor.rowcount
+
+
+def _refresh_and_bust(dataset_ids) -> None:
+    if refresh_dataset_rollups(dataset_ids):
+        bust_tags("datasets", *(f"dataset:{dataset_id}" for dataset_id in dataset_ids))
+
+
+def refresh_dataset_rollups_on_commit(dataset_ids) -> None:
+    """Refresh these datasets' rollups once the current transaction commits; bust them if changed."""
+    dataset_ids = [str(dataset_id) for dataset_id in dataset_ids or ()]
+    if dataset_ids:
+        transaction.on_commit(partial(_refresh_and_bust, dataset_ids))
@@ -0,0 +1,126 @@
+"""
+Similar-dataset scoring for ``manage.py generate_similar_datasets``.
+
+Dataset/paper and dataset/task links are read once each (streamed from the
+M2M through tables) into sparse CSR incidence matrices. Pairwise scores are
+computed block by block as sparse products:
+
+    score = paper_weight * sim(papers) + task_weight * jaccard(tasks)
+            + category_weight * [same data_type]
+
+where ``sim`` is Jaccard or cosine over shared papers. The top ``k`` per
+dataset are picked with ``argpartition``. Memory is bounded by
+``block_size x n_datasets`` dense scores at a time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+
+from .models import Dataset, Task
+
+METRIC_JACCARD = "jaccard"
+METRIC_COSINE = "cosine"
+STREAM_CHUNK_SIZE = 50_000
+
+
+@dataclass(frozen=True)
+class SimilarityWeights:
+    papers: float = 0.6
+    tasks: float = 0.3
+    category: float = 0.1
+
+
+def _incidence(pairs, row_index: dict) -> sparse.csr_matrix:
+    """Binary CSR matrix (datasets x columns) from streamed ``(dataset_id, column_id)`` pairs."""
+    column_index: dict = {}
+    rows, cols = [], []
+    for dataset_id, column_id in pairs:
+        row = row_index.get(dataset_id)
+        if row is None:
+            continue
+        rows.append(row)
+        cols.append(column_index.setdefault(column_id, len(column_index)))
+    data = np.ones(len(rows), dtype=np.float32)
+    matrix = sparse.csr_matrix(
+        (data, (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64))),
+        shape=(len(row_index), max(len(column_index), 1)),
+    )
+    matrix.data[:] = 1.0  # duplicate links collapse to one
+    return matrix
+
+
+def load_incidence(dataset_ids):
+    """``(papers, tasks)`` CSR matrices with rows in ``dataset_ids`` order."""
+    row_index = {dataset_id: row for row, dataset_id in enumerate(dataset_ids)}
+    paper_links = (
+        Dataset.papers.through.objects.order_by()
+        .values_list("dataset_id", "paper_id")
+        .iterator(chunk_size=STREAM_CHUNK_SIZE)
+    )
+    task_links = (
+        Task.datasets.through.objects.order_by()
+        .values_list("dataset_id", "task_id")
+        .iterator(chunk_size=STREAM_CHUNK_SIZE)
+    )
+    return _incidence(paper_links, row_index), _incidence(task_links, row_index)
+
+
+def _overlap(matrix, block, sizes, metric: str) -> np.ndarray:
+    """Dense ``len(block) x n`` similarity of ``block`` rows against every row."""
+    shared = (matrix[block] @ matrix.T).toarray()
+    left = sizes[block][:, None]
+    if metric == METRIC_COSINE:
+        denom = np.sqrt(left * sizes[None, :])
+    else:
+        denom = left + sizes[None, :] - shared
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denom > 0, shared / denom, 0.0)
+
+
+def top_similar(
+    papers,
+    tasks,
+    categories,
+    *,
+    k: int = 5,
+    metric: str = METRIC_JACCARD,
+    weights: SimilarityWeights = SimilarityWeights(),
+    min_score: float = 0.0,
+    block_size: int = 1000,
+):
+    """
+    Yield ``(row, [(other_row, score), ...])`` per dataset row, best first.
+
+    ``categories`` is a sequence of data_type labels (empty = unknown, never
+    matched). Only pairs scoring above ``min_score`` are returned.
+    """
+    count = papers.shape[0]
+    if count < 2:
+        return
+    k = min(k, count - 1)
+    paper_sizes = np.asarray(papers.sum(axis=1), dtype=np.float64).ravel()
+    task_sizes = np.asarray(tasks.sum(axis=1), dtype=np.float64).ravel()
+    labels = {label: code for code, label in enumerate(sorted(set(categories) - {""}), start=1)}
+    codes = np.array([labels.get(label, 0) for label in categories], dtype=np.int64)
+
+    for start in range(0, count, block_size):
+        block = np.arange(start, min(start + block_size, count))
+        scores = weights.papers * _overlap(papers, block, paper_sizes, metric)
+        scores += weights.tasks * _overlap(tasks, block, task_sizes, METRIC_JACCARD)
+        same = (codes[block][:, None] == codes[None, :]) & (codes[block][:, None] > 0)
+        scores += weights.category * same
+        scores[np.arange(len(block)), block] = -np.inf  # never similar to itself
+
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for offset, row in enumerate(block):
+            picked = best[offset]
+            picked = picked[np.argsort(-scores[offset, picked], kind="stable")]
+            yield int(row), [
+                (int(other), float(scores[offset, other]))
+                for other in picked
+                if scores[offset, other] > min_score
+            ]
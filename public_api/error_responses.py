@@ -8,6 +8,7 @@ from django.utils import timezone
 from rest_framework.response import Response
 
 _DEFAULT_ERROR_NAMES = {
+    400: "Bad Request",
     401: "Unauthorized",
     403: "Forbidden",
     404: "Not Found",
@@ -1,7 +1,19 @@
+"""
+Library size limits (interesting papers / datasets per user).
+
+Sizes live in ``UserLibraryCounter``. Adding an item reserves a slot with one
+conditional ``UPDATE ... SET n = n + 1 WHERE n < limit``; the row lock it takes
+serializes concurrent clicks, so the limit holds without counting rows.
+Removals (including cascades) and inserts made outside ``add_to_library`` are
+counted by ``public_api.signals``.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
 from rest_framework import status
 
 from .error_responses import standard_error_response
-from .models import InterestingDataset, InterestingPaper
+from .models import InterestingDataset, InterestingPaper, UserLibraryCounter
 
 MAX_INTERESTING_PAPERS = 50
 MAX_INTERESTING_DATASETS = 10
@@ -35,20 +47,90 @@ def dataset_interesting_limit_response(request):
     )
 
 
-def can_add_interesting_paper(user, paper=None) -> bool:
-    if paper is not None and InterestingPaper.objects.filter(
-        user=user, paper=paper
-    ).exists():
-        return True
-    return InterestingPaper.objects.filter(user=user).count() < MAX_INTERESTING_PAPERS
+# Library model -> (UserLibraryCounter field, limit).
+LIBRARY_COUNTERS = {
+    InterestingPaper: ("interesting_papers", MAX_INTERESTING_PAPERS),
+    InterestingDataset: ("interesting_datasets", MAX_INTERESTING_DATASETS),
+}
+
+
+def library_counts(user_ids) -> dict:
+    """Actual library sizes as ``{user_id: {counter field: count}}``."""
+    counts = {}
+    for model, (field, _limit) in LIBRARY_COUNTERS.items():
+        rows = (
+            model.objects.filter(user_id__in=user_ids)
+            .order_by()
+            .values_list("user_id")
+            .annotate(total=Count("id"))
+        )
+        for user_id, total in rows:
+            counts.setdefault(user_id, {})[field] = total
+    return counts
 
 
-def can_add_interesting_dataset(user, dataset=None) -> bool:
-    if dataset is not None and InterestingDataset.objects.filter(
-        user=user, dataset=dataset
-    ).exists():
-        return True
-    return (
-        InterestingDataset.objects.filter(user=user).count()
-        < MAX_INTERESTING_DATASETS
+def _create_counter(user_id) -> None:
+    counts = library_counts([user_id]).get(user_id, {})
+    UserLibraryCounter.objects.bulk_create(
+        [UserLibraryCounter(user_id=user_id, **counts)], ignore_conflicts=True
     )
+
+
+def reserve_library_slot(model, user) -> bool:
+    """Count one more ``model`` item for ``user`` unless that would exceed the limit."""
+    field, limit = LIBRARY_COUNTERS[model]
+    counters = UserLibraryCounter.objects.filter(user_id=user.pk)
+    for _attempt in range(2):
+        if counters.filter(**{f"{field}__lt": limit}).update(**{field: F(field) + 1}):
+            return True
+        if counters.exists():
+            return False
+        _create_counter(user.pk)
+    return False
+
+
+def adjust_library_counter(model, user_id, delta: int) -> None:
+    field, _limit = LIBRARY_COUNTERS[model]
+    counters = UserLibraryCounter.objects.filter(user_id=user_id)
+    if delta < 0:
+        counters = counters.filter(**{f"{field}__gt": 0})
+    # A missing row is created from real counts on the next reservation.
+    counters.update(**{field: F(field) + delta})
+
+
+def create_reserved_item(model, user, **target):
+    """Insert a library item whose slot ``reserve_library_slot`` already counted."""
+    item = model(user=user, **target)
+    item._library_counted = True
+    item.save()
+    return item
+
+
+def add_to_library(model, user, **target) -> tuple[bool, bool]:
+    """
+    Insert ``model(user=user, **target)`` within the user's limit.
+
+    Returns ``(allowed, created)``; an item already in the library is allowed
+    and not created again.
+    """
+    if model.objects.filter(user=user, **target).exists():
+        return True, False
+    try:
+        with transaction.atomic():
+            if not reserve_library_slot(model, user):
+                return False, False
+            create_reserved_item(model, user, **target)
+    except IntegrityError:
+        # A concurrent request added it first; our reservation rolled back.
+        return True, False
+    return True, True
+
+
+def can_add_interesting_paper(user) -> bool:
+    """Cheap pre-check from the counter; ``add_to_library`` enforces the limit."""
+    counter = UserLibraryCounter.objects.filter(user_id=user.pk).first()
+    if counter is None:
+        return (
+            InterestingPaper.objects.filter(user=user).count() < MAX_INTERESTING_PAPERS
+        )
+    return counter.interesting_papers < MAX_INTERESTING_PAPERS
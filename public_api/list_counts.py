@@ -0,0 +1,113 @@
+"""
+Count strategies for paginated list endpoints.
+
+``COUNT(*)`` over ``papers`` with task or venue joins often costs more than
+fetching the page itself, so list views resolve ``totalItems`` through
+``list_count``:
+
+* unfiltered querysets on large tables use the planner estimate
+  (``pg_class.reltuples``) and are flagged ``totalItemsExact: false``;
+* everything else runs one exact COUNT per filter signature and caches it for
+  ``LIST_COUNT_CACHE_TTL`` seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+
+LIST_COUNT_CACHE_TTL = getattr(settings, "LIST_COUNT_CACHE_TTL", 60)
+# Below this many rows an exact COUNT is cheap and beats a stale estimate.
+LIST_COUNT_ESTIMATE_MIN_ROWS = getattr(settings, "LIST_COUNT_ESTIMATE_MIN_ROWS", 10000)
+
+
+class CountedPaginator(Paginator):
+    """Paginator that trusts a precomputed total instead of running COUNT(*)."""
+
+    def __init__(self, object_list, per_page, count: int, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._known_count = count
+
+    @cached_property
+    def count(self):
+        return self._known_count
+
+    def validate_number(self, number):
+        # The total may be an estimate or a few seconds stale, so only reject
+        # non-positive pages; an out-of-range page simply comes back empty.
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
+
+
+def filter_signature(queryset) -> str:
+    """Stable digest of the queryset's WHERE/JOIN shape (ordering ignored)."""
+    sql = str(queryset.order_by().query)
+    return hashlib.sha1(sql.encode("utf-8")).hexdigest()
+
+
+def estimated_table_rows(model) -> int | None:
+    """Planner row estimate for ``model``'s table, or None if unavailable."""
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        # -1 means the table was never vacuumed/analyzed.
+        return None
+    return int(row[0])
+
+
+def list_count(queryset, *, scope: str) -> tuple[int, bool]:
+    """Return ``(total, is_exact)`` for a list endpoint queryset."""
+    if not queryset.query.where:
+        estimate = estimated_table_rows(queryset.model)
+        if estimate is not None and estimate >= LIST_COUNT_ESTIMATE_MIN_ROWS:
+            return estimate, False
+
+    try:
+        signature = filter_signature(queryset)
+    except EmptyResultSet:
+        # e.g. queryset.none() or an ``__in`` filter over an empty list.
+        return 0, True
+    key = f"list_count:{scope}:{signature}"
+    total = cache.get(key)
+    if total is None:
+        total = queryset.count()
+        cache.set(key, total, LIST_COUNT_CACHE_TTL)
+    return total, True
+
+
+def counted_paginator(
+    queryset, page_size: int, *, scope: str, object_list=None
+) -> tuple[Paginator, bool]:
+    """
+    Build a paginator whose total comes from ``list_count``.
+
+    ``object_list`` pages a different view of the same rows (e.g. with extra
+    joins for rendering) while the count still runs on ``queryset``.
+    """
+    total, exact = list_count(queryset, scope=scope)
+    rows = queryset if object_list is None else object_list
+    return CountedPaginator(rows, page_size, total), exact
@@ -0,0 +1,43 @@
+"""Fill paper_keyword for papers written before the keyword-index triggers existed.
+
+Usage:
+    python manage.py backfill_paper_keywords
+    python manage.py backfill_paper_keywords --batch-size 5000
+"""
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+BATCH_IDS_SQL = "SELECT id FROM papers WHERE id > %s ORDER BY id LIMIT %s"
+
+REBUILD_SQL = """
+DELETE FROM paper_keyword WHERE paper_id = ANY(%(ids)s::uuid[]);
+INSERT INTO paper_keyword (paper_id, keyword, created_at)
+SELECT p.id, keyword, p.created_at
+FROM papers AS p, unnest(paper_keywords_normalized(p.keywords)) AS keyword
+WHERE p.id = ANY(%(ids)s::uuid[]);
+"""
+
+
+class Command(BaseCommand):
+    help = "Rebuild paper_keyword in id-ordered batches (uses the paper_keywords_normalized SQL function)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **opts):
+        batch_size = opts["batch_size"]
+        last_id = "00000000-0000-0000-0000-000000000000"
+        total = 0
+        while True:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(BATCH_IDS_SQL, [last_id, batch_size])
+                ids = [str(row[0]) for row in cursor.fetchall()]
+                if ids:
+                    cursor.execute(REBUILD_SQL, {"ids": ids})
+            if not ids:
+                break
+            total += len(ids)
+            last_id = ids[-1]
+            self.stdout.write(f"  indexed {total} papers...")
+
+        self.stdout.write(self.style.SUCCESS(f"Done. Keywords indexed for {total} papers."))
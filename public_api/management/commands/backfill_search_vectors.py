@@ -0,0 +1,54 @@
+"""Fill papers.search_vector for rows written before the full-text triggers existed.
+
+Usage:
+    python manage.py backfill_search_vectors                  # only rows with NULL vectors
+    python manage.py backfill_search_vectors --batch-size 5000
+    python manage.py backfill_search_vectors --redo-all       # recompute every row
+"""
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+BATCH_SQL = """
+WITH batch AS (
+    SELECT id FROM papers
+    WHERE id > %s {only_missing}
+    ORDER BY id
+    LIMIT %s
+)
+UPDATE papers AS p
+SET search_vector = papers_search_vector(p.title, p.abstract, p.keywords)
+FROM batch
+WHERE p.id = batch.id
+RETURNING p.id
+"""
+
+
+class Command(BaseCommand):
+    help = "Compute papers.search_vector in id-ordered batches (uses the papers_search_vector SQL function)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--redo-all",
+            action="store_true",
+            help="Recompute vectors for every paper, not only NULL ones.",
+        )
+
+    def handle(self, *args, **opts):
+        only_missing = "" if opts["redo_all"] else "AND search_vector IS NULL"
+        sql = BATCH_SQL.format(only_missing=only_missing)
+        batch_size = opts["batch_size"]
+
+        last_id = "00000000-0000-0000-0000-000000000000"
+        total = 0
+        while True:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(sql, [last_id, batch_size])
+                ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                break
+            total += len(ids)
+            last_id = str(max(ids))
+            self.stdout.write(f"  updated {total} papers...")
+
+        self.stdout.write(self.style.SUCCESS(f"Done. {total} search vectors written."))
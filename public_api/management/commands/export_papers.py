@@ -0,0 +1,91 @@
+"""Export papers matching the /api/papers/ filters as NDJSON or CSV.
+
+Usage:
+    python manage.py export_papers --output papers.ndjson
+    python manage.py export_papers --format csv --output papers.csv.gz   # gzip by suffix
+    python manage.py export_papers --query "year=2024&venueType=journal" --gzip > out.gz
+    python manage.py export_papers --query "search=graph neural" --fields id,title,year
+"""
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.http import QueryDict
+from django.utils.text import compress_sequence
+
+from public_api.models import Paper
+from public_api.paper_cards import CARD_FIELDS
+from public_api.paper_export import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_CONTENT_TYPES,
+    EXPORT_NDJSON,
+    export_chunks,
+    export_ordering,
+)
+from public_api.paper_filters import filter_papers, search_text
+
+
+class Command(BaseCommand):
+    help = "Stream filtered papers (paper_card rows) to a file or stdout as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=sorted(EXPORT_CONTENT_TYPES),
+            default=EXPORT_NDJSON,
+        )
+        parser.add_argument(
+            "--query",
+            default="",
+            help='PapersList filters as a query string, e.g. "year=2024&taskIds=3,7".',
+        )
+        parser.add_argument(
+            "--fields",
+            default="",
+            help="Comma-separated card keys to keep (default: all).",
+        )
+        parser.add_argument("--output", default="-", help="Output path, or - for stdout.")
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Gzip the output (implied by an --output ending in .gz).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+        parser.add_argument("--limit", type=int, default=0)
+
+    def handle(self, *args, **opts):
+        params = QueryDict(opts["query"])
+        fields = None
+        if opts["fields"]:
+            wanted = {name.strip() for name in opts["fields"].split(",")} | {"id"}
+            fields = [name for name in CARD_FIELDS if name in wanted]
+
+        queryset = filter_papers(Paper.objects.all(), params, highlight=False)
+        chunks = (
+            chunk.encode("utf-8")
+            for chunk in export_chunks(
+                export_ordering(queryset, search_text(params)),
+                opts["format"],
+                fields=fields,
+                chunk_size=opts["chunk_size"],
+                limit=opts["limit"] or None,
+            )
+        )
+        output = opts["output"]
+        if opts["gzip"] or output.endswith(".gz"):
+            chunks = compress_sequence(chunks)
+
+        try:
+            stream = sys.stdout.buffer if output == "-" else open(output, "wb")
+        except OSError as exc:
+            raise CommandError(f"Cannot open {output}: {exc}")
+        written = 0
+        try:
+            for chunk in chunks:
+                stream.write(chunk)
+                written += len(chunk)
+        finally:
+            if stream is not sys.stdout.buffer:
+                stream.close()
+
+        if output != "-":
+            self.stdout.write(self.style.SUCCESS(f"Done. {written} bytes written to {output}."))
@@ -1,86 +1,113 @@
+"""Rebuild the similar-dataset relations served on the dataset detail page.
+
+Scores every dataset pair from shared papers (Jaccard or cosine), shared tasks
+and a matching category (see ``public_api.dataset_similarity``) and keeps the
+top ``k`` per dataset. The relation table is replaced in one transaction.
+
+Usage:
+    python manage.py generate_similar_datasets
+    python manage.py generate_similar_datasets --top-k 8 --metric cosine
+    python manage.py generate_similar_datasets --paper-weight 0.5 --task-weight 0.4 --category-weight 0.1
+    python manage.py generate_similar_datasets --dry-run
+"""
+import time
+
 from django.core.management.base import BaseCommand
-import random
-from collections import defaultdict
+from django.db import transaction
+
+from public_api.dataset_similarity import (
+    METRIC_COSINE,
+    METRIC_JACCARD,
+    SimilarityWeights,
+    load_incidence,
+    top_similar,
+)
+from public_api.models import Dataset, DatasetSimilarDataset
+from public_api.response_cache import bust_tags
 
-from public_api.models import Dataset, Paper
 
 class Command(BaseCommand):
-    help = 'Generate similar dataset relationships based on common categories and papers'
+    help = "Generate similar dataset relationships from shared papers, tasks and categories."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top-k", type=int, default=5)
+        parser.add_argument(
+            "--metric", choices=[METRIC_JACCARD, METRIC_COSINE], default=METRIC_JACCARD
+        )
+        parser.add_argument("--paper-weight", type=float, default=SimilarityWeights.papers)
+        parser.add_argument("--task-weight", type=float, default=SimilarityWeights.tasks)
+        parser.add_argument(
+            "--category-weight", type=float, default=SimilarityWeights.category
+        )
+        parser.add_argument(
+            "--min-score",
+            type=float,
+            default=0.0,
+            help="Only keep pairs scoring above this (default: any overlap).",
+        )
+        parser.add_argument("--block-size", type=int, default=1000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Compute and report, but keep the existing relations.",
+        )
+
+    def _step(self, message, started):
+        self.stdout.write(f"  {message} ({time.monotonic() - started:.1f}s)")
 
-    def handle(self, *args, **options):
-        self.stdout.write("Starting similar datasets generation...")
-        
-        # Get all datasets
-        datasets = Dataset.objects.all()
-        total_datasets = datasets.count()
-        
-        if total_datasets == 0:
+    def handle(self, *args, **opts):
+        started = time.monotonic()
+        datasets = list(Dataset.objects.order_by("id").values_list("id", "data_type"))
+        if not datasets:
             self.stdout.write(self.style.ERROR("No datasets found in the database."))
             return
-        
-        self.stdout.write(f"Found {total_datasets} datasets.")
-        
-        # Clear existing similar_datasets relationships
-        self.stdout.write("Clearing existing similar dataset relationships...")
-        for dataset in datasets:
-            dataset.similar_datasets.clear()
-        
-        # Group datasets by data_type/category
-        self.stdout.write("Grouping datasets by category...")
-        datasets_by_category = defaultdict(list)
-        for dataset in datasets:
-            category = dataset.data_type or "unknown"
-            datasets_by_category[category].append(dataset)
-        
-        # Find datasets used by the same papers
-        self.stdout.write("Finding datasets used by the same papers...")
-        paper_datasets = defaultdict(set)
-        for paper in Paper.objects.all():
-            paper_datasets[paper.id] = set(paper.datasets.all().values_list('id', flat=True))
-        
-        # Datasets with common papers
-        datasets_with_common_papers = defaultdict(set)
-        for paper_id, dataset_ids in paper_datasets.items():
-            for dataset_id in dataset_ids:
-                for other_dataset_id in dataset_ids:
-                    if dataset_id != other_dataset_id:
-                        datasets_with_common_papers[dataset_id].add(other_dataset_id)
-        
-        # Set similar datasets based on category
-        self.stdout.write("Setting similar datasets based on category...")
-        for category, category_datasets in datasets_by_category.items():
-            if len(category_datasets) > 1:
-                for dataset in category_datasets:
-                    # Get other datasets in the same category
-                    similar_in_category = [d for d in category_datasets if d.id != dataset.id]
-                    
-                    # Add up to 5 similar datasets from the same category
-                    for similar in random.sample(similar_in_category, min(5, len(similar_in_category))):
-                        dataset.similar_datasets.add(similar)
-        
-        # Add similar datasets based on common papers
-        self.stdout.write("Adding similar datasets based on common papers...")
-        for dataset in datasets:
-            common_paper_datasets = datasets_with_common_papers.get(dataset.id, set())
-            if common_paper_datasets:
-                # Get the actual dataset objects
-                similar_datasets = Dataset.objects.filter(id__in=common_paper_datasets)
-                
-                # Add up to 3 similar datasets based on common papers
-                for similar in similar_datasets[:3]:
-                    dataset.similar_datasets.add(similar)
-        
-        # Ensure each dataset has at least some similar datasets
-        self.stdout.write("Ensuring each dataset has similar datasets...")
-        for dataset in datasets:
-            if dataset.similar_datasets.count() == 0:
-                # Find random datasets to add as similar
-                potential_similar = Dataset.objects.exclude(id=dataset.id).order_by('?')[:3]
-                for similar in potential_similar:
-                    dataset.similar_datasets.add(similar)
-        
-        # Count total relationships created
-        total_relationships = sum(dataset.similar_datasets.count() for dataset in datasets)
+        dataset_ids = [dataset_id for dataset_id, _category in datasets]
+        categories = [(category or "").strip().lower() for _id, category in datasets]
+        self._step(f"loaded {len(dataset_ids)} datasets", started)
+
+        papers, tasks = load_incidence(dataset_ids)
+        self._step(
+            f"loaded {papers.nnz} paper links and {tasks.nnz} task links", started
+        )
+
+        weights = SimilarityWeights(
+            papers=opts["paper_weight"],
+            tasks=opts["task_weight"],
+            category=opts["category_weight"],
+        )
+        relations = []
+        for row, similar in top_similar(
+            papers,
+            tasks,
+            categories,
+            k=opts["top_k"],
+            metric=opts["metric"],
+            weights=weights,
+            min_score=opts["min_score"],
+            block_size=opts["block_size"],
+        ):
+            relations.extend(
+                DatasetSimilarDataset(
+                    from_dataset_id=dataset_ids[row], to_dataset_id=dataset_ids[other]
+                )
+                for other, _score in similar
+            )
+            if (row + 1) % opts["block_size"] == 0:
+                self._step(f"scored {row + 1}/{len(dataset_ids)} datasets", started)
+        self._step(f"scored {len(dataset_ids)} datasets, {len(relations)} relations", started)
+
+        if opts["dry_run"]:
+            self.stdout.write(self.style.WARNING("Dry run: relations not written."))
+            return
+
+        with transaction.atomic():
+            DatasetSimilarDataset.objects.all().delete()
+            DatasetSimilarDataset.objects.bulk_create(relations, batch_size=opts["batch_size"])
+        bust_tags("datasets", *(f"dataset:{dataset_id}" for dataset_id in dataset_ids))
         self.stdout.write(
-            self.style.SUCCESS(f"Process complete! Created {total_relationships} similar dataset relationships.")
-        ) 
\ No newline at end of file
+            self.style.SUCCESS(
+                f"Done. {len(relations)} similar dataset relations written "
+                f"in {time.monotonic() - started:.1f}s."
+            )
+        )
@@ -19,8 +19,10 @@ from django.db.models import Count
 from django.utils import timezone
 
 from public_api.models import Conference, Journal, Paper, PaperVenueMapping
+from public_api.paper_cards import refresh_paper_cards
 from public_api.services.venue_apply import materialize_no_match_db_mappings
 from public_api.services.venue_mapping import map_paper_record, venue_kind_from_classification
+from public_api.venue_counts import sync_paper_venue_counts
 
 MAPPING_UPDATE_FIELDS = [
     "lookup_key",
@@ -550,6 +552,8 @@ class Command(BaseCommand):
                     buffer,
                     ["journal_id", "conference_id", "doi", "updated_at"],
                 )
+                refresh_paper_cards([paper.pk for paper in buffer])
+                sync_paper_venue_counts(buffer)
                 updated += len(buffer)
                 buffer.clear()
 
@@ -558,6 +562,8 @@ class Command(BaseCommand):
                 buffer,
                 ["journal_id", "conference_id", "doi", "updated_at"],
             )
+            refresh_paper_cards([paper.pk for paper in buffer])
+            sync_paper_venue_counts(buffer)
             updated += len(buffer)
 
         self.stdout.write(
@@ -0,0 +1,29 @@
+"""Rebuild the daily paper / task / dataset rollups behind /api/dashboard/.
+
+Usage:
+    python manage.py rebuild_dashboard_rollups
+    python manage.py rebuild_dashboard_rollups --since 2026-01-01
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from public_api.dashboard_rollups import rebuild_dashboard_rollups
+
+
+class Command(BaseCommand):
+    help = "Backfill or repair the dashboard daily rollups from papers and their task/dataset links."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            default=None,
+            help="Only rebuild days on or after this date (YYYY-MM-DD).",
+        )
+
+    def handle(self, *args, **opts):
+        written = rebuild_dashboard_rollups(since=opts["since"])
+        for table, rows in written.items():
+            self.stdout.write(f"  {table}: {rows} rows")
+        self.stdout.write(self.style.SUCCESS("Done. Dashboard rollups rebuilt."))
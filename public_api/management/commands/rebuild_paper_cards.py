@@ -0,0 +1,42 @@
+"""Rebuild the paper_card read model used by the paper list endpoints.
+
+Usage:
+    python manage.py rebuild_paper_cards                   # every paper
+    python manage.py rebuild_paper_cards --missing-only    # papers without a card
+    python manage.py rebuild_paper_cards --batch-size 1000
+"""
+from django.core.management.base import BaseCommand
+
+from public_api.models import Paper
+from public_api.paper_cards import refresh_paper_cards
+
+
+class Command(BaseCommand):
+    help = "Re-render paper_card payloads in id-ordered batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only render cards for papers that have none yet.",
+        )
+
+    def handle(self, *args, **opts):
+        papers = Paper.objects.order_by("id")
+        if opts["missing_only"]:
+            papers = papers.filter(card__isnull=True)
+        batch_size = opts["batch_size"]
+
+        last_id = None
+        total = 0
+        while True:
+            batch = papers if last_id is None else papers.filter(id__gt=last_id)
+            ids = list(batch.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            total += len(refresh_paper_cards(ids))
+            last_id = ids[-1]
+            self.stdout.write(f"  rendered {total} cards...")
+
+        self.stdout.write(self.style.SUCCESS(f"Done. {total} paper cards written."))
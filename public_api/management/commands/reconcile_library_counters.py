@@ -0,0 +1,74 @@
+"""Recompute user_library_counter rows from the library tables.
+
+Run it off-peak: an item added while a batch is being rewritten can be
+counted from the stale snapshot (a rerun corrects it).
+
+Usage:
+    python manage.py reconcile_library_counters              # fix drifted counters
+    python manage.py reconcile_library_counters --dry-run    # only report drift
+    python manage.py reconcile_library_counters --batch-size 5000
+"""
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from public_api.library_limits import LIBRARY_COUNTERS, library_counts
+from public_api.models import UserLibraryCounter
+
+COUNTER_FIELDS = [field for field, _limit in LIBRARY_COUNTERS.values()]
+
+
+class Command(BaseCommand):
+    help = "Rewrite per-user library counters that differ from the actual item counts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted counters without writing them.",
+        )
+
+    def handle(self, *args, **opts):
+        users = User.objects.order_by("id")
+        batch_size = opts["batch_size"]
+
+        last_id = None
+        checked = fixed = 0
+        while True:
+            batch = users if last_id is None else users.filter(id__gt=last_id)
+            user_ids = list(batch.values_list("id", flat=True)[:batch_size])
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+            checked += len(user_ids)
+
+            actual = library_counts(user_ids)
+            stored = {
+                row["user_id"]: row
+                for row in UserLibraryCounter.objects.filter(user_id__in=user_ids).values(
+                    "user_id", *COUNTER_FIELDS
+                )
+            }
+            drifted = []
+            for user_id in user_ids:
+                counts = {field: actual.get(user_id, {}).get(field, 0) for field in COUNTER_FIELDS}
+                row = stored.get(user_id)
+                if row is None and not any(counts.values()):
+                    continue  # created lazily on the first reservation
+                if row is None or any(row[field] != counts[field] for field in COUNTER_FIELDS):
+                    drifted.append(UserLibraryCounter(user_id=user_id, **counts))
+            fixed += len(drifted)
+
+            if drifted and not opts["dry_run"]:
+                with transaction.atomic():
+                    UserLibraryCounter.objects.bulk_create(
+                        drifted,
+                        update_conflicts=True,
+                        unique_fields=["user"],
+                        update_fields=[*COUNTER_FIELDS, "updated_at"],
+                    )
+            self.stdout.write(f"  checked {checked} users, {fixed} drifted...")
+
+        verb = "would be fixed" if opts["dry_run"] else "fixed"
+        self.stdout.write(self.style.SUCCESS(f"Done. {fixed} of {checked} counters {verb}."))
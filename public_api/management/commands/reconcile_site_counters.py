@@ -0,0 +1,24 @@
+"""Rewrite the site_counters rows (home stats / venue counts) from exact counts.
+
+Run periodically (e.g. hourly from cron) to repair drift from bulk loads and
+raw SQL that bypass the model signals.
+
+Usage:
+    python manage.py reconcile_site_counters
+"""
+from django.core.management.base import BaseCommand
+
+from public_api.response_cache import bust_tags
+from public_api.site_counters import reconcile_site_counters
+
+
+class Command(BaseCommand):
+    help = "Recount papers, users, datasets, conferences and journals into site_counters."
+
+    def handle(self, *args, **opts):
+        changed = reconcile_site_counters()
+        for name, (old, new) in changed.items():
+            self.stdout.write(f"  {name}: {old} -> {new}")
+        if changed:
+            bust_tags("stats")
+        self.stdout.write(self.style.SUCCESS(f"Done. {len(changed)} counters corrected."))
@@ -0,0 +1,19 @@
+"""Recompute Dataset.paper_count and Dataset.task_names from the M2M tables.
+
+Usage:
+    python manage.py refresh_dataset_rollups
+"""
+from django.core.management.base import BaseCommand
+
+from public_api.dataset_rollups import refresh_dataset_rollups
+from public_api.response_cache import bust_tags
+
+
+class Command(BaseCommand):
+    help = "Rewrite stale dataset paper counts and task-name arrays with one grouped UPDATE."
+
+    def handle(self, *args, **opts):
+        changed = refresh_dataset_rollups()
+        if changed:
+            bust_tags("datasets")
+        self.stdout.write(self.style.SUCCESS(f"Done. {changed} datasets updated."))
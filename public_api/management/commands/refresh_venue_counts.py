@@ -0,0 +1,19 @@
+"""Recompute Journal.papers_count and Conference.papers_count from the papers table.
+
+Usage:
+    python manage.py refresh_venue_counts
+"""
+from django.core.management.base import BaseCommand
+
+from public_api.response_cache import bust_tags
+from public_api.venue_counts import refresh_venue_counts
+
+
+class Command(BaseCommand):
+    help = "Rewrite stale journal and conference paper counts with one grouped UPDATE per table."
+
+    def handle(self, *args, **opts):
+        changed = refresh_venue_counts()
+        if changed:
+            bust_tags("journals", "conferences")
+        self.stdout.write(self.style.SUCCESS(f"Done. {changed} venues updated."))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0012_rename_research_ch_session_6c1a8e_idx_research_ch_session_18f244_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='paper',
+            index=models.Index(fields=['-publication_date', 'id'], name='papers_pubdate_id_idx'),
+        ),
+    ]
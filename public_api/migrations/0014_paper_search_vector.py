@@ -0,0 +1,75 @@
+# Generated by Django 5.2 on 2026-10-17 03:27
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# papers_search_vector() is also called by `manage.py backfill_search_vectors`.
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION papers_search_vector(title text, abstract text, keywords jsonb)
+RETURNS tsvector
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(
+               CASE jsonb_typeof(keywords)
+                   WHEN 'array' THEN (
+                       SELECT string_agg(value, ' ')
+                       FROM jsonb_array_elements_text(keywords)
+                   )
+                   WHEN 'string' THEN keywords #>> '{}'
+               END, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(abstract, '')), 'C')
+$$;
+
+CREATE OR REPLACE FUNCTION papers_search_vector_refresh() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := papers_search_vector(NEW.title, NEW.abstract, NEW.keywords);
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER papers_search_vector_insert
+    BEFORE INSERT ON papers
+    FOR EACH ROW EXECUTE FUNCTION papers_search_vector_refresh();
+
+-- Django writes every column on save(); only recompute when the text changed
+-- or the ORM wrote back a stale/NULL vector from an in-memory instance.
+CREATE TRIGGER papers_search_vector_update
+    BEFORE UPDATE ON papers
+    FOR EACH ROW
+    WHEN (
+        OLD.title IS DISTINCT FROM NEW.title
+        OR OLD.abstract IS DISTINCT FROM NEW.abstract
+        OR OLD.keywords IS DISTINCT FROM NEW.keywords
+        OR OLD.search_vector IS DISTINCT FROM NEW.search_vector
+    )
+    EXECUTE FUNCTION papers_search_vector_refresh();
+"""
+
+DROP_SEARCH_VECTOR_FUNCTION = """
+DROP TRIGGER IF EXISTS papers_search_vector_update ON papers;
+DROP TRIGGER IF EXISTS papers_search_vector_insert ON papers;
+DROP FUNCTION IF EXISTS papers_search_vector_refresh();
+DROP FUNCTION IF EXISTS papers_search_vector(text, text, jsonb);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0013_paper_pubdate_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paper',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='paper',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='papers_search_vector_gin'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_FUNCTION, DROP_SEARCH_VECTOR_FUNCTION),
+    ]
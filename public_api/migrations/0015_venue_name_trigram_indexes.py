@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-17 03:28
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0014_paper_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='conference',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='conference_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conference',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('abbreviation'), name='gin_trgm_ops'), name='conference_abbr_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journal',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='journal_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journal',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('abbreviation'), name='gin_trgm_ops'), name='journal_abbr_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-17 03:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0015_venue_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaperCard',
+            fields=[
+                ('paper', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='public_api.paper')),
+                ('payload', models.JSONField()),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'paper_card',
+            },
+        ),
+    ]
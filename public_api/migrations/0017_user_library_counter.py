@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-17 03:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Seed counters for users who already have library items (the same counts
+# `manage.py reconcile_library_counters` recomputes).
+BACKFILL_COUNTERS = """
+INSERT INTO user_library_counter (user_id, interesting_papers, interesting_datasets, updated_at)
+SELECT user_id, SUM(papers), SUM(datasets), now()
+FROM (
+    SELECT user_id, COUNT(*) AS papers, 0 AS datasets
+    FROM public_api_interestingpaper GROUP BY user_id
+    UNION ALL
+    SELECT user_id, 0, COUNT(*)
+    FROM public_api_interestingdataset GROUP BY user_id
+) AS counts
+GROUP BY user_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('public_api', '0016_paper_card'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserLibraryCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='library_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('interesting_papers', models.PositiveIntegerField(default=0)),
+                ('interesting_datasets', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'user_library_counter',
+            },
+        ),
+        migrations.RunSQL(BACKFILL_COUNTERS, migrations.RunSQL.noop),
+    ]
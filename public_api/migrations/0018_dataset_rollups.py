@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-17 03:50
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+# Same grouped UPDATE as public_api.dataset_rollups.refresh_dataset_rollups();
+# paper_count switches from the imported JSON value to the M2M count.
+BACKFILL_ROLLUPS = """
+UPDATE public_api_dataset AS d
+SET paper_count = COALESCE(p.total, 0),
+    task_names = COALESCE(t.names, '{}')
+FROM public_api_dataset AS src
+LEFT JOIN (
+    SELECT dataset_id, COUNT(*) AS total
+    FROM public_api_dataset_papers GROUP BY dataset_id
+) AS p ON p.dataset_id = src.id
+LEFT JOIN (
+    SELECT td.dataset_id, array_agg(t.name ORDER BY t.name) AS names
+    FROM tasks_datasets AS td JOIN tasks AS t ON t.id = td.task_id
+    GROUP BY td.dataset_id
+) AS t ON t.dataset_id = src.id
+WHERE d.id = src.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0017_user_library_counter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataset',
+            name='task_names',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=200), blank=True, default=list, size=None),
+        ),
+        migrations.AlterField(
+            model_name='dataset',
+            name='paper_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunSQL(BACKFILL_ROLLUPS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-17 03:55
+
+from django.db import migrations, models
+
+# Same grouped UPDATE as public_api.venue_counts.refresh_venue_counts().
+BACKFILL_COUNTS = """
+UPDATE journal AS v
+SET papers_count = p.total
+FROM (
+    SELECT journal_id, COUNT(*) AS total
+    FROM papers WHERE journal_id IS NOT NULL GROUP BY journal_id
+) AS p
+WHERE v.id = p.journal_id;
+UPDATE conference AS v
+SET papers_count = p.total
+FROM (
+    SELECT conference_id, COUNT(*) AS total
+    FROM papers WHERE conference_id IS NOT NULL GROUP BY conference_id
+) AS p
+WHERE v.id = p.conference_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0018_dataset_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conference',
+            name='papers_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='journal',
+            name='papers_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='conference',
+            index=models.Index(fields=['-papers_count', 'name'], name='conference_papers__2489e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journal',
+            index=models.Index(fields=['-papers_count', 'name'], name='journal_papers__3454a0_idx'),
+        ),
+        migrations.RunSQL(BACKFILL_COUNTS, migrations.RunSQL.noop),
+    ]
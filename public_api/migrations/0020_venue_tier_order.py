@@ -0,0 +1,55 @@
+# Generated by Django 5.2 on 2026-10-17 03:58
+
+from django.db import migrations, models
+
+# Same mapping as public_api.conference_ranks.normalize_conference_rank():
+# a stripped tier label is kept, everything else becomes unranked ("").
+# btrim() gets every character Python's str.strip() removes (str.isspace()).
+PY_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+NORMALIZE_RANKS = """
+UPDATE conference
+SET rank = CASE WHEN btrim(rank, %(ws)s) IN ('A*', 'A', 'B', 'C')
+                THEN btrim(rank, %(ws)s) ELSE '' END
+WHERE rank IS DISTINCT FROM
+      CASE WHEN btrim(rank, %(ws)s) IN ('A*', 'A', 'B', 'C')
+           THEN btrim(rank, %(ws)s) ELSE '' END;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0019_venue_papers_count'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [(NORMALIZE_RANKS, {"ws": PY_WHITESPACE})], migrations.RunSQL.noop
+        ),
+        migrations.AddField(
+            model_name='conference',
+            name='rank_order',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(rank='A*', then=models.Value(0)), models.When(rank='A', then=models.Value(1)), models.When(rank='B', then=models.Value(2)), models.When(rank='C', then=models.Value(3)), default=models.Value(99), output_field=models.SmallIntegerField()), output_field=models.SmallIntegerField()),
+        ),
+        migrations.AddField(
+            model_name='journal',
+            name='quartile_order',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(quartile='Q1', then=models.Value(0)), models.When(quartile='Q2', then=models.Value(1)), models.When(quartile='Q3', then=models.Value(2)), models.When(quartile='Q4', then=models.Value(3)), default=models.Value(99), output_field=models.SmallIntegerField()), output_field=models.SmallIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='conference',
+            index=models.Index(fields=['rank_order', 'name'], name='conference_rank_or_8a5c19_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journal',
+            index=models.Index(fields=['quartile_order', 'name'], name='journal_quartil_b4f2a7_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='conference',
+            constraint=models.CheckConstraint(condition=models.Q(('rank__in', ['A*', 'A', 'B', 'C', ''])), name='conference_rank_normalized'),
+        ),
+    ]
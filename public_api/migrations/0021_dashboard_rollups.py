@@ -0,0 +1,76 @@
+# Generated by Django 5.2 on 2026-10-17 03:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Same statements as public_api.dashboard_rollups.rebuild_dashboard_rollups();
+# days are created_at dates in TIME_ZONE.
+BACKFILL_ROLLUPS = [
+    """
+    INSERT INTO paper_daily_rollup (day, paper_count)
+    SELECT (p.created_at AT TIME ZONE %s)::date, COUNT(*) FROM papers AS p GROUP BY 1
+    """,
+    """
+    INSERT INTO task_daily_rollup (day, task_id, paper_count)
+    SELECT (p.created_at AT TIME ZONE %s)::date, l.task_id, COUNT(*)
+    FROM tasks_papers AS l JOIN papers AS p ON p.id = l.paper_id GROUP BY 1, 2
+    """,
+    """
+    INSERT INTO dataset_daily_rollup (day, dataset_id, paper_count)
+    SELECT (p.created_at AT TIME ZONE %s)::date, l.dataset_id, COUNT(*)
+    FROM public_api_dataset_papers AS l JOIN papers AS p ON p.id = l.paper_id GROUP BY 1, 2
+    """,
+]
+
+
+def backfill_rollups(apps, schema_editor):
+    for sql in BACKFILL_ROLLUPS:
+        schema_editor.execute(sql, [settings.TIME_ZONE])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0020_venue_tier_order'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaperDailyRollup',
+            fields=[
+                ('day', models.DateField(primary_key=True, serialize=False)),
+                ('paper_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'paper_daily_rollup',
+            },
+        ),
+        migrations.CreateModel(
+            name='DatasetDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('paper_count', models.IntegerField(default=0)),
+                ('dataset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='public_api.dataset')),
+            ],
+            options={
+                'db_table': 'dataset_daily_rollup',
+                'constraints': [models.UniqueConstraint(fields=('day', 'dataset'), name='dataset_daily_rollup_day_dataset')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('paper_count', models.IntegerField(default=0)),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='public_api.task')),
+            ],
+            options={
+                'db_table': 'task_daily_rollup',
+                'constraints': [models.UniqueConstraint(fields=('day', 'task'), name='task_daily_rollup_day_task')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 04:01
+
+from django.db import migrations, models
+
+# Same counts as public_api.site_counters.reconcile_site_counters().
+BACKFILL_COUNTERS = """
+INSERT INTO site_counters (name, value, updated_at) VALUES
+    ('papers', (SELECT COUNT(*) FROM papers), now()),
+    ('users', (SELECT COUNT(*) FROM auth_user), now()),
+    ('datasets', (SELECT COUNT(*) FROM public_api_dataset), now()),
+    ('conferences', (SELECT COUNT(*) FROM conference), now()),
+    ('journals', (SELECT COUNT(*) FROM journal), now());
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0021_dashboard_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteCounter',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'site_counters',
+            },
+        ),
+        migrations.RunSQL(BACKFILL_COUNTERS, migrations.RunSQL.noop),
+    ]
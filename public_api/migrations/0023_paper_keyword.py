@@ -0,0 +1,98 @@
+# Generated by Django 5.2 on 2026-10-17 04:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# paper_keywords_normalized() accepts every stored keywords shape (JSON array,
+# JSON-encoded array string, comma-separated string) and lowercases the terms.
+# It is also called by `manage.py backfill_paper_keywords`.
+PAPER_KEYWORD_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION paper_keywords_normalized(keywords jsonb)
+RETURNS text[]
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    items jsonb := keywords;
+BEGIN
+    IF jsonb_typeof(keywords) = 'string' THEN
+        BEGIN
+            items := (keywords #>> '{}')::jsonb;
+        EXCEPTION WHEN others THEN
+            items := NULL;
+        END;
+        IF items IS NULL OR jsonb_typeof(items) <> 'array' THEN
+            RETURN ARRAY(
+                SELECT DISTINCT lower(btrim(part))
+                FROM regexp_split_to_table(keywords #>> '{}', ',') AS part
+                WHERE btrim(part) <> ''
+            );
+        END IF;
+    END IF;
+    IF jsonb_typeof(items) IS DISTINCT FROM 'array' THEN
+        RETURN '{}';
+    END IF;
+    RETURN ARRAY(
+        SELECT DISTINCT lower(value #>> '{}')
+        FROM jsonb_array_elements(items) AS value
+        WHERE jsonb_typeof(value) = 'string' AND value #>> '{}' <> ''
+    );
+END
+$$;
+
+CREATE OR REPLACE FUNCTION paper_keyword_refresh() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM paper_keyword WHERE paper_id = NEW.id;
+    END IF;
+    INSERT INTO paper_keyword (paper_id, keyword, created_at)
+    SELECT NEW.id, keyword, NEW.created_at
+    FROM unnest(paper_keywords_normalized(NEW.keywords)) AS keyword;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER paper_keyword_insert
+    AFTER INSERT ON papers
+    FOR EACH ROW EXECUTE FUNCTION paper_keyword_refresh();
+
+-- Django writes every column on save(); only rebuild when the inputs changed.
+CREATE TRIGGER paper_keyword_update
+    AFTER UPDATE ON papers
+    FOR EACH ROW
+    WHEN (
+        OLD.keywords IS DISTINCT FROM NEW.keywords
+        OR OLD.created_at IS DISTINCT FROM NEW.created_at
+    )
+    EXECUTE FUNCTION paper_keyword_refresh();
+"""
+
+DROP_PAPER_KEYWORD_FUNCTIONS = """
+DROP TRIGGER IF EXISTS paper_keyword_update ON papers;
+DROP TRIGGER IF EXISTS paper_keyword_insert ON papers;
+DROP FUNCTION IF EXISTS paper_keyword_refresh();
+DROP FUNCTION IF EXISTS paper_keywords_normalized(jsonb);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_api', '0022_site_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaperKeyword',
+            fields=[
+                ('pk', models.CompositePrimaryKey('paper', 'keyword', blank=True, editable=False, primary_key=True, serialize=False)),
+                ('keyword', models.TextField()),
+                ('created_at', models.DateTimeField()),
+                ('paper', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='keyword_index', to='public_api.paper')),
+            ],
+            options={
+                'db_table': 'paper_keyword',
+                'indexes': [models.Index(fields=['keyword', 'created_at'], name='paper_keyword_kw_created_idx')],
+            },
+        ),
+        migrations.RunSQL(PAPER_KEYWORD_FUNCTIONS, DROP_PAPER_KEYWORD_FUNCTIONS),
+    ]
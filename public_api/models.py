@@ -1,9 +1,15 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Upper
 import uuid
 from django.conf import settings
 from django.utils import timezone
 
+from .conference_ranks import QUARTILE_TIERS, RANK_TIERS, normalize_conference_rank, tier_order
+
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='public_profile')
     full_name = models.CharField(max_length=255, blank=True)
@@ -32,8 +38,15 @@ class Journal(models.Model):
     abbreviation = models.CharField(max_length=50, blank=True)
     impact_factor = models.FloatField(null=True, blank=True)
     quartile = models.CharField(max_length=10, blank=True)
+    quartile_order = models.GeneratedField(
+        expression=tier_order("quartile", QUARTILE_TIERS),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+    )
     publisher = models.CharField(max_length=255, blank=True)
     url = models.URLField(blank=True)
+    # Maintained by public_api.venue_counts; not edited directly.
+    papers_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -42,16 +55,28 @@ class Journal(models.Model):
         indexes = [
             models.Index(fields=['id']),
             models.Index(fields=['name']),
+            models.Index(fields=['-papers_count', 'name']),
+            models.Index(fields=['quartile_order', 'name']),
             models.Index(fields=['-created_at']),
+            # Trigram indexes on UPPER(...) serve both icontains and similarity search.
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='journal_name_trgm_idx'),
+            GinIndex(OpClass(Upper('abbreviation'), name='gin_trgm_ops'), name='journal_abbr_trgm_idx'),
         ]
 
 class Conference(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255, unique=True)
     abbreviation = models.CharField(max_length=50, blank=True)
-    rank = models.CharField(max_length=10, blank=True)  # A*, A, B, C or similar
+    rank = models.CharField(max_length=10, blank=True)  # A*, A, B, C or "" (unranked)
+    rank_order = models.GeneratedField(
+        expression=tier_order("rank", RANK_TIERS),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+    )
     location = models.CharField(max_length=255, blank=True)
     url = models.URLField(blank=True)
+    # Maintained by public_api.venue_counts; not edited directly.
+    papers_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -60,10 +85,24 @@ class Conference(models.Model):
             models.Index(fields=['id']),
             models.Index(fields=['name']),
             models.Index(fields=['rank']),
+            models.Index(fields=['-papers_count', 'name']),
+            models.Index(fields=['rank_order', 'name']),
             models.Index(fields=['-created_at']),
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='conference_name_trgm_idx'),
+            GinIndex(OpClass(Upper('abbreviation'), name='gin_trgm_ops'), name='conference_abbr_trgm_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(rank__in=[*RANK_TIERS, ""]),
+                name="conference_rank_normalized",
+            ),
         ]
         db_table = "conference"
 
+    def save(self, *args, **kwargs):
+        self.rank = normalize_conference_rank(self.rank)
+        super().save(*args, **kwargs)
+
 class Paper(models.Model):
     FILE_FORMAT_CHOICES = [
         ('pdf', 'PDF'),
@@ -104,6 +143,10 @@ class Paper(models.Model):
 
     embedded_at = models.DateTimeField(null=True, blank=True)
 
+    # Weighted title (A) / keywords (B) / abstract (C) tsvector, maintained by the
+    # papers_search_vector_* triggers (see migration 0014).
+    search_vector = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -114,7 +157,9 @@ class Paper(models.Model):
             models.Index(fields=['conference']),
             models.Index(fields=['journal']),
             models.Index(fields=['-publication_date']),
-            models.Index(fields=['title'])
+            models.Index(fields=['-publication_date', 'id'], name='papers_pubdate_id_idx'),
+            models.Index(fields=['title']),
+            GinIndex(fields=['search_vector'], name='papers_search_vector_gin'),
         ]
 
     @property
@@ -202,6 +247,48 @@ class PaperVenueMapping(models.Model):
         ]
 
 
+class PaperCard(models.Model):
+    """Pre-rendered PaperListSerializer payload per paper (list read model).
+
+    Kept current by public_api.signals; rebuild with ``manage.py rebuild_paper_cards``.
+    """
+
+    paper = models.OneToOneField(
+        Paper,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="card",
+    )
+    payload = models.JSONField()
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "paper_card"
+
+
+class PaperKeyword(models.Model):
+    """Lowercased keyword index over ``Paper.keywords`` (keyword recommendations).
+
+    Written only by the paper_keyword_* triggers on ``papers`` (see migration
+    0023); fill pre-existing rows with ``manage.py backfill_paper_keywords``.
+    """
+
+    pk = models.CompositePrimaryKey("paper", "keyword")
+    # The (paper, keyword) primary key already indexes paper_id.
+    paper = models.ForeignKey(
+        Paper, on_delete=models.CASCADE, related_name="keyword_index", db_index=False
+    )
+    keyword = models.TextField()
+    # Copy of papers.created_at so recency filters stay on this index.
+    created_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "paper_keyword"
+        indexes = [
+            models.Index(fields=["keyword", "created_at"], name="paper_keyword_kw_created_idx"),
+        ]
+
+
 class Author(models.Model):
     name = models.CharField(max_length=200)
     email = models.EmailField(max_length=200)
@@ -232,7 +319,10 @@ class Dataset(models.Model):
     thumbnail_url = models.URLField(blank=True)
     language = models.CharField(max_length=100, blank=True)
     abbreviation = models.CharField(max_length=100, blank=True)
-    paper_count = models.IntegerField(null=True, blank=True)
+    # Rollups of the papers / tasks M2Ms, maintained by public_api.signals;
+    # recompute with ``manage.py refresh_dataset_rollups``.
+    paper_count = models.IntegerField(default=0)
+    task_names = ArrayField(models.CharField(max_length=200), default=list, blank=True)
     benchmarks = models.JSONField(default=list, blank=True, null=True)
     dataloaders = models.JSONField(default=list, blank=True, null=True)
     dataset_papers = models.JSONField(default=list, blank=True, null=True)
@@ -316,6 +406,86 @@ class InterestingDataset(models.Model):
         return f"{self.user.username} - {self.dataset.name}"
 
 
+class UserLibraryCounter(models.Model):
+    """Per-user library sizes backing the interesting-item limits.
+
+    Maintained by public_api.library_limits and public_api.signals; repair drift
+    with ``manage.py reconcile_library_counters``.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="library_counter",
+    )
+    interesting_papers = models.PositiveIntegerField(default=0)
+    interesting_datasets = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "user_library_counter"
+
+
+class SiteCounter(models.Model):
+    """Row counts of the big tables (papers, users, datasets, venues) by name.
+
+    Adjusted by public_api.signals on insert/delete; repair drift with
+    ``manage.py reconcile_site_counters``.
+    """
+
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "site_counters"
+
+
+class PaperDailyRollup(models.Model):
+    """Papers created per day (``created_at`` in TIME_ZONE), summed by /api/dashboard/.
+
+    This and the task/dataset rollups below are maintained by
+    public_api.dashboard_rollups; rebuild with ``manage.py rebuild_dashboard_rollups``.
+    """
+
+    day = models.DateField(primary_key=True)
+    paper_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "paper_daily_rollup"
+
+
+class TaskDailyRollup(models.Model):
+    """Papers created per day linked to a task."""
+
+    day = models.DateField()
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="daily_rollups")
+    paper_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "task_daily_rollup"
+        constraints = [
+            models.UniqueConstraint(fields=["day", "task"], name="task_daily_rollup_day_task"),
+        ]
+
+
+class DatasetDailyRollup(models.Model):
+    """Papers created per day linked to a dataset."""
+
+    day = models.DateField()
+    dataset = models.ForeignKey(Dataset, on_delete=models.CASCADE, related_name="daily_rollups")
+    paper_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "dataset_daily_rollup"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "dataset"], name="dataset_daily_rollup_day_dataset"
+            ),
+        ]
+
+
 class ChatSession(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(
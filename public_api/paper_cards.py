@@ -0,0 +1,154 @@
+"""
+Denormalized "paper card" read model for list endpoints.
+
+``paper_card.payload`` stores the rendered ``PaperListSerializer`` output for
+one paper (title, author names, venue dict, year, keywords, downloadUrl,
+impactFactor, quartile). List views select it through a single LEFT JOIN
+(``with_card_payload``) instead of loading journal/conference/authors and
+running the serializer per row. Cards are refreshed by ``public_api.signals``;
+bulk writers that bypass model signals call ``refresh_paper_cards`` directly,
+and ``manage.py rebuild_paper_cards`` rebuilds everything.
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.contrib.postgres.fields import ArrayField
+from django.db import connection
+from django.db.models import F, Func, JSONField, TextField, Value
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Journal, Paper, PaperCard
+from .serializers import PaperListSerializer
+from .sparse_fields import trim
+
+# Paper columns the card is rendered from; saves touching none of them skip the refresh.
+CARD_SOURCE_FIELDS = frozenset(
+    {
+        "title",
+        "abstract",
+        "keywords",
+        "publication_date",
+        "journal",
+        "journal_id",
+        "conference",
+        "conference_id",
+        "pdf_url",
+        "pdf_file",
+    }
+)
+CARD_REFRESH_BATCH = 500
+CARD_FIELDS = tuple(PaperListSerializer.Meta.fields)
+_VENUE_CARD_KEYS = ("venue", "venueType", "impactFactor", "quartile")
+
+
+def _to_json(data) -> dict:
+    # Same encoder as the API renderer, so cards match a live serializer response.
+    return json.loads(json.dumps(data, cls=JSONEncoder))
+
+
+def build_card_payload(paper: Paper) -> dict:
+    """Render one card; ``paper`` should carry journal, conference and authors."""
+    return _to_json(PaperListSerializer(paper).data)
+
+
+def refresh_paper_cards(paper_ids) -> dict:
+    """Re-render and upsert cards for ``paper_ids``; returns ``{paper_id: payload}``."""
+    ids = list(dict.fromkeys(paper_ids))
+    payloads = {}
+    for start in range(0, len(ids), CARD_REFRESH_BATCH):
+        papers = (
+            Paper.objects.filter(id__in=ids[start : start + CARD_REFRESH_BATCH])
+            .select_related("journal", "conference")
+            .prefetch_related("authors")
+        )
+        cards = [PaperCard(paper=paper, payload=build_card_payload(paper)) for paper in papers]
+        if not cards:
+            continue
+        PaperCard.objects.bulk_create(
+            cards,
+            update_conflicts=True,
+            unique_fields=["paper"],
+            update_fields=["payload", "refreshed_at"],
+        )
+        payloads.update((card.paper_id, card.payload) for card in cards)
+    return payloads
+
+
+def refresh_venue_cards(venue) -> int:
+    """
+    Patch the venue keys of every card published in ``venue`` with one UPDATE.
+
+    A journal wins over a conference in the card (see PaperListSerializer), so
+    conference edits only touch papers without a journal.
+    """
+    if isinstance(venue, Journal):
+        sample = Paper(journal=venue)
+        where = "journal_id = %s"
+    else:
+        sample = Paper(conference=venue)
+        where = "journal_id IS NULL AND conference_id = %s"
+    rendered = PaperListSerializer(sample).data
+    patch = _to_json({key: rendered[key] for key in _VENUE_CARD_KEYS})
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE paper_card
+            SET payload = payload || %s::jsonb, refreshed_at = now()
+            WHERE paper_id IN (SELECT id FROM papers WHERE {where})
+            """,
+            [json.dumps(patch), venue.pk],
+        )
+        return cursor.rowcount
+
+
+class JSONBWithoutKeys(Func):
+    """``jsonb - text[]``: the document with the given top-level keys removed."""
+
+    arg_joiner = " - "
+    template = "(%(expressions)s)"
+    output_field = JSONField()
+
+
+def with_card_payload(queryset, fields=None):
+    """
+    Narrow a Paper queryset to ordering columns plus the joined card payload.
+
+    Existing annotations (search rank, highlights) are kept; select_related and
+    prefetch_related are dropped because the card already carries that data.
+    The venue FK ids stay loaded so related-manager querysets
+    (``journal.papers``) can attach their known instance without a query per row.
+    With ``fields`` (a sparse fieldset), unrequested keys are stripped in SQL.
+    """
+    payload = F("card__payload")
+    dropped = [name for name in CARD_FIELDS if fields is not None and name not in fields]
+    if dropped:
+        keys = Value(dropped, output_field=ArrayField(TextField()))
+        payload = JSONBWithoutKeys(payload, keys)
+    return (
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .only("id", "publication_date", "journal", "conference")
+        .annotate(card_payload=payload)
+    )
+
+
+def card_payloads(papers, fields=None) -> list[tuple[Paper, dict]]:
+    """
+    ``(paper, payload)`` pairs for papers loaded through ``with_card_payload``.
+
+    Papers without a card yet are rendered and stored on the fly (then trimmed
+    to ``fields``); a paper deleted in between is dropped from the page.
+    """
+    papers = list(papers)
+    missing = [paper.pk for paper in papers if paper.card_payload is None]
+    rendered = refresh_paper_cards(missing) if missing else {}
+    pairs = []
+    for paper in papers:
+        payload = paper.card_payload
+        if payload is None and paper.pk in rendered:
+            payload = trim(rendered[paper.pk], fields)
+        if payload is not None:
+            pairs.append((paper, payload))
+    return pairs
@@ -0,0 +1,139 @@
+"""
+Write-behind view/download counters for papers.
+
+``record_view`` / ``record_download`` only bump an in-process buffer. A daemon
+thread (started on first use) flushes the buffer every
+``PAPER_COUNTER_FLUSH_INTERVAL`` seconds with a single
+``UPDATE papers ... FROM (VALUES ...)``, and once more at interpreter exit.
+Hot papers therefore take one row write per interval instead of one per hit,
+and the raw UPDATE leaves ``updated_at`` (and with it the ETags and caches
+keyed on it) alone.
+
+Each worker process keeps its own buffer; counts still pending when a process
+is killed outright are lost, which is acceptable for popularity signals.
+
+Views are counted once per viewer (user, session or IP) and paper every
+``PAPER_VIEW_DEDUPE_SECONDS``, using a shared-cache key, so reloads and
+scripted replays do not inflate ``views_count``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, connections
+
+from .models import Paper
+
+logger = logging.getLogger(__name__)
+
+PAPER_COUNTER_FLUSH_INTERVAL = getattr(settings, "PAPER_COUNTER_FLUSH_INTERVAL", 30)
+PAPER_VIEW_DEDUPE_SECONDS = getattr(settings, "PAPER_VIEW_DEDUPE_SECONDS", 1800)
+
+VIEWS = "views_count"
+DOWNLOADS = "download_count"
+
+_lock = threading.Lock()
+_pending: dict[str, Counter] = {VIEWS: Counter(), DOWNLOADS: Counter()}
+_stop: threading.Event | None = None
+
+
+def record_view(paper_id, viewer: str | None = None) -> bool:
+    """Buffer one view; a repeat from the same ``viewer`` within the dedupe window is dropped."""
+    if viewer and PAPER_VIEW_DEDUPE_SECONDS > 0:
+        key = f"paper_view:{paper_id}:{viewer}"
+        if not cache.add(key, 1, PAPER_VIEW_DEDUPE_SECONDS):
+            return False
+    _record(VIEWS, paper_id)
+    return True
+
+
+def record_download(paper_id) -> None:
+    _record(DOWNLOADS, paper_id)
+
+
+def _record(column: str, paper_id) -> None:
+    with _lock:
+        _pending[column][str(paper_id)] += 1
+    _ensure_flusher()
+
+
+def pending_counts() -> dict[str, dict[str, int]]:
+    with _lock:
+        return {column: dict(counts) for column, counts in _pending.items()}
+
+
+def _take_pending():
+    global _pending
+    with _lock:
+        taken, _pending = _pending, {VIEWS: Counter(), DOWNLOADS: Counter()}
+    return taken
+
+
+def _restore_pending(taken) -> None:
+    with _lock:
+        for column, counts in taken.items():
+            _pending[column].update(counts)
+
+
+def flush_paper_counters() -> int:
+    """Apply buffered increments in one UPDATE; returns the number of rows touched."""
+    taken = _take_pending()
+    ids = taken[VIEWS].keys() | taken[DOWNLOADS].keys()
+    if not ids:
+        return 0
+    rows = [(paper_id, taken[VIEWS][paper_id], taken[DOWNLOADS][paper_id]) for paper_id in ids]
+    table = connection.ops.quote_name(Paper._meta.db_table)
+    values = ", ".join(["(%s::uuid, %s, %s)"] * len(rows))
+    sql = (
+        f"UPDATE {table} AS p "
+        f"SET {VIEWS} = p.{VIEWS} + v.views, {DOWNLOADS} = p.{DOWNLOADS} + v.downloads "
+        f"FROM (VALUES {values}) AS v(id, views, downloads) "
+        "WHERE p.id = v.id"
+    )
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [value for row in rows for value in row])
+            return cursor.rowcount
+    except Exception:
+        _restore_pending(taken)
+        raise
+
+
+def _flush_loop(stop: threading.Event) -> None:
+    while not stop.wait(PAPER_COUNTER_FLUSH_INTERVAL):
+        try:
+            flush_paper_counters()
+        except Exception:
+            logger.exception("Paper counter flush failed; increments kept for the next run")
+        finally:
+            connections.close_all()
+
+
+def _final_flush(stop: threading.Event) -> None:
+    stop.set()
+    try:
+        flush_paper_counters()
+    except Exception:
+        logger.exception("Final paper counter flush failed")
+
+
+def _ensure_flusher() -> None:
+    """Start the flush thread (unless the interval is 0) and the exit hook once."""
+    global _stop
+    if _stop is not None:
+        return
+    with _lock:
+        if _stop is not None:
+            return
+        _stop = threading.Event()
+    if PAPER_COUNTER_FLUSH_INTERVAL > 0:
+        threading.Thread(
+            target=_flush_loop, args=(_stop,), name="paper-counter-flush", daemon=True
+        ).start()
+    atexit.register(_final_flush, _stop)
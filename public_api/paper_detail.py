@@ -0,0 +1,60 @@
+"""
+Query plan for full paper payloads (``PaperDetailSerializer``).
+
+``paper_detail_queryset`` joins the venues, prefetches authors and datasets
+(whose task names are the ``task_names`` rollup) and annotates the requesting
+user's interesting / downloaded flags as ``Exists`` subqueries, so serializing
+any number of papers costs the same three queries however many datasets each
+one links.
+``PaperBatchView`` and ``PaperDetailView`` both load through it.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Prefetch
+
+from .models import Author, DownloadedPaper, InterestingPaper, Paper
+
+PAPER_BATCH_MAX = getattr(settings, "PAPER_BATCH_MAX", 50)
+
+
+def paper_detail_queryset(user=None):
+    queryset = Paper.objects.select_related("journal", "conference").prefetch_related(
+        Prefetch("authors", queryset=Author.objects.only("id", "name")),
+        "datasets",
+    )
+    if user is not None and user.is_authenticated:
+        # Read by PaperDetailSerializer.get_is_interesting / get_is_downloaded.
+        queryset = queryset.annotate(
+            user_interesting=Exists(
+                InterestingPaper.objects.filter(user=user, paper=OuterRef("pk"))
+            ),
+            user_downloaded=Exists(
+                DownloadedPaper.objects.filter(user=user, paper=OuterRef("pk"))
+            ),
+        )
+    return queryset
+
+
+def parse_paper_ids(raw) -> list[uuid.UUID] | None:
+    """Distinct ids from a JSON list, in order; None if any entry is not a UUID."""
+    if not isinstance(raw, list):
+        return None
+    ids = []
+    for value in raw:
+        try:
+            paper_id = uuid.UUID(str(value))
+        except ValueError:
+            return None
+        if paper_id not in ids:
+            ids.append(paper_id)
+    return ids
+
+
+def papers_in_order(ids, user=None) -> list[Paper]:
+    """Papers for ``ids`` in the given order; unknown ids are skipped."""
+    papers = paper_detail_queryset(user).in_bulk(ids)
+    return [papers[paper_id] for paper_id in ids if paper_id in papers]
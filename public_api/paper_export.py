@@ -0,0 +1,125 @@
+"""
+Streaming bulk export of filtered papers as NDJSON or CSV.
+
+Rows are the paper_card payloads (the same shape as a ``/api/papers/`` result)
+read through a server-side cursor (``QuerySet.iterator(chunk_size=...)``), so
+memory stays flat no matter how many papers match. Output is produced as an
+iterator of text chunks that both ``PapersExport`` and the ``export_papers``
+command consume; either can gzip it on the fly. The HTTP export is capped at
+``PAPER_EXPORT_MAX_ROWS`` rows per request; the command is not.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from itertools import islice
+
+from django.conf import settings
+
+from .paper_cards import CARD_FIELDS, card_payloads, with_card_payload
+
+EXPORT_NDJSON = "ndjson"
+EXPORT_CSV = "csv"
+EXPORT_CONTENT_TYPES = {
+    EXPORT_NDJSON: "application/x-ndjson",
+    EXPORT_CSV: "text/csv",
+}
+EXPORT_CHUNK_SIZE = 2000
+# Encoded lines are batched into roughly this many characters per yielded chunk.
+EXPORT_BUFFER_CHARS = 64 * 1024
+EXPORT_MAX_ROWS = getattr(settings, "PAPER_EXPORT_MAX_ROWS", 50000)
+# Multi-valued CSV cells (authors, keywords) are joined with this separator.
+CSV_LIST_SEPARATOR = "; "
+
+
+def export_limit(raw) -> int:
+    """Row cap for a ``?limit=`` value, clamped to ``EXPORT_MAX_ROWS``; ValueError if invalid."""
+    if raw is None or raw == "":
+        return EXPORT_MAX_ROWS
+    limit = int(raw)
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, EXPORT_MAX_ROWS)
+
+
+def export_ordering(queryset, search: str = ""):
+    if search:
+        return queryset.order_by("-search_rank", "-publication_date", "id")
+    return queryset.order_by("-publication_date", "id")
+
+
+def iter_cards(queryset, fields=None, chunk_size: int = EXPORT_CHUNK_SIZE, limit=None):
+    """Yield card payloads for ``queryset`` chunk by chunk from a server-side cursor."""
+    papers = with_card_payload(queryset, fields)
+    if limit:
+        papers = papers[:limit]
+    papers = papers.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(papers, chunk_size))
+        if not chunk:
+            return
+        for _paper, card in card_payloads(chunk, fields):
+            yield card
+
+
+def _ndjson_lines(cards):
+    for card in cards:
+        yield json.dumps(card, ensure_ascii=False) + "\n"
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        # The venue dict flattens to its name.
+        return value.get("name") or ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    return value
+
+
+def _csv_lines(cards, columns):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values):
+        writer.writerow(values)
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    yield line(columns)
+    for card in cards:
+        yield line([_csv_cell(card.get(column)) for column in columns])
+
+
+def _buffered(lines):
+    parts, size = [], 0
+    for line in lines:
+        parts.append(line)
+        size += len(line)
+        if size >= EXPORT_BUFFER_CHARS:
+            yield "".join(parts)
+            parts, size = [], 0
+    if parts:
+        yield "".join(parts)
+
+
+def export_chunks(
+    queryset,
+    export_format: str,
+    *,
+    fields=None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    limit=None,
+):
+    """Encoded export body as an iterator of text chunks."""
+    cards = iter_cards(queryset, fields, chunk_size, limit)
+    if export_format == EXPORT_CSV:
+        lines = _csv_lines(cards, list(fields or CARD_FIELDS))
+    else:
+        lines = _ndjson_lines(cards)
+    return _buffered(lines)
@@ -0,0 +1,145 @@
+"""
+Facet counts for the paper browse filters (year, venue type, venue, task).
+
+``paper_facets`` runs one statement over the filtered paper ids: a CTE feeds a
+``GROUPING SETS`` aggregate for the paper-level facets, a ``UNION ALL`` branch
+counts tasks through ``tasks_papers``, and venue/task names are joined in the
+same pass. Results are cached per filter signature like list totals.
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+
+from .list_counts import LIST_COUNT_CACHE_TTL, filter_signature
+from .models import Conference, Journal, Paper, Task
+
+# Venue and task facets return only the largest buckets; years are all returned.
+FACET_TOP_LIMIT = 20
+
+FACETS_SQL = """
+WITH filtered AS (
+    SELECT
+        p.id,
+        EXTRACT(YEAR FROM p.publication_date)::int AS year,
+        CASE
+            WHEN p.journal_id IS NOT NULL THEN 'journal'
+            WHEN p.conference_id IS NOT NULL THEN 'conference'
+        END AS venue_type,
+        COALESCE(p.journal_id, p.conference_id) AS venue_id
+    FROM {papers} AS p
+    WHERE p.id IN ({paper_ids})
+),
+grouped AS (
+    SELECT
+        CASE
+            WHEN GROUPING(year) = 0 THEN 'year'
+            WHEN GROUPING(venue_id) = 0 THEN 'venue'
+            WHEN GROUPING(venue_type) = 0 THEN 'venueType'
+            ELSE 'total'
+        END AS facet,
+        year,
+        venue_type,
+        venue_id,
+        COUNT(*) AS n
+    FROM filtered
+    GROUP BY GROUPING SETS ((year), (venue_type), (venue_type, venue_id), ())
+),
+ranked AS (
+    SELECT
+        g.facet,
+        COALESCE(g.year::text, g.venue_id::text, g.venue_type) AS value,
+        g.venue_type,
+        COALESCE(j.name, c.name) AS label,
+        g.n,
+        ROW_NUMBER() OVER (PARTITION BY g.facet ORDER BY g.n DESC) AS position
+    FROM grouped AS g
+    LEFT JOIN {journals} AS j ON g.facet = 'venue' AND g.venue_type = 'journal' AND j.id = g.venue_id
+    LEFT JOIN {conferences} AS c ON g.facet = 'venue' AND g.venue_type = 'conference' AND c.id = g.venue_id
+    WHERE g.facet <> 'venue' OR g.venue_id IS NOT NULL
+    UNION ALL
+    SELECT
+        'task',
+        t.id::text,
+        NULL,
+        t.name,
+        counts.n,
+        ROW_NUMBER() OVER (ORDER BY counts.n DESC, t.name)
+    FROM (
+        SELECT tp.task_id, COUNT(*) AS n
+        FROM {task_papers} AS tp
+        JOIN filtered AS f ON f.id = tp.paper_id
+        GROUP BY tp.task_id
+    ) AS counts
+    JOIN {tasks} AS t ON t.id = counts.task_id
+)
+SELECT facet, value, venue_type, label, n
+FROM ranked
+WHERE facet NOT IN ('venue', 'task') OR position <= %s
+"""
+
+
+def _empty_facets() -> dict:
+    return {
+        "totalItems": 0,
+        "facets": {"year": [], "venueType": [], "venues": [], "tasks": []},
+    }
+
+
+def _facets_sql(paper_ids_sql: str) -> str:
+    return FACETS_SQL.format(
+        papers=Paper._meta.db_table,
+        journals=Journal._meta.db_table,
+        conferences=Conference._meta.db_table,
+        tasks=Task._meta.db_table,
+        task_papers=Task.papers.through._meta.db_table,
+        paper_ids=paper_ids_sql,
+    )
+
+
+def compute_paper_facets(queryset) -> dict:
+    """Facet counts over ``queryset`` (a filtered Paper queryset), uncached."""
+    try:
+        ids_sql, ids_params = queryset.order_by().values("id").query.sql_with_params()
+    except EmptyResultSet:
+        return _empty_facets()
+    with connection.cursor() as cursor:
+        cursor.execute(_facets_sql(ids_sql), [*ids_params, FACET_TOP_LIMIT])
+        rows = cursor.fetchall()
+
+    result = _empty_facets()
+    facets = result["facets"]
+    for facet, value, venue_type, label, count in rows:
+        if facet == "total":
+            result["totalItems"] = count
+        elif facet == "year":
+            facets["year"].append({"value": int(value) if value else None, "count": count})
+        elif facet == "venueType":
+            facets["venueType"].append({"value": value, "count": count})
+        elif facet == "venue":
+            facets["venues"].append(
+                {"id": value, "name": label, "venueType": venue_type, "count": count}
+            )
+        else:
+            facets["tasks"].append({"id": int(value), "name": label, "count": count})
+
+    facets["year"].sort(key=lambda item: (item["value"] is None, -(item["value"] or 0)))
+    for key in ("venueType", "venues", "tasks"):
+        facets[key].sort(key=lambda item: -item["count"])
+    return result
+
+
+def paper_facets(queryset) -> dict:
+    """``compute_paper_facets`` cached per filter signature for ``LIST_COUNT_CACHE_TTL``."""
+    try:
+        signature = filter_signature(queryset)
+    except EmptyResultSet:
+        return _empty_facets()
+    key = f"paper_facets:{signature}"
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_paper_facets(queryset)
+        cache.set(key, facets, LIST_COUNT_CACHE_TTL)
+    return facets
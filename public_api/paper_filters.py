@@ -0,0 +1,74 @@
+"""
+Query-param filters shared by the paper browse endpoints.
+
+``PapersList``, ``PaperFacets`` and the paper export must agree on what a
+filter means, so all of them narrow their querysets through ``filter_papers``.
+"""
+
+from datetime import datetime
+
+from django.db.models import Q
+
+from .paper_search import search_papers
+from .venue_search import VENUE_MATCH_FUZZY, filter_papers_by_venue_name
+
+
+def parse_task_ids(raw) -> list[str]:
+    if isinstance(raw, str):
+        return [tid.strip() for tid in raw.split(",") if tid.strip()]
+    if isinstance(raw, list):
+        return [str(tid).strip() for tid in raw if str(tid).strip()]
+    return []
+
+
+def search_text(params) -> str:
+    return (params.get("search") or "").strip()
+
+
+def filter_papers(queryset, params, *, highlight: bool = True):
+    """
+    Apply ``year``, ``venue_id``/``venue`` (+ ``venueMatch``), ``venueType``,
+    ``taskIds``, ``startDate``/``endDate`` and ``search`` from ``params``
+    (``request.query_params`` or any QueryDict, e.g. from export_papers).
+
+    Search annotates ``search_rank`` and, unless ``highlight`` is False, the
+    ``ts_headline`` snippets (see ``paper_search``).
+    """
+    year = params.get("year")
+    venue = params.get("venue")
+    venue_id = params.get("venue_id")
+    venue_type = params.get("venueType")
+    start_date = params.get("startDate")
+    end_date = params.get("endDate")
+    task_ids = parse_task_ids(params.get("taskIds", ""))
+    search = search_text(params)
+
+    if year:
+        queryset = queryset.filter(publication_date__year=int(year))
+
+    if venue_id:
+        queryset = queryset.filter(Q(journal_id=venue_id) | Q(conference_id=venue_id))
+    elif venue:
+        queryset = filter_papers_by_venue_name(
+            queryset, venue, fuzzy=params.get("venueMatch") == VENUE_MATCH_FUZZY
+        )
+
+    if venue_type == "journal":
+        queryset = queryset.filter(journal_id__isnull=False)
+    elif venue_type == "conference":
+        queryset = queryset.filter(conference_id__isnull=False)
+
+    if task_ids:
+        queryset = queryset.filter(tasks__id__in=task_ids).distinct()
+
+    if start_date:
+        start_date = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
+        queryset = queryset.filter(crawled_at__gte=start_date)
+    if end_date:
+        end_date = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+        queryset = queryset.filter(crawled_at__lte=end_date)
+
+    if search:
+        queryset = search_papers(queryset, search, highlight=highlight)
+
+    return queryset
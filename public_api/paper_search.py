@@ -0,0 +1,59 @@
+"""
+Full-text paper search over the stored ``papers.search_vector`` column.
+
+The vector weights title (A), keywords (B) and abstract (C) and is kept current
+by database triggers, so ``?search=`` is a GIN index lookup ranked with
+``ts_rank_cd`` instead of ``ILIKE '%q%'`` over the whole table.
+"""
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F
+
+SEARCH_CONFIG = "english"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+
+def build_search_query(text: str) -> SearchQuery:
+    # websearch syntax: quoted phrases, OR, -exclusions; never raises on user input.
+    return SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def search_papers(queryset, text: str, *, highlight: bool = True):
+    """Filter to matching papers and annotate ``search_rank`` and highlights."""
+    query = build_search_query(text)
+    queryset = queryset.filter(search_vector=query).annotate(
+        search_rank=SearchRank(F("search_vector"), query, cover_density=True)
+    )
+    if not highlight:
+        return queryset
+    return queryset.annotate(
+        title_highlight=SearchHeadline(
+            "title",
+            query,
+            config=SEARCH_CONFIG,
+            start_sel=HIGHLIGHT_START,
+            stop_sel=HIGHLIGHT_STOP,
+            highlight_all=True,
+        ),
+        abstract_highlight=SearchHeadline(
+            "abstract",
+            query,
+            config=SEARCH_CONFIG,
+            start_sel=HIGHLIGHT_START,
+            stop_sel=HIGHLIGHT_STOP,
+            max_words=35,
+            min_words=15,
+            max_fragments=2,
+        ),
+    )
+
+
+def highlight_payload(paper) -> dict | None:
+    """``ts_headline`` snippets for a paper loaded through ``search_papers``."""
+    if not hasattr(paper, "title_highlight"):
+        return None
+    return {
+        "title": paper.title_highlight,
+        "abstract": paper.abstract_highlight,
+    }
@@ -0,0 +1,175 @@
+"""
+Response cache for anonymous GETs on public list/detail endpoints.
+
+Views opt in with ``CachedResponseMixin`` and declare ``cache_tags`` (formatted
+with the URL kwargs, e.g. ``"paper:{paper_id}"``). An entry is keyed by path,
+sorted query params and Accept header, and stores the tag versions current when
+it was rendered; ``bust_tags`` rotates those versions (once the surrounding
+transaction commits) so every entry carrying the tag misses on its next lookup.
+Requests with credentials (Authorization header or session cookie) are never
+cached because some payloads depend on the user.
+
+Validator and caching headers (``ETag``, ``Last-Modified``, ``Cache-Control``,
+``Vary``) are stored with the entry, so a hit answers ``If-None-Match`` /
+``If-Modified-Since`` with a 304 just like the view would.
+
+Tag conventions (busted from ``public_api.signals``):
+
+* ``papers``, ``journals``, ``conferences``, ``datasets``, ``stats`` – list/summary pages
+* ``paper:<id>``, ``dataset:<id>``, ``venue:<id>`` – detail pages
+* ``venue-papers:<id>`` – a journal's or conference's paper list
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from functools import partial
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+RESPONSE_CACHE_TTL = getattr(settings, "RESPONSE_CACHE_TTL", 300)
+HIT_COUNTER_KEY = "resp_cache:stats:hits"
+MISS_COUNTER_KEY = "resp_cache:stats:misses"
+# Response headers replayed on a hit.
+CACHED_HEADERS = ("ETag", "Last-Modified", "Cache-Control", "Vary")
+
+
+def _tag_key(tag: str) -> str:
+    return f"resp_cache:tag:{tag}"
+
+
+def is_anonymous_request(request) -> bool:
+    """True when the request carries no credentials DRF could authenticate."""
+    return (
+        "HTTP_AUTHORIZATION" not in request.META
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+    )
+
+
+def response_cache_key(request) -> str:
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    raw = "\n".join([request.path, query, request.META.get("HTTP_ACCEPT", "")])
+    return "resp_cache:entry:" + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def tag_versions(tags) -> dict[str, str]:
+    """Current version token per tag, creating tokens for unseen tags."""
+    keys = {_tag_key(tag): tag for tag in tags}
+    found = cache.get_many(list(keys))
+    for key in keys.keys() - found.keys():
+        cache.add(key, uuid.uuid4().hex, None)
+        found[key] = cache.get(key)
+    return {keys[key]: version for key, version in found.items()}
+
+
+def _rotate_tags(tags) -> None:
+    cache.set_many({_tag_key(tag): uuid.uuid4().hex for tag in tags}, None)
+
+
+def bust_tags(*tags: str) -> None:
+    """
+    Invalidate every cached response carrying any of ``tags``.
+
+    Inside a transaction the rotation waits for the commit: rotating earlier
+    would let a concurrent GET render the pre-commit rows and store them under
+    the new version. Rolled-back writes bust nothing.
+    """
+    tags = [tag for tag in tags if tag]
+    if tags:
+        transaction.on_commit(partial(_rotate_tags, tags))
+
+
+def _count(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def cache_stats() -> dict:
+    counts = cache.get_many([HIT_COUNTER_KEY, MISS_COUNTER_KEY])
+    hits = counts.get(HIT_COUNTER_KEY, 0)
+    misses = counts.get(MISS_COUNTER_KEY, 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hitRatio": round(hits / lookups, 4) if lookups else None,
+        "backend": settings.CACHES["default"]["BACKEND"],
+        "ttl": RESPONSE_CACHE_TTL,
+    }
+
+
+def _lookup(request, key: str) -> HttpResponse | None:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    current = cache.get_many([_tag_key(tag) for tag in entry["tags"]])
+    for tag, version in entry["tags"].items():
+        if current.get(_tag_key(tag)) != version:
+            return None
+    response = HttpResponse(
+        entry["content"], status=entry["status"], content_type=entry["content_type"]
+    )
+    headers = entry.get("headers", {})
+    for name, value in headers.items():
+        response[name] = value
+    if "ETag" in headers or "Last-Modified" in headers:
+        last_modified = headers.get("Last-Modified")
+        return get_conditional_response(
+            request,
+            etag=headers.get("ETag"),
+            last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+            response=response,
+        )
+    return response
+
+
+class CachedResponseMixin:
+    """APIView mixin serving anonymous GETs from the tagged response cache."""
+
+    cache_tags: tuple[str, ...] = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != "GET" or not is_anonymous_request(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = response_cache_key(request)
+        cached = _lookup(request, key)
+        if cached is not None:
+            _count(HIT_COUNTER_KEY)
+            cached["X-Cache"] = "HIT"
+            return cached
+
+        _count(MISS_COUNTER_KEY)
+        # Read versions before rendering so a concurrent bust is not masked.
+        versions = tag_versions(tag.format(**kwargs) for tag in self.cache_tags)
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming:
+            if hasattr(response, "render"):
+                response.render()
+            cache.set(
+                key,
+                {
+                    "content": response.content,
+                    "status": response.status_code,
+                    "content_type": response["Content-Type"],
+                    "headers": {
+                        name: response[name]
+                        for name in CACHED_HEADERS
+                        if response.has_header(name)
+                    },
+                    "tags": versions,
+                },
+                RESPONSE_CACHE_TTL,
+            )
+        response["X-Cache"] = "MISS"
+        return response
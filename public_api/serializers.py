@@ -13,6 +13,7 @@ from .models import (
     Publication,
     Task,
 )
+from .sparse_fields import selected_fields
 
 
 def resolve_paper_download_url(paper, request=None):
@@ -127,7 +128,39 @@ class PublicationSerializer(serializers.ModelSerializer):
         return data
 
 
-class PaperListSerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    Honour ``?fields=`` / ``?exclude=`` (see sparse_fields). The selection comes
+    from ``context["fields"]`` or is parsed from ``context["request"]``.
+
+    ``sparse_sources`` maps method fields to the model columns they read, so
+    views can narrow their queryset with ``.only(*model_columns(fields))``.
+    """
+
+    sparse_sources: dict[str, tuple[str, ...]] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.context.get("fields")
+        if selected is None:
+            selected = selected_fields(self.context.get("request"), list(self.fields))
+        if selected is not None:
+            for name in set(self.fields) - set(selected):
+                self.fields.pop(name)
+
+    @classmethod
+    def model_columns(cls, fields) -> list[str]:
+        concrete = {field.name for field in cls.Meta.model._meta.concrete_fields}
+        columns = {"id"}
+        for name in fields:
+            if name in cls.sparse_sources:
+                columns.update(cls.sparse_sources[name])
+            elif name in concrete:
+                columns.add(name)
+        return sorted(columns)
+
+
+class PaperListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     year = serializers.SerializerMethodField()
     downloadUrl = serializers.SerializerMethodField()
     authors = serializers.SerializerMethodField()
@@ -154,8 +187,8 @@ class PaperListSerializer(serializers.ModelSerializer):
         ]
 
     def get_authors(self, obj):
-        authors_list = obj.authors.values_list("name", flat=True)
-        authors_list = list(authors_list)
+        # .all() reuses prefetch_related("authors"); values_list() would not.
+        authors_list = [author.name for author in obj.authors.all()]
         if len(authors_list) > 0:
             return authors_list
         else:
@@ -261,13 +294,18 @@ class LibraryItemSerializer(serializers.Serializer):
         return resolve_paper_download_url(obj.paper, request)
 
     def get_is_interesting(self, obj):
+        if hasattr(obj, "paper_interesting"):
+            # Annotated by library_items.
+            return obj.paper_interesting
         return obj.paper.interested_users.filter(user=obj.user).exists()
 
     def get_is_downloaded(self, obj):
+        if hasattr(obj, "paper_downloaded"):
+            return obj.paper_downloaded
         return hasattr(obj, "paper") and obj.paper.downloaded_users.filter(user=obj.user).exists()
 
 
-class DatasetListSerializer(serializers.ModelSerializer):
+class DatasetListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     downloadUrl = serializers.SerializerMethodField()
     category = serializers.SerializerMethodField()
     thumbnailUrl = serializers.SerializerMethodField()
@@ -276,6 +314,16 @@ class DatasetListSerializer(serializers.ModelSerializer):
     benchmarks = serializers.SerializerMethodField()
     isStarred = serializers.SerializerMethodField()
 
+    sparse_sources = {
+        "downloadUrl": ("source_url",),
+        "category": ("data_type",),
+        "thumbnailUrl": ("thumbnail_url",),
+        "benchmarks": ("benchmarks",),
+        "tasks": ("task_names",),
+        "paperCount": ("paper_count",),
+        "isStarred": (),
+    }
+
     class Meta:
         model = Dataset
         fields = [
@@ -306,13 +354,13 @@ class DatasetListSerializer(serializers.ModelSerializer):
         return obj.data_type
 
     def get_tasks(self, obj):
-        return list(obj.tasks.all().values_list("name", flat=True))
+        return list(obj.task_names)
 
     def get_thumbnailUrl(self, obj):
         return obj.thumbnail_url
 
     def get_paperCount(self, obj):
-        return obj.papers.count()
+        return obj.paper_count
 
     def get_benchmarks(self, obj):
         benchmarks = []
@@ -335,6 +383,8 @@ class DatasetListSerializer(serializers.ModelSerializer):
         return benchmarks
 
     def get_isStarred(self, obj):
+        if hasattr(obj, "is_starred"):
+            return obj.is_starred
         request = self.context.get("request")
         if request and request.user.is_authenticated:
             return InterestingDataset.objects.filter(
@@ -394,7 +444,7 @@ class PaperDetailSerializer(PaperListSerializer):
                     "abbreviation": dataset.abbreviation,
                     "description": dataset.description,
                     "data_type": dataset.data_type,
-                    "category": dataset.tasks.all().values_list("name", flat=True),
+                    "category": list(dataset.task_names),
                     "size": dataset.size,
                     "format": dataset.format,
                     "source_url": dataset.source_url,
@@ -431,12 +481,17 @@ class PaperDetailSerializer(PaperListSerializer):
         user = self._get_request_user()
         if not user:
             return False
+        if hasattr(obj, "user_interesting"):
+            # Annotated by paper_detail_queryset.
+            return obj.user_interesting
         return obj.interested_users.filter(user=user).exists()
 
     def get_is_downloaded(self, obj):
         user = self._get_request_user()
         if not user:
             return False
+        if hasattr(obj, "user_downloaded"):
+            return obj.user_downloaded
         return obj.downloaded_users.filter(user=user).exists()
 
 
@@ -488,7 +543,7 @@ class ConferenceListSerializer(serializers.ModelSerializer):
         return display_conference_rank(obj.rank)
 
     def get_papersCount(self, obj):
-        return obj.papers.count()
+        return obj.papers_count
     
 
 class ConferenceDetailSerializer(serializers.ModelSerializer):
@@ -514,5 +569,5 @@ class ConferenceDetailSerializer(serializers.ModelSerializer):
         return display_conference_rank(obj.rank)
 
     def get_papersCount(self, obj):
-        return obj.papers.count()
+        return obj.papers_count
         
\ No newline at end of file
@@ -1,5 +1,4 @@
 """Recommended papers: Qdrant semantic search with keyword-match fallback."""
-import json
 import logging
 import os
 import uuid
@@ -7,9 +6,10 @@ from datetime import timedelta
 from typing import List, Set
 
 import requests
+from django.db.models import Count, Max
 from django.utils import timezone
 
-from ..models import InterestingPaper, Paper, Profile
+from ..models import InterestingPaper, Paper, PaperKeyword, Profile
 
 logger = logging.getLogger(__name__)
 
@@ -52,29 +52,16 @@ def build_semantic_query(profile: Profile) -> str:
     return ". ".join(parts)
 
 
-def _parse_paper_keywords(raw) -> List[str]:
-    if not raw:
-        return []
-    if isinstance(raw, list):
-        return [pk for pk in raw if isinstance(pk, str)]
-    if isinstance(raw, str):
-        try:
-            parsed = json.loads(raw)
-            if isinstance(parsed, list):
-                return [pk for pk in parsed if isinstance(pk, str)]
-        except json.JSONDecodeError:
-            pass
-        return [k.strip() for k in raw.split(",") if k and k.strip()]
-    return []
-
-
 def keyword_recommendation_ids(
     user,
     user_keywords_lower: Set[str],
     *,
     limit: int = RECOMMENDATION_LIMIT,
 ) -> List[uuid.UUID]:
-    """Legacy recommendation: intersection of profile and paper keywords."""
+    """
+    Recent papers sharing profile keywords, most shared keywords first (newest
+    breaks ties). Matching runs on the ``paper_keyword`` index in SQL.
+    """
     if not user_keywords_lower:
         return []
 
@@ -83,24 +70,17 @@ def keyword_recommendation_ids(
         "paper_id", flat=True
     )
 
-    matched_ids: List[uuid.UUID] = []
-    candidates = (
-        Paper.objects.filter(created_at__gte=thirty_days_ago)
-        .exclude(id__in=excluded_paper_ids)
-        .only("id", "keywords")
-        .iterator(chunk_size=200)
+    matches = (
+        PaperKeyword.objects.filter(
+            keyword__in=sorted(user_keywords_lower),
+            created_at__gte=thirty_days_ago,
+        )
+        .exclude(paper_id__in=excluded_paper_ids)
+        .values("paper_id")
+        .annotate(overlap=Count("keyword"), latest=Max("created_at"))
+        .order_by("-overlap", "-latest", "paper_id")
     )
-
-    for paper in candidates:
-        paper_keywords_lower = {
-            pk.lower() for pk in _parse_paper_keywords(paper.keywords)
-        }
-        if user_keywords_lower & paper_keywords_lower:
-            matched_ids.append(paper.id)
-            if len(matched_ids) >= limit:
-                break
-
-    return matched_ids
+    return [row["paper_id"] for row in matches[:limit]]
 
 
 def semantic_search_paper_ids(query: str, *, limit: int = SEMANTIC_SEARCH_LIMIT) -> List[uuid.UUID]:
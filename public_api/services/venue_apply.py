@@ -18,6 +18,8 @@ from django.db import close_old_connections, transaction
 from django.db.utils import InterfaceError, OperationalError
 
 from public_api.models import Conference, Journal, Paper, PaperVenueMapping
+from public_api.paper_cards import refresh_paper_cards
+from public_api.venue_counts import sync_paper_venue_counts
 from public_api.services.venue_mapping import (
     MIN_DB_VENUE_MATCH,
     MIN_TITLE_MATCH,
@@ -278,6 +280,8 @@ def _flush_materialize_buffers(
                 paper_buffer,
                 ["journal_id", "conference_id", "doi", "updated_at"],
             )
+            refresh_paper_cards([paper.pk for paper in paper_buffer])
+            sync_paper_venue_counts(paper_buffer)
 
 
 def materialize_no_match_db_mappings(
@@ -495,6 +499,7 @@ def apply_venue_mapping_for_paper(
 
     if update_fields:
         update_fields.append("updated_at")
+        # post_save refreshes papers_count on the venues left and joined.
         paper.save(update_fields=update_fields)
 
     PaperVenueMapping.objects.update_or_create(
@@ -0,0 +1,343 @@
+"""
+Model signal handlers that keep denormalized read models, per-user library
+counters and the anonymous response cache current.
+
+Registered from ``PublicApiConfig.ready()``. Cache busts take effect when the
+surrounding transaction commits (see ``response_cache.bust_tags``). Queryset ``update()`` and
+``bulk_update()`` bypass these handlers; such callers refresh explicitly.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from .dashboard_rollups import DATASETS, TASKS, adjust_links, adjust_papers
+from .dataset_rollups import refresh_dataset_rollups_on_commit
+from .library_limits import adjust_library_counter
+from .models import (
+    Author,
+    Conference,
+    Dataset,
+    InterestingDataset,
+    InterestingPaper,
+    Journal,
+    Paper,
+    Task,
+)
+from .paper_cards import CARD_SOURCE_FIELDS, refresh_paper_cards, refresh_venue_cards
+from .response_cache import bust_tags
+from .site_counters import adjust_site_counter, counter_name
+from .venue_counts import refresh_venue_counts_on_commit
+
+
+def _membership_tags(journal_id, conference_id) -> list[str]:
+    """Pages whose paper counts change when a paper joins or leaves a venue."""
+    tags = []
+    if journal_id:
+        tags += ["journals", f"venue:{journal_id}", f"venue-papers:{journal_id}"]
+    if conference_id:
+        tags += ["conferences", f"venue:{conference_id}", f"venue-papers:{conference_id}"]
+    return tags
+
+
+def _papers_changed(paper_ids) -> None:
+    """Re-render cards and bust cached pages that show these papers."""
+    paper_ids = list(paper_ids)
+    if not paper_ids:
+        return
+    refresh_paper_cards(paper_ids)
+    tags = ["papers"] + [f"paper:{paper_id}" for paper_id in paper_ids]
+    venues = Paper.objects.filter(id__in=paper_ids).values_list("journal_id", "conference_id")
+    for journal_id, conference_id in set(venues):
+        tags += [f"venue-papers:{venue_id}" for venue_id in (journal_id, conference_id) if venue_id]
+    bust_tags(*tags)
+
+
+# --- Papers -----------------------------------------------------------------
+
+
+@receiver(post_init, sender=Paper, dispatch_uid="paper_remember_venue")
+def remember_paper_venue(sender, instance, **kwargs):
+    # __dict__ lookups so deferred FK columns are not fetched here.
+    instance._loaded_venue_ids = (
+        instance.__dict__.get("journal_id"),
+        instance.__dict__.get("conference_id"),
+    )
+
+
+@receiver(post_save, sender=Paper, dispatch_uid="paper_card_paper_saved")
+def refresh_card_on_paper_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not CARD_SOURCE_FIELDS.intersection(update_fields):
+        return
+    refresh_paper_cards([instance.pk])
+
+
+@receiver(post_save, sender=Paper, dispatch_uid="response_cache_paper_saved")
+def bust_pages_on_paper_save(sender, instance, created, **kwargs):
+    venue_ids = (instance.journal_id, instance.conference_id)
+    tags = ["papers", f"paper:{instance.pk}"]
+    tags += [f"venue-papers:{venue_id}" for venue_id in venue_ids if venue_id]
+    if created:
+        refresh_venue_counts_on_commit([venue_ids[0]], [venue_ids[1]])
+        tags += ["stats", *_membership_tags(*venue_ids)]
+    elif instance._loaded_venue_ids != venue_ids:
+        journal_ids, conference_ids = zip(instance._loaded_venue_ids, venue_ids)
+        refresh_venue_counts_on_commit(journal_ids, conference_ids)
+        tags += _membership_tags(*instance._loaded_venue_ids) + _membership_tags(*venue_ids)
+    bust_tags(*tags)
+    instance._loaded_venue_ids = venue_ids
+
+
+@receiver(post_delete, sender=Paper, dispatch_uid="venue_counts_paper_deleted")
+def refresh_venue_counts_on_paper_delete(sender, instance, **kwargs):
+    refresh_venue_counts_on_commit([instance.journal_id], [instance.conference_id])
+
+
+@receiver(post_delete, sender=Paper, dispatch_uid="response_cache_paper_deleted")
+def bust_pages_on_paper_delete(sender, instance, **kwargs):
+    bust_tags(
+        "papers",
+        "stats",
+        f"paper:{instance.pk}",
+        *_membership_tags(instance.journal_id, instance.conference_id),
+    )
+
+
+# --- Authors ----------------------------------------------------------------
+
+
+@receiver(m2m_changed, sender=Author.papers.through, dispatch_uid="paper_card_authorship")
+def refresh_cards_on_authorship_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # Forward: author.papers.<op>(papers); reverse: paper.authors.<op>(authors).
+    if action == "pre_clear":
+        instance._card_paper_ids = (
+            [instance.pk] if reverse else list(instance.papers.values_list("id", flat=True))
+        )
+        return
+    if action == "post_clear":
+        paper_ids = getattr(instance, "_card_paper_ids", [])
+    elif action in ("post_add", "post_remove"):
+        paper_ids = [instance.pk] if reverse else pk_set
+    else:
+        return
+    _papers_changed(paper_ids)
+
+
+@receiver(post_save, sender=Author, dispatch_uid="paper_card_author_saved")
+def refresh_cards_on_author_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if created or raw:
+        return
+    if update_fields is not None and "name" not in update_fields:
+        return
+    _papers_changed(instance.papers.values_list("id", flat=True))
+
+
+@receiver(pre_delete, sender=Author, dispatch_uid="paper_card_author_deleting")
+def remember_author_papers(sender, instance, **kwargs):
+    # The authorship rows are gone (without m2m_changed) by post_delete.
+    instance._card_paper_ids = list(instance.papers.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=Author, dispatch_uid="paper_card_author_deleted")
+def refresh_cards_on_author_delete(sender, instance, **kwargs):
+    _papers_changed(getattr(instance, "_card_paper_ids", []))
+
+
+# --- Venues -----------------------------------------------------------------
+
+
+def _venue_list_tag(venue) -> str:
+    return "journals" if isinstance(venue, Journal) else "conferences"
+
+
+@receiver(post_save, sender=Journal, dispatch_uid="paper_card_journal_saved")
+@receiver(post_save, sender=Conference, dispatch_uid="paper_card_conference_saved")
+def refresh_cards_on_venue_save(sender, instance, created, raw=False, **kwargs):
+    if created:
+        bust_tags(_venue_list_tag(instance), "stats")
+        return
+    if not raw:
+        refresh_venue_cards(instance)
+    # Paper detail pages embed the venue too; those expire with RESPONSE_CACHE_TTL.
+    bust_tags(_venue_list_tag(instance), f"venue:{instance.pk}", "papers")
+
+
+@receiver(pre_delete, sender=Journal, dispatch_uid="paper_card_journal_deleting")
+@receiver(pre_delete, sender=Conference, dispatch_uid="paper_card_conference_deleting")
+def remember_venue_papers(sender, instance, **kwargs):
+    # papers.journal/conference are SET_NULL via a plain UPDATE, which sends no save signal.
+    instance._card_paper_ids = list(instance.papers.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=Journal, dispatch_uid="paper_card_journal_deleted")
+@receiver(post_delete, sender=Conference, dispatch_uid="paper_card_conference_deleted")
+def refresh_cards_on_venue_delete(sender, instance, **kwargs):
+    bust_tags(
+        _venue_list_tag(instance),
+        "stats",
+        f"venue:{instance.pk}",
+        f"venue-papers:{instance.pk}",
+    )
+    _papers_changed(getattr(instance, "_card_paper_ids", []))
+
+
+# --- Datasets and site totals -----------------------------------------------
+
+
+@receiver(post_save, sender=Dataset, dispatch_uid="response_cache_dataset_saved")
+@receiver(post_delete, sender=Dataset, dispatch_uid="response_cache_dataset_deleted")
+def bust_pages_on_dataset_change(sender, instance, **kwargs):
+    bust_tags("datasets", "stats", f"dataset:{instance.pk}")
+
+
+@receiver(m2m_changed, sender=Dataset.papers.through, dispatch_uid="response_cache_dataset_papers")
+@receiver(m2m_changed, sender=Task.datasets.through, dispatch_uid="response_cache_dataset_tasks")
+def bust_pages_on_dataset_links(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Dataset):
+        dataset_ids = [instance.pk]
+    else:
+        # post_clear from the other side carries no pk_set; list pages still bust.
+        dataset_ids = pk_set or []
+    bust_tags("datasets", *(f"dataset:{dataset_id}" for dataset_id in dataset_ids))
+
+
+@receiver(m2m_changed, sender=Dataset.papers.through, dispatch_uid="dataset_rollups_papers")
+def refresh_rollups_on_paper_links(sender, instance, action, reverse, pk_set, **kwargs):
+    # Forward: dataset.papers.<op>(papers); reverse: paper.datasets.<op>(datasets).
+    if action == "pre_clear":
+        instance._rollup_dataset_ids = (
+            list(instance.datasets.values_list("id", flat=True)) if reverse else [instance.pk]
+        )
+        return
+    if action == "post_clear":
+        refresh_dataset_rollups_on_commit(getattr(instance, "_rollup_dataset_ids", []))
+    elif action in ("post_add", "post_remove"):
+        refresh_dataset_rollups_on_commit(pk_set if reverse else [instance.pk])
+
+
+@receiver(m2m_changed, sender=Task.datasets.through, dispatch_uid="dataset_rollups_tasks")
+def refresh_rollups_on_task_links(sender, instance, action, reverse, pk_set, **kwargs):
+    # Forward: task.datasets.<op>(datasets); reverse: dataset.tasks.<op>(tasks).
+    if action == "pre_clear":
+        instance._rollup_dataset_ids = (
+            [instance.pk] if reverse else list(instance.datasets.values_list("id", flat=True))
+        )
+        return
+    if action == "post_clear":
+        refresh_dataset_rollups_on_commit(getattr(instance, "_rollup_dataset_ids", []))
+    elif action in ("post_add", "post_remove"):
+        refresh_dataset_rollups_on_commit([instance.pk] if reverse else pk_set)
+
+
+@receiver(post_save, sender=Task, dispatch_uid="dataset_rollups_task_saved")
+def refresh_rollups_on_task_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if created or raw:
+        return
+    if update_fields is not None and "name" not in update_fields:
+        return
+    refresh_dataset_rollups_on_commit(instance.datasets.values_list("id", flat=True))
+
+
+@receiver(pre_delete, sender=Task, dispatch_uid="dataset_rollups_task_deleting")
+@receiver(pre_delete, sender=Paper, dispatch_uid="dataset_rollups_paper_deleting")
+def remember_linked_datasets(sender, instance, **kwargs):
+    # The link rows are gone (without m2m_changed) by post_delete.
+    instance._rollup_dataset_ids = list(instance.datasets.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=Task, dispatch_uid="dataset_rollups_task_deleted")
+@receiver(post_delete, sender=Paper, dispatch_uid="dataset_rollups_paper_deleted")
+def refresh_rollups_on_delete(sender, instance, **kwargs):
+    refresh_dataset_rollups_on_commit(getattr(instance, "_rollup_dataset_ids", []))
+
+
+@receiver(post_save, sender=User, dispatch_uid="response_cache_user_created")
+def bust_stats_on_signup(sender, instance, created, **kwargs):
+    if created:
+        bust_tags("stats")
+
+
+@receiver(post_delete, sender=User, dispatch_uid="response_cache_user_deleted")
+def bust_stats_on_user_delete(sender, instance, **kwargs):
+    bust_tags("stats")
+
+
+# --- Dashboard rollups ------------------------------------------------------
+
+
+@receiver(post_save, sender=Paper, dispatch_uid="dashboard_rollups_paper_created")
+def count_created_paper(sender, instance, created, **kwargs):
+    if created:
+        adjust_papers([instance.pk], 1)
+
+
+@receiver(pre_delete, sender=Paper, dispatch_uid="dashboard_rollups_paper_deleting")
+def uncount_deleted_paper(sender, instance, **kwargs):
+    # The link rows are deleted (without m2m_changed) along with the paper.
+    adjust_papers([instance.pk], -1)
+    for rollup in (TASKS, DATASETS):
+        adjust_links(rollup, -1, paper_ids=[instance.pk])
+
+
+@receiver(m2m_changed, sender=Task.papers.through, dispatch_uid="dashboard_rollups_task_papers")
+@receiver(m2m_changed, sender=Dataset.papers.through, dispatch_uid="dashboard_rollups_dataset_papers")
+def count_paper_links(sender, instance, action, reverse, pk_set, **kwargs):
+    # Removals are counted before the link rows go; pre_clear has pk_set=None (any).
+    rollup = TASKS if sender is Task.papers.through else DATASETS
+    if isinstance(instance, Paper):
+        sides = {"paper_ids": [instance.pk], "target_ids": pk_set}
+    else:
+        sides = {"paper_ids": pk_set, "target_ids": [instance.pk]}
+    if action == "post_add":
+        adjust_links(rollup, 1, **sides)
+    elif action in ("pre_remove", "pre_clear"):
+        adjust_links(rollup, -1, **sides)
+
+
+# --- Site counters ----------------------------------------------------------
+
+
+@receiver(post_save, sender=Paper, dispatch_uid="site_counter_paper_added")
+@receiver(post_save, sender=User, dispatch_uid="site_counter_user_added")
+@receiver(post_save, sender=Dataset, dispatch_uid="site_counter_dataset_added")
+@receiver(post_save, sender=Conference, dispatch_uid="site_counter_conference_added")
+@receiver(post_save, sender=Journal, dispatch_uid="site_counter_journal_added")
+def count_site_row_added(sender, instance, created, **kwargs):
+    if created:
+        adjust_site_counter(counter_name(sender), 1)
+
+
+@receiver(post_delete, sender=Paper, dispatch_uid="site_counter_paper_removed")
+@receiver(post_delete, sender=User, dispatch_uid="site_counter_user_removed")
+@receiver(post_delete, sender=Dataset, dispatch_uid="site_counter_dataset_removed")
+@receiver(post_delete, sender=Conference, dispatch_uid="site_counter_conference_removed")
+@receiver(post_delete, sender=Journal, dispatch_uid="site_counter_journal_removed")
+def count_site_row_removed(sender, instance, **kwargs):
+    adjust_site_counter(counter_name(sender), -1)
+
+
+# --- Library counters -------------------------------------------------------
+
+
+@receiver(post_save, sender=InterestingPaper, dispatch_uid="library_counter_paper_added")
+@receiver(post_save, sender=InterestingDataset, dispatch_uid="library_counter_dataset_added")
+def count_library_item_added(sender, instance, created, raw=False, **kwargs):
+    # add_to_library reserves (and counts) its slot before inserting.
+    if created and not raw and not getattr(instance, "_library_counted", False):
+        adjust_library_counter(sender, instance.user_id, 1)
+
+
+@receiver(post_delete, sender=InterestingPaper, dispatch_uid="library_counter_paper_removed")
+@receiver(post_delete, sender=InterestingDataset, dispatch_uid="library_counter_dataset_removed")
+def count_library_item_removed(sender, instance, **kwargs):
+    adjust_library_counter(sender, instance.user_id, -1)
@@ -0,0 +1,78 @@
+"""
+Site-wide row counts for the home stats and venue counts endpoints.
+
+``site_counters`` holds one row per counted table. ``public_api.signals``
+adjusts it with an upsert from ``post_save`` (created) / ``post_delete``, which
+commits or rolls back with the surrounding transaction, so the endpoints read a
+handful of primary-key rows instead of running ``COUNT(*)`` over ``papers`` and
+friends. Both endpoints sit behind the response cache under the ``stats`` tag.
+
+``bulk_create()`` and raw SQL skip those signals and make the counters drift;
+``manage.py reconcile_site_counters`` (run it periodically, e.g. from cron)
+rewrites them from exact counts.
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth.models import User
+from django.db import connection
+
+from .models import Conference, Dataset, Journal, Paper, SiteCounter
+
+COUNTED_MODELS = {
+    "papers": Paper,
+    "users": User,
+    "datasets": Dataset,
+    "conferences": Conference,
+    "journals": Journal,
+}
+
+ADJUST_SQL = """
+INSERT INTO site_counters (name, value, updated_at) VALUES (%s, %s, now())
+ON CONFLICT (name) DO UPDATE
+SET value = site_counters.value + EXCLUDED.value, updated_at = EXCLUDED.updated_at
+"""
+
+RECONCILE_SQL = """
+INSERT INTO site_counters (name, value, updated_at)
+SELECT %s, COUNT(*), now() FROM {table}
+ON CONFLICT (name) DO UPDATE
+SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at
+WHERE site_counters.value IS DISTINCT FROM EXCLUDED.value
+"""
+
+
+def counter_name(model) -> str | None:
+    for name, counted in COUNTED_MODELS.items():
+        if model is counted:
+            return name
+    return None
+
+
+def adjust_site_counter(name: str, delta: int) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(ADJUST_SQL, [name, delta])
+
+
+def site_counts() -> dict[str, int]:
+    """``{name: count}`` for every counted table."""
+    counts = dict.fromkeys(COUNTED_MODELS, 0)
+    counts.update(
+        SiteCounter.objects.filter(name__in=COUNTED_MODELS).values_list("name", "value")
+    )
+    return counts
+
+
+def reconcile_site_counters() -> dict[str, tuple[int | None, int]]:
+    """Rewrite every counter from an exact COUNT; returns ``{name: (old, new)}`` for drifted ones."""
+    before = dict(SiteCounter.objects.values_list("name", "value"))
+    with connection.cursor() as cursor:
+        for name, model in COUNTED_MODELS.items():
+            table = connection.ops.quote_name(model._meta.db_table)
+            cursor.execute(RECONCILE_SQL.format(table=table), [name])
+    after = dict(SiteCounter.objects.values_list("name", "value"))
+    return {
+        name: (before.get(name), after[name])
+        for name in COUNTED_MODELS
+        if before.get(name) != after[name]
+    }
@@ -0,0 +1,36 @@
+"""
+Sparse fieldsets for list endpoints: ``?fields=a,b`` keeps only those keys,
+``?exclude=a,b`` drops them. ``id`` is always kept and unknown names are
+ignored, so clients can ask for fields a given endpoint does not have.
+"""
+
+from __future__ import annotations
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+def _names(raw) -> list[str]:
+    return [name.strip() for name in (raw or "").split(",") if name.strip()]
+
+
+def selected_fields(request, available) -> list[str] | None:
+    """
+    The subset of ``available`` chosen by the query string, in ``available``
+    order, or None when the request selects nothing (serve every field).
+    """
+    if request is None:
+        return None
+    params = getattr(request, "query_params", request.GET)
+    if FIELDS_PARAM not in params and EXCLUDE_PARAM not in params:
+        return None
+    wanted = set(_names(params.get(FIELDS_PARAM))) if FIELDS_PARAM in params else set(available)
+    wanted -= set(_names(params.get(EXCLUDE_PARAM)))
+    wanted.add("id")
+    return [name for name in available if name in wanted]
+
+
+def trim(item: dict, fields) -> dict:
+    if fields is None:
+        return item
+    return {name: item[name] for name in fields if name in item}
@@ -1,3 +1,1353 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import uuid
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework.throttling import ScopedRateThrottle
+
+from .models import (
+    Author,
+    Conference,
+    Dataset,
+    DatasetDailyRollup,
+    DatasetSimilarDataset,
+    DownloadedPaper,
+    InterestingDataset,
+    InterestingPaper,
+    Journal,
+    Paper,
+    PaperCard,
+    PaperDailyRollup,
+    PaperKeyword,
+    SiteCounter,
+    Task,
+    TaskDailyRollup,
+    UserLibraryCounter,
+)
+from . import paper_counters
+from .cursor_pagination import encode_cursor
+from .library_limits import MAX_INTERESTING_DATASETS
+from .list_counts import CountedPaginator, estimated_table_rows, list_count
+from .paper_detail import PAPER_BATCH_MAX
+from .serializers import PaperListSerializer
+from .services.recommendation_service import keyword_recommendation_ids
+from .site_counters import site_counts
+from .venue_counts import sync_paper_venue_counts
+
+
+def make_paper(index, **extra):
+    extra.setdefault("publication_date", date(2024, 1, 1 + index % 28))
+    extra.setdefault("abstract", "")
+    extra.setdefault("title", f"Paper {index}")
+    return Paper.objects.create(
+        url="https://example.com",
+        pdf_url="https://example.com",
+        **extra,
+    )
+
+
+class PaperListQueryCountTests(TestCase):
+    """List pages must not issue one query per paper (authors, venues, cards)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = Journal.objects.create(name="Journal of Testing")
+        cls.dataset = Dataset.objects.create(name="Test set", description="")
+        for index in range(25):
+            paper = make_paper(index, journal=cls.journal)
+            for suffix in ("A", "B"):
+                author = Author.objects.create(
+                    name=f"Author {index}{suffix}",
+                    email="author@example.com",
+                    affiliation="",
+                    bio="",
+                    google_scholar_url="https://example.com",
+                )
+                author.papers.add(paper)
+            cls.dataset.papers.add(paper)
+
+    def setUp(self):
+        # List totals are cached per filter signature; start each test cold.
+        cache.clear()
+        self.client = APIClient()
+
+    def assert_constant_queries(self, url, expected, params=None, sizes=(5, 20)):
+        for page_size in sizes:
+            with self.assertNumQueries(expected):
+                response = self.client.get(
+                    url, {**(params or {}), "pageSize": page_size}
+                )
+            self.assertEqual(response.status_code, 200)
+            cache.clear()
+        return response
+
+    def test_papers_list(self):
+        # Row estimate probe, COUNT, page joined to paper_card.
+        response = self.assert_constant_queries(reverse("public-papers-list"), 3)
+        self.assertEqual(len(response.data["results"][0]["authors"]), 2)
+
+    def test_papers_list_cursor_mode(self):
+        url = reverse("public-papers-list")
+        # NULL-date segment, dated segment.
+        self.assert_constant_queries(url, 2, params={"cursor": ""})
+
+    def test_journal_papers(self):
+        url = reverse("api-journal-papers", args=[self.journal.id])
+        # Journal lookup, COUNT, page joined to paper_card.
+        self.assert_constant_queries(url, 3)
+
+    def test_dataset_detail_related_papers(self):
+        url = reverse("api-dataset-detail", args=[self.dataset.id])
+        # Version probe, dataset, related papers page, their authors, similar datasets.
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["relatedPapers"]), 20)
+        self.assertEqual(len(response.data["relatedPapers"][0]["authors"]), 2)
+        cursor = response.data["relatedPapersPagination"]["nextCursor"]
+
+        url = reverse("api-dataset-papers", args=[self.dataset.id])
+        # Dataset lookup, papers page, authors.
+        with self.assertNumQueries(3):
+            rest = self.client.get(url, {"cursor": cursor}).data
+        self.assertEqual(len(rest["results"]), 5)
+        self.assertIsNone(rest["pagination"]["nextCursor"])
+        seen = {item["id"] for item in response.data["relatedPapers"] + rest["results"]}
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(self.client.get(url, {"cursor": "bad"}).status_code, 400)
+
+        response = self.client.get(url, {"pageSize": 1000})
+        self.assertEqual(response.data["pagination"]["pageSize"], 100)
+        self.assertEqual(len(response.data["results"]), 25)
+
+    def test_paper_edit_busts_dataset_detail(self):
+        url = reverse("api-dataset-detail", args=[self.dataset.id])
+        self.client.get(url)
+        paper = self.dataset.papers.order_by("-created_at").first()
+        with self.captureOnCommitCallbacks(execute=True):
+            paper.title = "Retitled paper"
+            paper.save()
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["relatedPapers"][0]["title"], "Retitled paper")
+
+
+class PaperCardTests(TestCase):
+    """paper_card payloads follow edits to papers, authors and venues."""
+
+    def setUp(self):
+        cache.clear()
+        self.journal = Journal.objects.create(name="Journal of Cards", quartile="Q2")
+        self.paper = make_paper(1, journal=self.journal)
+        self.author = Author.objects.create(
+            name="Ada",
+            email="ada@example.com",
+            affiliation="",
+            bio="",
+            google_scholar_url="https://example.com",
+        )
+        self.author.papers.add(self.paper)
+
+    def card(self):
+        return PaperCard.objects.get(paper=self.paper).payload
+
+    def test_card_matches_serializer(self):
+        response = self.client.get(reverse("public-papers-list"))
+        paper = Paper.objects.get(pk=self.paper.pk)
+        live = JSONRenderer().render(PaperListSerializer(paper).data)
+        self.assertEqual(response.json()["results"][0], json.loads(live))
+
+    def test_author_and_paper_edits_refresh_card(self):
+        self.author.name = "Ada Lovelace"
+        self.author.save()
+        self.paper.title = "Renamed"
+        self.paper.save()
+        self.assertEqual(self.card()["authors"], ["Ada Lovelace"])
+        self.assertEqual(self.card()["title"], "Renamed")
+
+        self.paper.authors.clear()
+        self.assertEqual(self.card()["authors"], ["Unknown"])
+
+    def test_venue_edit_and_delete_refresh_card(self):
+        self.journal.quartile = "Q1"
+        self.journal.save()
+        self.assertEqual(self.card()["quartile"], "Q1")
+        self.assertEqual(self.card()["venue"]["rank"], "Q1")
+
+        self.journal.delete()
+        self.assertIsNone(self.card()["venue"])
+
+    def test_missing_card_is_rendered_on_read(self):
+        PaperCard.objects.all().delete()
+        response = self.client.get(reverse("public-papers-list"))
+        self.assertEqual(response.json()["results"][0]["title"], "Paper 1")
+        self.assertTrue(PaperCard.objects.filter(paper=self.paper).exists())
+
+
+class ResponseCacheTests(TestCase):
+    """Anonymous GETs are cached until a tag they depend on is busted."""
+
+    def setUp(self):
+        cache.clear()
+        self.journal = Journal.objects.create(name="Cached Journal")
+        self.paper = make_paper(1, journal=self.journal)
+        self.client = APIClient()
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_repeat_request_is_served_from_cache(self):
+        url = reverse("public-papers-list")
+        self.assertEqual(self.get(url)["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(url)["X-Cache"], "HIT")
+        self.assertEqual(self.get(url + "?page=1")["X-Cache"], "MISS")
+
+    def test_paper_save_busts_list_detail_and_venue_pages(self):
+        urls = [
+            reverse("public-papers-list"),
+            reverse("api-paper-detail", args=[self.paper.id]),
+            reverse("api-journal-papers", args=[self.journal.id]),
+        ]
+        for url in urls:
+            self.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.paper.title = "Edited"
+            self.paper.save()
+            # Busts wait for the commit, so a concurrent GET cannot store the
+            # pre-commit rows under the new tag version.
+            self.assertEqual(self.get(urls[0])["X-Cache"], "HIT")
+        for url in urls:
+            response = self.get(url)
+            self.assertEqual(response["X-Cache"], "MISS")
+            self.assertIn("Edited", response.content.decode())
+
+    def test_venue_edit_busts_venue_lists(self):
+        url = reverse("api-journals-list")
+        self.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.journal.name = "Renamed Journal"
+            self.journal.save()
+        response = self.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn("Renamed Journal", response.content.decode())
+
+    def test_rolled_back_write_keeps_cache(self):
+        url = reverse("public-papers-list")
+        self.get(url)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                self.paper.title = "Rolled back"
+                self.paper.save()
+                raise IntegrityError
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.get(url)["X-Cache"], "HIT")
+
+    def test_requests_with_credentials_bypass_cache(self):
+        url = reverse("public-papers-list")
+        self.get(url)
+        response = self.client.get(url, HTTP_AUTHORIZATION="Token nope")
+        self.assertNotIn("X-Cache", response)
+
+    @override_settings(INTERNAL_VENUE_MAP_KEY="secret")
+    def test_stats_endpoint(self):
+        url = reverse("public-papers-list")
+        self.get(url)
+        self.get(url)
+        stats_url = reverse("api-response-cache-stats")
+        self.assertEqual(self.client.get(stats_url).status_code, 403)
+        stats = self.client.get(stats_url, HTTP_X_INTERNAL_KEY="secret").json()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+
+class ConditionalDetailTests(TestCase):
+    """Detail endpoints send validators and answer matching revalidations with 304."""
+
+    def setUp(self):
+        cache.clear()
+        self.journal = Journal.objects.create(name="Conditional Journal")
+        self.paper = make_paper(1, journal=self.journal)
+        self.dataset = Dataset.objects.create(name="Conditional Dataset")
+        self.dataset.papers.add(self.paper)
+        self.client = APIClient()
+
+    def test_matching_etag_gets_304_from_view_and_cache(self):
+        url = reverse("api-paper-detail", args=[self.paper.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+        self.assertIn("must-revalidate", response["Cache-Control"])
+        self.assertIn("Authorization", response["Vary"])
+        etag = response["ETag"]
+
+        # Served from the response cache, which replays the validators.
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual((response.status_code, response["X-Cache"]), (304, "HIT"))
+
+        cache.clear()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_changes_with_related_rows(self):
+        url = reverse("api-paper-detail", args=[self.paper.id])
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.paper.authors.add(Author.objects.create(name="New Author"))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_venue_and_dataset_details(self):
+        for url in (
+            reverse("api-journal-detail", args=[self.journal.id]),
+            reverse("api-dataset-detail", args=[self.dataset.id]),
+        ):
+            etag = self.client.get(url)["ETag"]
+            cache.clear()
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        url = reverse("api-dataset-detail", args=[self.dataset.id])
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dataset.papers.remove(self.paper)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_missing_object_has_no_validators(self):
+        url = reverse("api-journal-detail", args=["00000000-0000-0000-0000-000000000000"])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("ETag", response)
+
+
+class PaperBatchTests(TestCase):
+    """POST /api/papers/batch/ returns detail payloads in a fixed number of queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = Journal.objects.create(name="Batch Journal")
+        task = Task.objects.create(name="Batch Task")
+        cls.papers = []
+        # Dataset rollups are recomputed on commit.
+        with cls.captureOnCommitCallbacks(execute=True):
+            for index in range(6):
+                paper = make_paper(index, journal=cls.journal)
+                paper.authors.add(*[Author.objects.create(name=f"A{index}-{n}") for n in range(2)])
+                for n in range(3):
+                    dataset = Dataset.objects.create(name=f"D{index}-{n}")
+                    dataset.tasks.add(task)
+                    dataset.papers.add(paper)
+                cls.papers.append(paper)
+        cls.user = get_user_model().objects.create_user(
+            username="batch", email="batch@example.com", password="x"
+        )
+        InterestingPaper.objects.create(user=cls.user, paper=cls.papers[2])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("api-papers-batch")
+
+    def post(self, ids):
+        return self.client.post(self.url, {"ids": [str(i) for i in ids]}, format="json")
+
+    def test_results_in_request_order_with_missing_ids(self):
+        unknown = "00000000-0000-0000-0000-000000000000"
+        ids = [self.papers[3].id, unknown, self.papers[0].id]
+        # Papers (+ venues), authors, datasets (task names are a column).
+        with self.assertNumQueries(3):
+            response = self.post(ids)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [str(self.papers[3].id), str(self.papers[0].id)],
+        )
+        self.assertEqual(response.data["missing"], [unknown])
+        first = response.data["results"][0]
+        self.assertEqual(len(first["datasets"]), 3)
+        self.assertEqual(first["datasets"][0]["category"], ["Batch Task"])
+
+    def test_user_flags_do_not_add_queries(self):
+        self.client.force_authenticate(self.user)
+        with self.assertNumQueries(3):
+            response = self.post([paper.id for paper in self.papers])
+        flags = [item["is_interesting"] for item in response.data["results"]]
+        self.assertEqual(flags, [False, False, True, False, False, False])
+
+    def test_detail_view_uses_the_same_plan(self):
+        self.client.force_authenticate(self.user)
+        url = reverse("api-paper-detail", args=[self.papers[2].id])
+        # Version probe, then papers (+ venues, flags), authors, datasets.
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertTrue(response.data["is_interesting"])
+        self.assertEqual(response.data["venue"]["name"], "Batch Journal")
+        self.assertEqual(len(response.data["datasets"]), 3)
+
+    def test_rejects_bad_and_oversized_input(self):
+        self.assertEqual(self.post(["nope"]).status_code, 400)
+        response = self.client.post(self.url, {"ids": "x"}, format="json")
+        self.assertEqual(response.data["code"], "INVALID_PAPER_IDS")
+        too_many = [uuid.uuid4() for _ in range(PAPER_BATCH_MAX + 1)]
+        self.assertEqual(self.post(too_many).data["code"], "TOO_MANY_PAPER_IDS")
+
+
+@mock.patch.object(paper_counters, "PAPER_COUNTER_FLUSH_INTERVAL", 0)
+class PaperCounterTests(TestCase):
+    """View/download hits are buffered and applied in one bulk UPDATE."""
+
+    def setUp(self):
+        cache.clear()
+        paper_counters._take_pending()
+        self.papers = [make_paper(index) for index in range(3)]
+        self.client = APIClient()
+
+    def test_view_hits_are_buffered_then_flushed_in_one_query(self):
+        url = reverse("api-paper-view", args=[self.papers[0].id])
+        with self.assertNumQueries(0):
+            for address in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+                response = self.client.post(url, REMOTE_ADDR=address)
+                self.assertEqual(response.status_code, 202)
+        paper_counters.record_view(self.papers[1].id)
+        paper_counters.record_download(self.papers[1].id)
+        paper_counters.record_view(uuid.uuid4())
+        updated_at = Paper.objects.get(id=self.papers[0].id).updated_at
+
+        with self.assertNumQueries(1):
+            self.assertEqual(paper_counters.flush_paper_counters(), 2)
+
+        counts = dict(
+            Paper.objects.values_list("id", "views_count").filter(
+                id__in=[paper.id for paper in self.papers]
+            )
+        )
+        self.assertEqual([counts[paper.id] for paper in self.papers], [3, 1, 0])
+        self.assertEqual(Paper.objects.get(id=self.papers[0].id).updated_at, updated_at)
+        self.assertEqual(Paper.objects.get(id=self.papers[1].id).download_count, 1)
+        self.assertEqual(paper_counters.flush_paper_counters(), 0)
+
+    def test_repeat_views_are_deduplicated_and_throttled(self):
+        url = reverse("api-paper-view", args=[self.papers[0].id])
+        self.assertTrue(self.client.post(url).data["queued"])
+        self.assertFalse(self.client.post(url).data["queued"])
+        user = get_user_model().objects.create_user(username="viewer", password="pw")
+        self.client.force_authenticate(user)
+        self.assertTrue(self.client.post(url).data["queued"])
+        pending = paper_counters.pending_counts()[paper_counters.VIEWS]
+        self.assertEqual(pending, {str(self.papers[0].id): 2})
+
+        self.client.force_authenticate(None)
+        with mock.patch.dict(ScopedRateThrottle.THROTTLE_RATES, {"paper_view": "2/min"}):
+            statuses = [
+                self.client.post(url, REMOTE_ADDR="10.0.0.9").status_code for _ in range(3)
+            ]
+        self.assertEqual(statuses, [202, 202, 429])
+
+
+class LibraryQueryCountTests(TestCase):
+    """Library lists read annotated flags instead of two EXISTS per row."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="library", email="library@example.com", password="x"
+        )
+        papers = [make_paper(index) for index in range(8)]
+        for paper in papers[:5]:
+            paper.authors.add(Author.objects.create(name=f"Author {paper.title}"))
+            InterestingPaper.objects.create(user=cls.user, paper=paper)
+        for paper in papers[3:]:
+            DownloadedPaper.objects.create(user=cls.user, paper=paper)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get(self, url):
+        # Library rows (+ papers, venues, flags), then authors.
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_interesting_section(self):
+        items = self.get(reverse("api-my-library"))
+        self.assertEqual(len(items), 5)
+        self.assertTrue(all(item["is_interesting"] for item in items))
+        self.assertEqual(sum(item["is_downloaded"] for item in items), 2)
+
+    def test_downloaded_papers(self):
+        items = self.get(reverse("api-downloaded-papers"))
+        self.assertEqual(len(items), 5)
+        self.assertEqual(sum(item["is_interesting"] for item in items), 2)
+
+
+class LibraryCounterTests(TestCase):
+    """Library limits are enforced from per-user counters."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="counter", email="counter@example.com", password="x"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def counter(self):
+        return UserLibraryCounter.objects.get(user=self.user)
+
+    def star_dataset(self, dataset):
+        url = reverse("api-mark-dataset-interesting", args=[dataset.id])
+        return self.client.post(url)
+
+    def test_limit_is_enforced_and_removals_free_a_slot(self):
+        datasets = [
+            Dataset.objects.create(name=f"Dataset {n}")
+            for n in range(MAX_INTERESTING_DATASETS + 1)
+        ]
+        for dataset in datasets[:-1]:
+            self.assertEqual(self.star_dataset(dataset).status_code, 201)
+        # Starring an item already in the library is still fine.
+        self.assertEqual(self.star_dataset(datasets[0]).status_code, 200)
+        response = self.star_dataset(datasets[-1])
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data["code"], "LIBRARY_LIMIT_REACHED")
+        self.assertEqual(self.counter().interesting_datasets, MAX_INTERESTING_DATASETS)
+
+        url = reverse("api-unmark-dataset-interesting", args=[datasets[0].id])
+        self.assertEqual(self.client.delete(url).status_code, 200)
+        self.assertEqual(self.star_dataset(datasets[-1]).status_code, 201)
+
+    def test_counter_follows_direct_inserts_and_cascades(self):
+        papers = [make_paper(index) for index in range(3)]
+        url = reverse("api-mark-paper-interesting", args=[papers[0].id])
+        self.assertEqual(self.client.post(url).status_code, 201)
+        InterestingPaper.objects.create(user=self.user, paper=papers[1])
+        self.assertEqual(self.counter().interesting_papers, 2)
+        papers[0].delete()
+        self.assertEqual(self.counter().interesting_papers, 1)
+
+    def test_reconcile_command_fixes_drift(self):
+        InterestingPaper.objects.create(user=self.user, paper=make_paper(1))
+        UserLibraryCounter.objects.create(user=self.user, interesting_papers=7)
+        call_command("reconcile_library_counters", "--dry-run", stdout=io.StringIO())
+        self.assertEqual(self.counter().interesting_papers, 7)
+        call_command("reconcile_library_counters", stdout=io.StringIO())
+        self.assertEqual(self.counter().interesting_papers, 1)
+
+
+class InterestingDatasetsTests(TestCase):
+    """Bookmarked datasets come from one join, ordered by bookmark time."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="bookmarks", email="bookmarks@example.com", password="x"
+        )
+        task = Task.objects.create(name="Bookmarked Task")
+        paper = make_paper(1)
+        cls.datasets = []
+        # Dataset rollups are recomputed on commit.
+        with cls.captureOnCommitCallbacks(execute=True):
+            for n in range(5):
+                dataset = Dataset.objects.create(name=f"Bookmarked {n}")
+                dataset.tasks.add(task)
+                dataset.papers.add(paper)
+                InterestingDataset.objects.create(user=cls.user, dataset=dataset)
+                cls.datasets.append(dataset)
+        Dataset.objects.create(name="Not bookmarked")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("api-interesting-datasets")
+
+    def test_page_mode(self):
+        # COUNT, joined page.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"pageSize": 3})
+        results = response.data["results"]
+        self.assertEqual(
+            [item["name"] for item in results], ["Bookmarked 4", "Bookmarked 3", "Bookmarked 2"]
+        )
+        self.assertEqual(response.data["pagination"]["totalItems"], 5)
+        self.assertEqual(results[0]["paperCount"], 1)
+        self.assertEqual(results[0]["tasks"], ["Bookmarked Task"])
+        self.assertTrue(all(item["isStarred"] for item in results))
+
+    def test_cursor_mode(self):
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url, {"cursor": "", "pageSize": 3}).data
+        cursor = first["pagination"]["nextCursor"]
+        second = self.client.get(self.url, {"cursor": cursor, "pageSize": 3}).data
+        names = [item["name"] for item in first["results"] + second["results"]]
+        self.assertEqual(names, [f"Bookmarked {n}" for n in range(4, -1, -1)])
+        self.assertIsNone(second["pagination"]["nextCursor"])
+        response = self.client.get(self.url, {"cursor": "nope"})
+        self.assertEqual(response.status_code, 400)
+
+
+class DatasetRollupTests(TestCase):
+    """Dataset.paper_count / task_names follow the M2M links."""
+
+    def setUp(self):
+        self.dataset = Dataset.objects.create(name="Rolled up")
+        self.papers = [make_paper(index) for index in range(3)]
+
+    def rollup(self):
+        self.dataset.refresh_from_db()
+        return self.dataset.paper_count, self.dataset.task_names
+
+    def test_links_from_either_side(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dataset.papers.add(*self.papers)
+            self.papers[0].datasets.remove(self.dataset)
+            b_task = Task.objects.create(name="B task")
+            b_task.datasets.add(self.dataset)
+            self.dataset.tasks.add(Task.objects.create(name="A task"))
+            # Recounts wait for the commit so they see concurrent writers' links.
+            self.assertEqual(self.rollup(), (0, []))
+        self.assertEqual(self.rollup(), (2, ["A task", "B task"]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            b_task.name = "C task"
+            b_task.save()
+            self.papers[1].delete()
+        self.assertEqual(self.rollup(), (1, ["A task", "C task"]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.papers[2].datasets.clear()
+            self.dataset.tasks.clear()
+        self.assertEqual(self.rollup(), (0, []))
+
+    def test_refresh_command_repairs_drift(self):
+        self.dataset.papers.add(*self.papers)
+        Dataset.objects.filter(id=self.dataset.id).update(paper_count=99, task_names=["Stale"])
+        call_command("refresh_dataset_rollups", stdout=io.StringIO())
+        self.assertEqual(self.rollup(), (3, []))
+
+
+class SimilarDatasetsCommandTests(TestCase):
+    """generate_similar_datasets ranks by shared papers, tasks and category."""
+
+    def test_ranking_and_replacement(self):
+        base, twin, cousin, stranger = [
+            Dataset.objects.create(name=name, data_type=category)
+            for name, category in (
+                ("Base", "Images"),
+                ("Twin", "Text"),
+                ("Cousin", "Images"),
+                ("Stranger", "Audio"),
+            )
+        ]
+        papers = [make_paper(index) for index in range(3)]
+        base.papers.add(*papers)
+        twin.papers.add(*papers)
+        task = Task.objects.create(name="Shared task")
+        task.datasets.add(base, cousin)
+        DatasetSimilarDataset.objects.create(from_dataset=base, to_dataset=stranger)
+
+        call_command("generate_similar_datasets", "--top-k", "2", stdout=io.StringIO())
+
+        ranked = list(
+            DatasetSimilarDataset.objects.filter(from_dataset=base)
+            .order_by("id")
+            .values_list("to_dataset__name", flat=True)
+        )
+        self.assertEqual(ranked, ["Twin", "Cousin"])
+        self.assertFalse(DatasetSimilarDataset.objects.filter(from_dataset=stranger).exists())
+
+        url = reverse("api-dataset-detail", args=[base.id])
+        similar = self.client.get(url).data["similarDatasets"]
+        self.assertEqual([item["name"] for item in similar], ["Twin", "Cousin"])
+
+
+class VenuePaperCountTests(TestCase):
+    """Journal/Conference.papers_count follow paper saves, moves and bulk applies."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.journal = Journal.objects.create(name="Counted Journal")
+        self.other = Journal.objects.create(name="Busy Journal")
+        self.conference = Conference.objects.create(name="Counted Conference")
+
+    def counts(self):
+        return [
+            venue.__class__.objects.get(id=venue.id).papers_count
+            for venue in (self.journal, self.other, self.conference)
+        ]
+
+    def test_paper_save_move_and_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            paper = make_paper(1, journal=self.journal)
+            make_paper(2, journal=self.other)
+            make_paper(3, journal=self.other)
+            # Recounts wait for the commit so they see concurrent writers' rows.
+            self.assertEqual(self.counts(), [0, 0, 0])
+        self.assertEqual(self.counts(), [1, 2, 0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            paper.journal = None
+            paper.conference = self.conference
+            paper.save()
+        self.assertEqual(self.counts(), [0, 2, 1])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            paper.delete()
+        self.assertEqual(self.counts(), [0, 2, 0])
+
+    def test_bulk_apply_and_recompute_command(self):
+        make_paper(1)
+        make_paper(2, journal=self.journal)
+        papers = list(Paper.objects.order_by("title"))
+        for paper in papers:
+            paper.journal_id = self.other.id
+        Paper.objects.bulk_update(papers, ["journal_id"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(sync_paper_venue_counts(papers), 2)
+        self.assertEqual(self.counts(), [0, 2, 0])
+
+        Journal.objects.filter(id=self.journal.id).update(papers_count=7)
+        call_command("refresh_venue_counts", stdout=io.StringIO())
+        self.assertEqual(self.counts(), [0, 2, 0])
+
+    def test_lists_read_and_sort_by_count(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_paper(1, journal=self.other)
+            make_paper(2, conference=self.conference)
+        url = reverse("api-journals-list")
+        # Row estimate, exact COUNT, the page; no per-row paper COUNT.
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {"sortBy": "papersCount"})
+        self.assertEqual(
+            [(row["name"], row["papersCount"]) for row in response.data["results"]],
+            [("Busy Journal", 1), ("Counted Journal", 0)],
+        )
+
+        response = self.client.get(reverse("api-conferences-list"))
+        self.assertEqual(response.data["results"][0]["papersCount"], 1)
+        response = self.client.get(reverse("api-journal-detail", args=[self.other.id]))
+        self.assertEqual(response.data["papersCount"], 1)
+
+
+class VenueTierOrderTests(TestCase):
+    """Venue lists order on the stored rank_order / quartile_order columns."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_conference_rank_normalized_on_save(self):
+        conference = Conference.objects.create(name="Spaced", rank=" B ")
+        Conference.objects.create(name="Legacy", rank="Not ranked")
+        conference.refresh_from_db()
+        self.assertEqual((conference.rank, conference.rank_order), ("B", 2))
+        self.assertEqual(
+            list(Conference.objects.filter(rank="").values_list("name", "rank_order")),
+            [("Legacy", 99)],
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Conference.objects.filter(id=conference.id).update(rank="Top")
+
+    def test_lists_order_without_case_expressions(self):
+        for name, rank in (("Zeta", "A"), ("Alpha", "C"), ("Beta", "A*"), ("Gamma", "")):
+            Conference.objects.create(name=name, rank=rank)
+        for name, quartile in (("J2", "Q2"), ("J0", ""), ("J1", "Q1")):
+            Journal.objects.create(name=name, quartile=quartile)
+
+        with CaptureQueriesContext(connection) as queries:
+            conferences = self.client.get(reverse("api-conferences-list")).data["results"]
+            journals = self.client.get(reverse("api-journals-list")).data["results"]
+        self.assertEqual([row["name"] for row in conferences], ["Beta", "Zeta", "Alpha", "Gamma"])
+        self.assertEqual([row["name"] for row in journals], ["J1", "J2", "J0"])
+        self.assertFalse(any("CASE" in query["sql"] for query in queries.captured_queries))
+
+        response = self.client.get(reverse("api-conferences-list"), {"rank": "unranked"})
+        self.assertEqual([row["name"] for row in response.data["results"]], ["Gamma"])
+
+
+class DashboardRollupTests(TestCase):
+    """Daily rollups follow paper and link changes and feed /api/dashboard/."""
+
+    def setUp(self):
+        self.papers = [make_paper(index) for index in range(4)]
+        self.task = Task.objects.create(name="Rolled task")
+        self.other_task = Task.objects.create(name="Quiet task")
+        self.dataset = Dataset.objects.create(name="Rolled dataset")
+
+    def snapshot(self):
+        return {
+            model.__name__: sorted(
+                row
+                for row in model.objects.values_list(*fields, "paper_count")
+                if row[-1]
+            )
+            for model, fields in (
+                (PaperDailyRollup, ("day",)),
+                (TaskDailyRollup, ("day", "task_id")),
+                (DatasetDailyRollup, ("day", "dataset_id")),
+            )
+        }
+
+    def test_incremental_matches_rebuild(self):
+        self.task.papers.add(*self.papers)
+        self.papers[0].tasks.add(self.other_task)
+        self.papers[1].tasks.remove(self.task)
+        self.dataset.papers.add(*self.papers[:3])
+        self.papers[2].datasets.clear()
+        self.papers[3].delete()
+        incremental = self.snapshot()
+
+        call_command("rebuild_dashboard_rollups", stdout=io.StringIO())
+        self.assertEqual(self.snapshot(), incremental)
+        today = timezone.localdate()
+        self.assertEqual(incremental["PaperDailyRollup"], [(today, 3)])
+        self.assertEqual(
+            incremental["TaskDailyRollup"],
+            sorted([(today, self.task.id, 2), (today, self.other_task.id, 1)]),
+        )
+        self.assertEqual(incremental["DatasetDailyRollup"], [(today, self.dataset.id, 2)])
+
+    def test_dashboard_sums_rollups(self):
+        self.task.papers.add(*self.papers[:3])
+        self.other_task.papers.add(self.papers[0])
+        self.dataset.papers.add(self.papers[1])
+        today = timezone.localdate().isoformat()
+        # Paper days, dataset COUNT, per-dataset sums, per-task sums.
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse("public-dashboard"),
+                {"startDate": today, "endDate": today, "period": "monthly"},
+            )
+        self.assertEqual(response.data["paper_count"], 4)
+        self.assertEqual(response.data["paper_count_detail"][0]["count"], 4)
+        self.assertEqual(
+            [(row["name"], row["filtered_paper_count"]) for row in response.data["papers_per_task"]],
+            [("Rolled task", 3), ("Quiet task", 1)],
+        )
+        self.assertEqual(response.data["trending_tasks"][0]["name"], "Rolled task")
+        self.assertEqual(response.data["papers_per_dataset"][0]["filtered_paper_count"], 1)
+
+
+class SiteCounterTests(TestCase):
+    """Home stats and venue counts read site_counters, not COUNT(*)."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_counters_follow_inserts_and_deletes(self):
+        Journal.objects.create(name="Counted Journal")
+        Conference.objects.create(name="Counted Conference")
+        Dataset.objects.create(name="Counted dataset")
+        get_user_model().objects.create_user(username="counted", password="pw")
+        papers = [make_paper(index) for index in range(3)]
+        papers[0].delete()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("api-venues-counts"))
+        self.assertEqual(response.data, {"conferencesCount": 1, "journalsCount": 1})
+        # Served from the response cache until a counted row commits.
+        with self.assertNumQueries(0):
+            self.client.get(reverse("api-venues-counts"))
+        with self.captureOnCommitCallbacks(execute=True):
+            Journal.objects.create(name="Another Journal")
+        response = self.client.get(reverse("api-venues-counts"))
+        self.assertEqual(response.json()["journalsCount"], 2)
+
+        response = self.client.get(reverse("api-home-stats"))
+        self.assertEqual(
+            response.data,
+            {"totalPapers": 2, "totalUsers": 1, "totalDatasets": 1, "totalVenues": 3},
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            get_user_model().objects.get(username="counted").delete()
+        response = self.client.get(reverse("api-home-stats"))
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["totalUsers"], 0)
+
+    def test_reconcile_repairs_drift(self):
+        make_paper(1)
+        SiteCounter.objects.filter(name="papers").update(value=42)
+        out = io.StringIO()
+        call_command("reconcile_site_counters", stdout=out)
+        self.assertIn("papers: 42 -> 1", out.getvalue())
+        self.assertEqual(site_counts()["papers"], 1)
+
+
+class PaperKeywordIndexTests(TestCase):
+    """paper_keyword follows Paper.keywords and drives keyword recommendations."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="reader", password="pw")
+        self.both = make_paper(1, keywords=["Graph Learning", "NLP"])
+        self.encoded = make_paper(2, keywords='["graph learning", "Vision"]')
+        self.comma = make_paper(3, keywords="nlp,  Robotics ")
+        self.starred = make_paper(4, keywords=["NLP"])
+        self.old = make_paper(5, keywords=["nlp", "graph learning"])
+        InterestingPaper.objects.create(user=self.user, paper=self.starred)
+        Paper.objects.filter(id=self.old.id).update(
+            created_at=timezone.now() - timedelta(days=90)
+        )
+
+    def keywords(self, paper):
+        return sorted(PaperKeyword.objects.filter(paper=paper).values_list("keyword", flat=True))
+
+    def test_index_normalizes_and_follows_writes(self):
+        self.assertEqual(self.keywords(self.encoded), ["graph learning", "vision"])
+        self.assertEqual(self.keywords(self.comma), ["nlp", "robotics"])
+
+        self.comma.keywords = ["Vision"]
+        self.comma.save()
+        self.assertEqual(self.keywords(self.comma), ["vision"])
+        self.comma.delete()
+        self.assertFalse(PaperKeyword.objects.filter(paper_id=self.comma.id).exists())
+
+        PaperKeyword.objects.all().delete()
+        call_command("backfill_paper_keywords", stdout=io.StringIO())
+        self.assertEqual(self.keywords(self.both), ["graph learning", "nlp"])
+
+    def test_recommendations_rank_by_overlap_in_sql(self):
+        with self.assertNumQueries(1):
+            ids = keyword_recommendation_ids(self.user, {"graph learning", "nlp"})
+        self.assertEqual(ids[0], self.both.id)
+        self.assertEqual(set(ids), {self.both.id, self.encoded.id, self.comma.id})
+
+
+class ListCountTests(TestCase):
+    """totalItems comes from the planner estimate or a cached exact COUNT."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = Journal.objects.create(name="Counted Journal")
+        for index in range(6):
+            make_paper(index, journal=cls.journal if index % 2 else None)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("public-papers-list")
+
+    def pagination(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["pagination"]
+
+    def test_unfiltered_list_uses_estimate(self):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE papers")
+        self.assertEqual(estimated_table_rows(Paper), 6)
+        with mock.patch("public_api.list_counts.LIST_COUNT_ESTIMATE_MIN_ROWS", 5):
+            with self.assertNumQueries(1):
+                total, exact = list_count(Paper.objects.all(), scope="papers")
+            self.assertEqual((total, exact), (6, False))
+            # Estimate probe and page; no COUNT.
+            with self.assertNumQueries(2):
+                pagination = self.pagination()
+        self.assertEqual(pagination["totalItems"], 6)
+        self.assertFalse(pagination["totalItemsExact"])
+
+        # Small tables get an exact count instead.
+        cache.clear()
+        self.assertTrue(self.pagination()["totalItemsExact"])
+
+    def test_filtered_count_is_cached_per_signature(self):
+        venue = {"venue_id": str(self.journal.id)}
+        # COUNT, page.
+        with self.assertNumQueries(2):
+            pagination = self.pagination(**venue)
+        self.assertEqual((pagination["totalItems"], pagination["totalItemsExact"]), (3, True))
+
+        # Same filter: the cached total is reused (and may lag new rows).
+        make_paper(7, journal=self.journal)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.pagination(**venue, pageSize=2)["totalItems"], 3)
+
+        # A different filter, or a different scope, counts on its own.
+        with self.assertNumQueries(2):
+            self.assertEqual(self.pagination(venueType="journal")["totalItems"], 4)
+        papers = Paper.objects.filter(journal=self.journal)
+        self.assertEqual(list_count(papers, scope="papers"), (4, True))
+        make_paper(8, journal=self.journal)
+        self.assertEqual(list_count(papers, scope="papers"), (4, True))
+        self.assertEqual(list_count(papers, scope="other"), (5, True))
+        self.assertEqual(list_count(Paper.objects.none(), scope="papers"), (0, True))
+
+    def test_out_of_range_page_is_empty(self):
+        response = self.client.get(self.url, {"page": 5, "pageSize": 5})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["pagination"]["totalPages"], 2)
+
+        paginator = CountedPaginator(Paper.objects.order_by("id"), 5, 6)
+        self.assertEqual(len(paginator.page(2)), 1)
+        with self.assertRaises(EmptyPage):
+            paginator.page(0)
+        with self.assertRaises(PageNotAnInteger):
+            paginator.page("x")
+
+
+class VenueSearchTests(TestCase):
+    """Venue name filters resolve venue ids first; fuzzy mode tolerates typos."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = Journal.objects.create(
+            name="Journal of Machine Learning Research", abbreviation="JMLR"
+        )
+        cls.conference = Conference.objects.create(
+            name="Neural Information Processing Systems", abbreviation="NeurIPS"
+        )
+        Journal.objects.create(name="Pattern Recognition")
+        cls.in_journal = make_paper(1, journal=cls.journal)
+        cls.at_conference = make_paper(2, conference=cls.conference)
+        make_paper(3)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("public-papers-list")
+
+    def paper_ids(self, **params):
+        return {item["id"] for item in self.client.get(self.url, params).json()["results"]}
+
+    def test_papers_filter_on_venue_ids(self):
+        # COUNT, page; the venue lookups are nested subqueries, not id lists.
+        with CaptureQueriesContext(connection) as queries:
+            ids = self.paper_ids(venue="machine learning")
+        self.assertEqual(len(queries), 2)
+        self.assertIn('"journal_id" IN (SELECT', queries[0]["sql"])
+        self.assertEqual(ids, {str(self.in_journal.id)})
+        self.assertEqual(self.paper_ids(venue="information"), {str(self.at_conference.id)})
+
+        # Exact mode is a substring match, so a typo finds nothing.
+        typo = "Neural Informaton Procesing Systms"
+        self.assertEqual(self.paper_ids(venue=typo), set())
+        self.assertEqual(
+            self.paper_ids(venue=typo, venueMatch="fuzzy"),
+            {str(self.at_conference.id)},
+        )
+
+    def test_no_matching_venue(self):
+        response = self.client.get(self.url, {"venue": "Nonexistent Venue"})
+        self.assertEqual(response.json()["results"], [])
+        self.assertEqual(response.json()["pagination"]["totalItems"], 0)
+
+        # Fuzzy: journal ids, conference ids; the empty queryset needs no COUNT or page.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                self.url, {"venue": "Nonexistent Venue", "venueMatch": "fuzzy"}
+            )
+        self.assertEqual(response.json()["results"], [])
+
+    def test_fuzzy_venue_lists(self):
+        url = reverse("api-journals-list")
+        typo = "Jurnal of Machine Lerning Reserch"
+        results = self.client.get(url, {"search": typo, "venueMatch": "fuzzy"}).json()["results"]
+        self.assertEqual(
+            [item["name"] for item in results], ["Journal of Machine Learning Research"]
+        )
+        self.assertEqual(self.client.get(url, {"search": typo}).json()["results"], [])
+
+        # Abbreviations match in both modes.
+        response = self.client.get(reverse("api-conferences-list"), {"search": "neurips"})
+        self.assertEqual(response.json()["results"][0]["id"], str(self.conference.id))
+
+
+class PaperSearchTests(TestCase):
+    """search_vector is trigger-maintained and ?search= ranks and highlights matches."""
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("public-papers-list")
+
+    def search(self, text):
+        return self.client.get(self.url, {"search": text}).json()["results"]
+
+    def test_vector_follows_inserts_and_edits(self):
+        paper = make_paper(1, abstract="Sparse attention", keywords=["Pruning"])
+        paper.refresh_from_db()
+        self.assertIsNotNone(paper.search_vector)
+        self.assertEqual([item["id"] for item in self.search("pruning")], [str(paper.id)])
+
+        # save() from a stale instance and queryset.update() both refresh it.
+        paper.title = "Quantized transformers"
+        paper.save()
+        Paper.objects.filter(id=paper.id).update(abstract="Dense convolutions")
+        self.assertEqual(len(self.search("quantized convolutions")), 1)
+        self.assertEqual(self.search("attention"), [])
+        self.assertEqual(self.search("pruning")[0]["id"], str(paper.id))
+
+    def test_rank_and_highlight(self):
+        in_abstract = make_paper(1, abstract="We study graph networks at scale.")
+        in_title = make_paper(2, title="Graph networks", publication_date=date(2020, 1, 1))
+        make_paper(3, abstract="Unrelated vision work.")
+
+        results = self.search("graph networks")
+        self.assertEqual(
+            [item["id"] for item in results], [str(in_title.id), str(in_abstract.id)]
+        )
+        self.assertEqual(
+            results[0]["highlight"]["title"], "<mark>Graph</mark> <mark>networks</mark>"
+        )
+        self.assertIn("<mark>graph</mark>", results[1]["highlight"]["abstract"])
+
+        # Highlights are skipped when ?fields= does not ask for them.
+        response = self.client.get(self.url, {"search": "graph", "fields": "id,title"})
+        self.assertNotIn("highlight", response.json()["results"][0])
+
+
+class CursorPaginationTests(TestCase):
+    """Keyset pages walk the same (-publication_date, id) order as page mode."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Undated papers sort first; papers sharing a date fall back to id order.
+        for index in range(3):
+            make_paper(index, publication_date=None)
+        for index in range(3, 8):
+            make_paper(index, publication_date=date(2024, 3, 1))
+        for index in range(8, 13):
+            make_paper(index)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("public-papers-list")
+
+    def get_page(self, cursor, page_size):
+        data = self.client.get(self.url, {"cursor": cursor, "pageSize": page_size}).json()
+        return [item["id"] for item in data["results"]], data["pagination"]
+
+    def test_walks_match_page_mode(self):
+        expected = [
+            item["id"]
+            for item in self.client.get(self.url, {"pageSize": 100}).json()["results"]
+        ]
+        self.assertEqual(len(expected), 13)
+        for page_size in (1, 2, 4, 5, 13, 20):
+            with self.subTest(page_size=page_size):
+                ids, pagination = self.get_page("", page_size)
+                self.assertIsNone(pagination["prevCursor"])
+                pages = [ids]
+                while pagination["nextCursor"]:
+                    ids, pagination = self.get_page(pagination["nextCursor"], page_size)
+                    pages.append(ids)
+                self.assertEqual(sum(pages, []), expected)
+                self.assertTrue(all(len(page) == page_size for page in pages[:-1]))
+
+                # From the last page, prevCursor retraces the same pages.
+                back = []
+                while pagination["prevCursor"]:
+                    ids, pagination = self.get_page(pagination["prevCursor"], page_size)
+                    back.append(ids)
+                self.assertEqual(back[::-1], pages[:-1])
+                if back:
+                    self.assertIsNotNone(pagination["nextCursor"])
+
+    def test_ties_break_on_id(self):
+        tied = sorted(
+            str(paper_id)
+            for paper_id in Paper.objects.filter(
+                publication_date=date(2024, 3, 1)
+            ).values_list("id", flat=True)
+        )
+        # Start just after the second tied paper.
+        ids, _ = self.get_page(encode_cursor(date(2024, 3, 1), tied[1]), 20)
+        self.assertEqual(ids[:3], tied[2:])
+        # Paging back from the fourth one also returns the undated papers.
+        ids, _ = self.get_page(encode_cursor(date(2024, 3, 1), tied[3], reverse=True), 20)
+        self.assertEqual(len(ids), 6)
+        self.assertEqual(ids[-3:], tied[:3])
+
+    def test_malformed_cursor(self):
+        for cursor in (
+            "bad",
+            "!!!",
+            encode_cursor("2024-03-01", "not-a-uuid"),
+            encode_cursor("not-a-date", uuid.uuid4()),
+            encode_cursor(5, uuid.uuid4()),
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(self.url, {"cursor": cursor})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["code"], "INVALID_CURSOR")
+
+    def test_page_size_is_validated_and_clamped(self):
+        response = self.client.get(self.url, {"cursor": "", "pageSize": "abc"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["code"], "INVALID_PAGE_SIZE")
+        for page_size, expected in (("-5", 1), ("0", 1), ("1000000", 100)):
+            with self.subTest(page_size=page_size):
+                data = self.client.get(
+                    self.url, {"cursor": "", "pageSize": page_size}
+                ).json()
+                self.assertEqual(data["pagination"]["pageSize"], expected)
+                self.assertEqual(len(data["results"]), min(expected, 13))
+
+
+class PaperFacetsTests(TestCase):
+    """Facet counts come from one SQL statement and honour PapersList filters."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = Journal.objects.create(name="Facet Journal")
+        cls.conference = Conference.objects.create(name="Facet Conference")
+        cls.task = Task.objects.create(name="Segmentation")
+        for index in range(3):
+            make_paper(index, journal=cls.journal).tasks.add(cls.task)
+        make_paper(3, conference=cls.conference, publication_date=date(2023, 5, 1))
+        make_paper(4, publication_date=None)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_facet_counts(self):
+        with self.assertNumQueries(1):
+            data = self.client.get(reverse("api-paper-facets")).json()
+        self.assertEqual(data["totalItems"], 5)
+        facets = data["facets"]
+        self.assertEqual(
+            facets["year"],
+            [
+                {"value": 2024, "count": 3},
+                {"value": 2023, "count": 1},
+                {"value": None, "count": 1},
+            ],
+        )
+        self.assertEqual(facets["venueType"][0], {"value": "journal", "count": 3})
+        self.assertEqual(
+            facets["venues"][0],
+            {
+                "id": str(self.journal.id),
+                "name": "Facet Journal",
+                "venueType": "journal",
+                "count": 3,
+            },
+        )
+        self.assertEqual(
+            facets["tasks"], [{"id": self.task.id, "name": "Segmentation", "count": 3}]
+        )
+
+    def test_filters_apply(self):
+        data = self.client.get(
+            reverse("api-paper-facets"), {"venueType": "conference"}
+        ).json()
+        self.assertEqual(data["totalItems"], 1)
+        self.assertEqual(data["facets"]["tasks"], [])
+        self.assertEqual(data["facets"]["venues"][0]["name"], "Facet Conference")
+
+
+class SparseFieldsetTests(TestCase):
+    """?fields= / ?exclude= trim list rows and the columns loaded for them."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = Journal.objects.create(name="Sparse Journal")
+        for index in range(3):
+            make_paper(index, journal=cls.journal, abstract="long text")
+        dataset = Dataset.objects.create(name="Sparse set", description="long text")
+        # Dataset rollups are recomputed on commit.
+        with cls.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(name="Parsing").datasets.add(dataset)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_papers_fields_and_exclude(self):
+        url = reverse("public-papers-list")
+        row = self.client.get(url, {"fields": "title,year"}).json()["results"][0]
+        self.assertEqual(set(row), {"id", "title", "year"})
+        row = self.client.get(url, {"exclude": "abstract,venue"}).json()["results"][0]
+        self.assertNotIn("abstract", row)
+        self.assertIn("quartile", row)
+
+    def test_papers_fields_without_card(self):
+        PaperCard.objects.all().delete()
+        url = reverse("public-papers-list")
+        row = self.client.get(url, {"fields": "title"}).json()["results"][0]
+        self.assertEqual(set(row), {"id", "title"})
+
+    def test_venue_papers_fields(self):
+        url = reverse("api-journal-papers", args=[self.journal.id])
+        row = self.client.get(url, {"fields": "year"}).json()["results"][0]
+        self.assertEqual(set(row), {"id", "year"})
+
+    def test_datasets_skip_unrequested_columns_and_prefetch(self):
+        url = reverse("public-datasets-list")
+        # Row estimate probe, COUNT, page: no per-row queries.
+        with self.assertNumQueries(3):
+            row = self.client.get(url, {"fields": "name"}).json()["results"][0]
+        self.assertEqual(set(row), {"id", "name"})
+        row = self.client.get(url, {"fields": "name,tasks"}).json()["results"][0]
+        self.assertEqual(row["tasks"], ["Parsing"])
+
+
+class PaperExportTests(TestCase):
+    """The export streams every matching paper, optionally gzip-encoded."""
+
+    @classmethod
+    def setUpTestData(cls):
+        journal = Journal.objects.create(name="Export Journal")
+        for index in range(5):
+            make_paper(index, journal=journal if index % 2 else None)
+
+    def setUp(self):
+        # Export throttle history lives in the cache.
+        cache.clear()
+
+    def body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_ndjson_honours_filters(self):
+        response = self.client.get(
+            reverse("api-papers-export"), {"venueType": "journal"}
+        )
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in self.body(response).splitlines()]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["venue"]["name"], "Export Journal")
+
+    def test_csv_with_fields_and_gzip(self):
+        response = self.client.get(
+            reverse("api-papers-export"),
+            {"exportFormat": "csv", "fields": "title,authors"},
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        lines = gzip.decompress(self.body(response)).decode().splitlines()
+        self.assertEqual(lines[0], "id,title,authors")
+        self.assertEqual(len(lines), 6)
+        self.assertTrue(lines[1].endswith(",Unknown"))
+
+    def test_unknown_format_is_rejected(self):
+        response = self.client.get(reverse("api-papers-export"), {"exportFormat": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_limit_is_validated_and_clamped(self):
+        url = reverse("api-papers-export")
+        for limit in ("abc", "0", "-3", "1.5"):
+            with self.subTest(limit=limit):
+                response = self.client.get(url, {"limit": limit})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["code"], "INVALID_LIMIT")
+        self.assertEqual(len(self.body(self.client.get(url, {"limit": 2})).splitlines()), 2)
+        with mock.patch("public_api.paper_export.EXPORT_MAX_ROWS", 3):
+            for params in ({}, {"limit": 1000}):
+                lines = self.body(self.client.get(url, params)).splitlines()
+                self.assertEqual(len(lines), 3)
+
+    def test_exports_are_throttled(self):
+        url = reverse("api-papers-export")
+        with mock.patch.dict(ScopedRateThrottle.THROTTLE_RATES, {"paper_export": "1/hour"}):
+            self.assertEqual(self.client.get(url).status_code, 200)
+            self.assertEqual(self.client.get(url).status_code, 429)
@@ -4,7 +4,11 @@ from django.urls import path
 from .views.dashboard import Dashboard
 from .views.paper import (
     PapersList,
+    PaperFacets,
+    PapersExport,
     PaperDetailView,
+    PaperBatchView,
+    PaperViewHit,
     StarPaperView,
     UnstarPaperView,
     ListDownloadedPapers,
@@ -14,6 +18,7 @@ from .views.paper import (
 from .views.dataset import (
     DatasetsList,
     DatasetDetail,
+    DatasetPapers,
     InterestingDatasets,
     MarkDatasetInteresting,
     UnmarkDatasetInteresting,
@@ -45,6 +50,7 @@ from .views.research_assistant_chat import (
     ResearchAssistantHealthView,
 )
 from .views.venue_mapping import MapPaperVenueView
+from .views.cache_stats import ResponseCacheStatsView
 
 urlpatterns = [
     path("dashboard/", Dashboard.as_view(), name="public-dashboard"),
@@ -52,7 +58,11 @@ urlpatterns = [
     # path('search/', SearchView.as_view(), name='api-search'),  # legacy unused
     
     path("papers/", PapersList.as_view(), name="public-papers-list"),
+    path("papers/facets/", PaperFacets.as_view(), name="api-paper-facets"),
+    path("papers/export/", PapersExport.as_view(), name="api-papers-export"),
+    path("papers/batch/", PaperBatchView.as_view(), name="api-papers-batch"),
     path('papers/<uuid:paper_id>/', PaperDetailView.as_view(), name='api-paper-detail'),
+    path("papers/<uuid:paper_id>/view/", PaperViewHit.as_view(), name="api-paper-view"),
     # path('papers/by-slug/<str:slug>/', PaperBySlugView.as_view(), name='api-paper-by-slug'),  # legacy unused
     path('papers/downloaded/', ListDownloadedPapers.as_view(), name='api-downloaded-papers'),
     path('papers/mark-interesting/<uuid:paper_id>/', StarPaperView.as_view(), name='api-mark-paper-interesting'),
@@ -68,6 +78,7 @@ urlpatterns = [
     
     path("datasets/", DatasetsList.as_view(), name="public-datasets-list"),
     path('datasets/<uuid:dataset_id>/', DatasetDetail.as_view(), name='api-dataset-detail'),
+    path("datasets/<uuid:dataset_id>/papers/", DatasetPapers.as_view(), name="api-dataset-papers"),
     path('datasets/interesting/', InterestingDatasets.as_view(), name='api-interesting-datasets'),
     path('datasets/mark-interesting/<uuid:dataset_id>/', MarkDatasetInteresting.as_view(), name='api-mark-dataset-interesting'),
     path('datasets/<uuid:dataset_id>/unmark-interesting/', UnmarkDatasetInteresting.as_view(), name='api-unmark-dataset-interesting'),
@@ -113,6 +124,11 @@ urlpatterns = [
     path('stats/home/', HomeStats.as_view(), name='api-home-stats'),
     
     path('venues/counts/', VenuesCounts.as_view(), name='api-venues-counts'),
+    path(
+        'internal/response-cache/stats/',
+        ResponseCacheStatsView.as_view(),
+        name='api-response-cache-stats',
+    ),
     path('my-library/', MyLibrary.as_view(), name='api-my-library'),
     # path('research-assistant/query/', ResearchAssistant.as_view(), name='api-research-assistant-query'),
     path(
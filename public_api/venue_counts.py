@@ -0,0 +1,105 @@
+"""
+Denormalized ``Journal.papers_count`` and ``Conference.papers_count``.
+
+Recomputed from ``papers.journal_id`` / ``papers.conference_id`` with one
+grouped ``UPDATE`` per venue table (optionally limited to some venues), so the
+venue list and detail payloads read a column instead of running a COUNT per
+row. ``public_api.signals`` refreshes the venues a paper joins or leaves on
+save and delete; bulk venue assignment (``services.venue_apply``,
+``map_paper_venues apply-db``) calls ``sync_paper_venue_counts`` after its
+``bulk_update``. ``manage.py refresh_venue_counts`` repairs everything. The
+UPDATE skips rows that are already current and does not touch ``updated_at``.
+
+Writers schedule the recount with ``refresh_venue_counts_on_commit``: a COUNT
+inside the writer's transaction cannot see a concurrent writer's uncommitted
+paper, and the UPDATE's "already current" check would then keep the short
+count once both commit.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+from django.db import connection, transaction
+
+from .response_cache import bust_tags
+
+# ``?sortBy=papersCount`` on the venue lists: most papers first, then name.
+SORT_BY_PAPERS_COUNT = "papersCount"
+
+COUNT_SQL = """
+UPDATE {table} AS v
+SET papers_count = COALESCE(p.total, 0)
+FROM {table} AS src
+LEFT JOIN (
+    SELECT {column} AS venue_id, COUNT(*) AS total
+    FROM papers WHERE {column} IS NOT NULL {papers_where} GROUP BY {column}
+) AS p ON p.venue_id = src.id
+WHERE v.id = src.id {venues_where}
+  AND v.papers_count IS DISTINCT FROM COALESCE(p.total, 0)
+"""
+
+VENUE_TABLES = (("journal", "journal_id"), ("conference", "conference_id"))
+
+
+def _refresh(table: str, column: str, venue_ids) -> int:
+    params = []
+    where = {"papers_where": "", "venues_where": ""}
+    if venue_ids is not None:
+        venue_ids = [str(venue_id) for venue_id in venue_ids if venue_id]
+        if not venue_ids:
+            return 0
+        where = {
+            "papers_where": f"AND {column} = ANY(%s::uuid[])",
+            "venues_where": "AND v.id = ANY(%s::uuid[])",
+        }
+        params = [venue_ids] * 2
+    with connection.cursor() as cursor:
+        cursor.execute(COUNT_SQL.format(table=table, column=column, **where), params)
+        return cursor.rowcount
+
+
+def refresh_venue_counts(journal_ids=None, conference_ids=None) -> int:
+    """
+    Recompute ``papers_count`` for the given venues (every venue of a kind when
+    its ids are None); returns rows changed.
+    """
+    return sum(
+        _refresh(table, column, venue_ids)
+        for (table, column), venue_ids in zip(VENUE_TABLES, (journal_ids, conference_ids))
+    )
+
+
+def refresh_venue_counts_on_commit(journal_ids=(), conference_ids=()) -> None:
+    """Run ``refresh_venue_counts`` for these venues once the current transaction commits."""
+    journal_ids = [venue_id for venue_id in journal_ids if venue_id]
+    conference_ids = [venue_id for venue_id in conference_ids if venue_id]
+    if journal_ids or conference_ids:
+        transaction.on_commit(partial(refresh_venue_counts, journal_ids, conference_ids))
+
+
+def sync_paper_venue_counts(papers) -> int:
+    """
+    Schedule a recount of the venues that bulk-updated ``papers`` left or
+    joined and bust their cached pages; returns how many venues changed. Uses
+    the venue ids remembered at load time (``signals.remember_paper_venue``)
+    as the "before" side.
+    """
+    journal_ids, conference_ids = set(), set()
+    for paper in papers:
+        loaded = getattr(paper, "_loaded_venue_ids", (None, None))
+        current = (paper.journal_id, paper.conference_id)
+        if loaded == current:
+            continue
+        journal_ids.update({loaded[0], current[0]} - {None})
+        conference_ids.update({loaded[1], current[1]} - {None})
+        paper._loaded_venue_ids = current
+    if not journal_ids and not conference_ids:
+        return 0
+    refresh_venue_counts_on_commit(journal_ids, conference_ids)
+    tags = ["journals"] if journal_ids else []
+    tags += ["conferences"] if conference_ids else []
+    tags += [f"venue:{venue_id}" for venue_id in journal_ids | conference_ids]
+    tags += [f"venue-papers:{venue_id}" for venue_id in journal_ids | conference_ids]
+    bust_tags(*tags)
+    return len(journal_ids | conference_ids)
@@ -1,23 +1,36 @@
-from django.core.paginator import Paginator
+from .list_counts import counted_paginator
+from .paper_cards import card_payloads, with_card_payload
+from .sparse_fields import trim
 
+# Row keys of a venue paper page; ``fields`` selects among them (sparse fieldsets).
+VENUE_PAPER_FIELDS = ("id", "title", "publication_date", "year", "authors")
+_CARD_KEYS = ("title", "year", "authors")
 
-def _serialize_paper(paper):
-    author_names = list(paper.authors.values_list("name", flat=True))
+
+def _serialize_paper(paper, card):
     return {
         "id": paper.id,
-        "title": paper.title,
+        "title": card.get("title"),
         "publication_date": paper.publication_date,
-        "year": paper.publication_date.year if paper.publication_date else None,
-        "authors": author_names if author_names else ["Unknown"],
+        "year": card.get("year"),
+        "authors": card.get("authors"),
     }
 
 
-def paginate_venue_papers(papers_queryset, page=1, page_size=20):
+def paginate_venue_papers(papers_queryset, page=1, page_size=20, fields=None):
     ordered = papers_queryset.order_by("-publication_date")
-    paginator = Paginator(ordered, page_size)
+    card_keys = None if fields is None else [key for key in _CARD_KEYS if key in fields]
+    paginator, count_exact = counted_paginator(
+        ordered,
+        page_size,
+        scope="venue_papers",
+        object_list=with_card_payload(ordered, card_keys),
+    )
     page_obj = paginator.get_page(page)
-    papers = page_obj.object_list.prefetch_related("authors")
-    items = [_serialize_paper(paper) for paper in papers]
+    items = [
+        trim(_serialize_paper(paper, card), fields)
+        for paper, card in card_payloads(page_obj.object_list, card_keys)
+    ]
     return {
         "results": items,
         "pagination": {
@@ -25,5 +38,6 @@ def paginate_venue_papers(papers_queryset, page=1, page_size=20):
             "pageSize": page_size,
             "totalItems": paginator.count,
             "totalPages": paginator.num_pages,
+            "totalItemsExact": count_exact,
         },
     }
@@ -0,0 +1,78 @@
+"""
+Venue (journal / conference) name matching backed by pg_trgm GIN indexes.
+
+Both tables carry trigram indexes on ``UPPER(name)`` and
+``UPPER(abbreviation)``, which serve Django's ``icontains`` (compiled to
+``UPPER(col) LIKE UPPER('%q%')``) as well as the ``%`` similarity operator used
+by the typo-tolerant ``venueMatch=fuzzy`` mode.
+"""
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Q
+from django.db.models.functions import Greatest, Upper
+
+from .models import Conference, Journal
+
+VENUE_MATCH_FUZZY = "fuzzy"
+# Fuzzy paper filters resolve at most this many best-matching venues per table.
+FUZZY_VENUE_LIMIT = 50
+
+
+def is_fuzzy_match(request) -> bool:
+    return request.query_params.get("venueMatch") == VENUE_MATCH_FUZZY
+
+
+def filter_venues_by_name(queryset, term: str, *, fuzzy: bool = False):
+    """
+    Match a Journal/Conference queryset on name or abbreviation.
+
+    Fuzzy mode keeps rows above ``pg_trgm.similarity_threshold`` and annotates
+    ``name_similarity`` so callers can order best match first.
+    """
+    if not fuzzy:
+        return queryset.filter(
+            Q(name__icontains=term) | Q(abbreviation__icontains=term)
+        )
+    needle = term.upper()
+    return queryset.annotate(
+        name_upper=Upper("name"),
+        abbreviation_upper=Upper("abbreviation"),
+        name_similarity=Greatest(
+            TrigramSimilarity(Upper("name"), needle),
+            TrigramSimilarity(Upper("abbreviation"), needle),
+        ),
+    ).filter(
+        Q(name_upper__trigram_similar=needle)
+        | Q(abbreviation_upper__trigram_similar=needle)
+    )
+
+
+def _matching_ids(model, term: str, fuzzy: bool):
+    """Best fuzzy matches as a capped id list, else an ``icontains`` id subquery."""
+    if fuzzy:
+        matches = filter_venues_by_name(model.objects.all(), term, fuzzy=True)
+        return list(
+            matches.order_by("-name_similarity", "name").values_list("id", flat=True)[
+                :FUZZY_VENUE_LIMIT
+            ]
+        )
+    return model.objects.filter(name__icontains=term).values("id")
+
+
+def filter_papers_by_venue_name(queryset, term: str, *, fuzzy: bool = False):
+    """
+    Filter papers with ``journal_id IN (...) OR conference_id IN (...)`` on the
+    FK indexes instead of joining and scanning both venue tables per paper row.
+
+    Exact mode nests the venue lookups as subqueries (served by the trigram
+    indexes), so a broad term never inlines thousands of ids into the COUNT,
+    page, facet and export queries; fuzzy mode resolves at most
+    ``FUZZY_VENUE_LIMIT`` ids per table up front.
+    """
+    journal_ids = _matching_ids(Journal, term, fuzzy)
+    conference_ids = _matching_ids(Conference, term, fuzzy)
+    if fuzzy and not journal_ids and not conference_ids:
+        return queryset.none()
+    return queryset.filter(
+        Q(journal_id__in=journal_ids) | Q(conference_id__in=conference_ids)
+    )
@@ -0,0 +1,23 @@
+"""Internal monitoring endpoint for the anonymous response cache."""
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from public_api.response_cache import cache_stats
+from public_api.views.venue_mapping import _internal_key_ok
+
+
+class ResponseCacheStatsView(APIView):
+    """GET /api/internal/response-cache/stats/ — hit/miss counters for monitoring."""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        if not _internal_key_ok(request):
+            return Response(
+                {"error": "Forbidden"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        return Response(cache_stats(), status=status.HTTP_200_OK)
@@ -4,16 +4,22 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
-from django.db.models import Case, IntegerField, Q, Value, When
-from django.core.paginator import Paginator
+from django.utils.decorators import method_decorator
 
+from ..conditional import conditional_detail, conference_version
 from ..conference_ranks import unranked_rank_q
+from ..list_counts import counted_paginator
 from ..models import Conference
+from ..response_cache import CachedResponseMixin
 from ..serializers import ConferenceListSerializer, ConferenceDetailSerializer
-from ..venue_papers import paginate_venue_papers
+from ..sparse_fields import selected_fields
+from ..venue_counts import SORT_BY_PAPERS_COUNT
+from ..venue_papers import VENUE_PAPER_FIELDS, paginate_venue_papers
+from ..venue_search import filter_venues_by_name, is_fuzzy_match
 
 
-class ConferencesList(APIView):
+class ConferencesList(CachedResponseMixin, APIView):
+    cache_tags = ("conferences",)
     permission_classes = [AllowAny]
 
     def get(self, request):
@@ -23,21 +29,14 @@ class ConferencesList(APIView):
         search = request.query_params.get("search")
         rank = request.query_params.get("rank")
         tier = request.query_params.get("tier")
-        conferences = Conference.objects.annotate(
-            rank_order=Case(
-                When(rank="A*", then=Value(0)),
-                When(rank="A", then=Value(1)),
-                When(rank="B", then=Value(2)),
-                When(rank="C", then=Value(3)),
-                default=Value(99),
-                output_field=IntegerField(),
-            )
-        ).order_by("rank_order", "name")
+        # rank_order is a stored column; (rank_order, name) is indexed.
+        conferences = Conference.objects.order_by("rank_order", "name")
 
         if search:
-            conferences = conferences.filter(
-                Q(name__icontains=search) | Q(abbreviation__icontains=search)
-            )
+            fuzzy = is_fuzzy_match(request)
+            conferences = filter_venues_by_name(conferences, search, fuzzy=fuzzy)
+            if fuzzy:
+                conferences = conferences.order_by("-name_similarity", "rank_order", "name")
 
         if rank:
             if rank.lower() in ("null", "not ranked", "unranked"):
@@ -50,7 +49,12 @@ class ConferencesList(APIView):
         elif tier == "other":
             conferences = conferences.exclude(rank__in=["A*", "A"])
 
-        paginator = Paginator(conferences, page_size)
+        if request.query_params.get("sortBy") == SORT_BY_PAPERS_COUNT:
+            conferences = conferences.order_by("-papers_count", "name")
+
+        paginator, count_exact = counted_paginator(
+            conferences, page_size, scope="conferences"
+        )
         paginated_conferences = paginator.page(page)
 
         serializer = ConferenceListSerializer(paginated_conferences, many=True)
@@ -63,14 +67,17 @@ class ConferencesList(APIView):
                 "pageSize": page_size,
                 "totalItems": paginator.count,
                 "totalPages": paginator.num_pages,
+                "totalItemsExact": count_exact,
             },
         }
 
         return Response(response_data)
 
-class ConferenceDetail(APIView):
+class ConferenceDetail(CachedResponseMixin, APIView):
+    cache_tags = ("venue:{conference_id}",)
     permission_classes = [AllowAny]
 
+    @method_decorator(conditional_detail(conference_version))
     def get(self, request, conference_id):
         conference = get_object_or_404(Conference, id=conference_id)
         
@@ -79,12 +86,14 @@ class ConferenceDetail(APIView):
         return Response(result, status=status.HTTP_200_OK)
 
 
-class ConferencePapersView(APIView):
+class ConferencePapersView(CachedResponseMixin, APIView):
+    cache_tags = ("venue-papers:{conference_id}",)
     permission_classes = [AllowAny]
 
     def get(self, request, conference_id):
         conference = get_object_or_404(Conference, id=conference_id)
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("pageSize", 20))
-        data = paginate_venue_papers(conference.papers.all(), page, page_size)
+        fields = selected_fields(request, VENUE_PAPER_FIELDS)
+        data = paginate_venue_papers(conference.papers.all(), page, page_size, fields)
         return Response(data, status=status.HTTP_200_OK)
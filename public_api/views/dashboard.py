@@ -1,18 +1,20 @@
 import logging
+from collections import Counter
 from datetime import date, datetime, timedelta
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from django.db.models import Count, Q
-from django.db.models.functions import TruncDate, TruncWeek, TruncMonth, TruncYear
+from ..dashboard_rollups import DATASETS, TASKS, daily_paper_counts, papers_per
 from ..error_responses import standard_error_response
-from ..models import Paper, Dataset, Task
+from ..models import Dataset
 from ..serializers import PaperSerializer, TaskSerializer
 
 logger = logging.getLogger(__name__)
 
+PERIODS = ("daily", "weekly", "monthly", "yearly")
+
 
 def _inclusive_end_date(end_exclusive: date) -> date:
     return end_exclusive - timedelta(days=1)
@@ -91,43 +93,28 @@ class Dashboard(APIView):
         period = request.query_params.get('period')
         
         try:
-            paper_count = Paper.objects.filter(created_at__gte=start_date, created_at__lte=end_date).count()
-            dataset_count = Dataset.objects.filter(created_at__gte=start_date, created_at__lte=end_date).count()
-            
-            response_data = {
-                "paper_count": paper_count,
-                "dataset_count": dataset_count,
-            }
-            
+            if period not in PERIODS:
+                return Response({"error": "Invalid period"}, status=status.HTTP_400_BAD_REQUEST)
+
             start = datetime.strptime(start_date, '%Y-%m-%d').date()
             end = end_date.date()
             inclusive_end = _inclusive_end_date(end)
 
-            period_config = {
-                'daily': TruncDate('created_at'),
-                'weekly': TruncWeek('created_at'),
-                'monthly': TruncMonth('created_at'),
-                'yearly': TruncYear('created_at'),
+            # Paper figures sum the daily rollups (public_api.dashboard_rollups)
+            # over the whole days start..inclusive_end.
+            papers_per_day = daily_paper_counts(start, inclusive_end)
+            dataset_count = Dataset.objects.filter(created_at__gte=start_date, created_at__lte=end_date).count()
+            
+            response_data = {
+                "paper_count": sum(papers_per_day.values()),
+                "dataset_count": dataset_count,
             }
-            if period not in period_config:
-                return Response({"error": "Invalid period"}, status=status.HTTP_400_BAD_REQUEST)
 
-            annotation_func = period_config[period]
             time_range = _build_time_range(start, end, period)
 
-            papers_per_period = Paper.objects.filter(
-                created_at__gte=start_date,
-                created_at__lte=end_date
-            ).annotate(
-                date=annotation_func
-            ).values('date').annotate(
-                count=Count('id')
-            ).order_by('date')
-
-            counts_by_bucket = {
-                _bucket_key(row["date"], period): row["count"]
-                for row in papers_per_period
-            }
+            counts_by_bucket = Counter()
+            for day, count in papers_per_day.items():
+                counts_by_bucket[_bucket_key(day, period)] += count
 
             paper_count_details = []
             for bucket in time_range:
@@ -145,42 +132,18 @@ class Dashboard(APIView):
                 "paper_count_detail": paper_count_details
             })
 
-            papers_per_dataset = Dataset.objects.annotate(
-                filtered_paper_count=Count(
-                    'papers', 
-                    filter=Q(
-                        papers__created_at__gte=start_date, 
-                        papers__created_at__lte=end_date
-                    )
-                )
-            ).filter(
-                filtered_paper_count__gt=0
-            ).values(
-                'id', 'name', 'filtered_paper_count'
-            ).order_by('-filtered_paper_count')
-            
             response_data.update({
-                "papers_per_dataset": list(papers_per_dataset)
+                "papers_per_dataset": papers_per(DATASETS, start, inclusive_end)
             })
             
-            papers_per_task = Task.objects.annotate(
-                filtered_paper_count=Count(
-                    'papers', 
-                    filter=Q(
-                        papers__created_at__gte=start_date, 
-                        papers__created_at__lte=end_date
-                    )
-                )
-            ).filter(
-                filtered_paper_count__gt=0
-            )
-            papers_task_detail = papers_per_task.values('id', 'name', 'filtered_paper_count').order_by('-filtered_paper_count')
+            papers_per_task = papers_per(TASKS, start, inclusive_end)
             response_data.update({
-                "papers_per_task": list(papers_task_detail)
+                "papers_per_task": papers_per_task
             })
-            trending_tasks = papers_per_task.values('id', 'name').order_by('-filtered_paper_count')[:5]
             response_data.update({
-                "trending_tasks": list(trending_tasks)
+                "trending_tasks": [
+                    {"id": task["id"], "name": task["name"]} for task in papers_per_task[:5]
+                ]
             })
             return Response(response_data)
         except Exception:
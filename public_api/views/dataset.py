@@ -4,18 +4,31 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.db.models import Q
 from django.core.paginator import Paginator
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
 from rest_framework import status
 
+from ..conditional import conditional_detail, dataset_version
+from ..cursor_pagination import InvalidCursor, paginate_by_cursor
+from ..dataset_papers import (
+    DATASET_PAPERS_MAX_PAGE_SIZE,
+    DATASET_PAPERS_PAGE_SIZE,
+    dataset_papers_page,
+)
 from ..error_responses import standard_error_response
+from ..library_items import interesting_datasets
 from ..library_limits import (
-    can_add_interesting_dataset,
+    add_to_library,
     dataset_interesting_limit_response,
 )
+from ..list_counts import counted_paginator
 from ..models import Dataset, DatasetSimilarDataset, InterestingDataset
+from ..response_cache import CachedResponseMixin
 from ..serializers import DatasetListSerializer
+from ..sparse_fields import selected_fields
 
 
-class DatasetsList(APIView):
+class DatasetsList(CachedResponseMixin, APIView):
+    cache_tags = ("datasets",)
     queryset = Dataset.objects.all()
     permission_classes = [AllowAny]
     ordering_fields = ["-created_at"]
@@ -39,8 +52,14 @@ class DatasetsList(APIView):
 
         datasets = datasets.filter(filter_q).order_by("-created_at")
 
-        total_count = datasets.count()
-        paginator = Paginator(datasets, page_size)
+        fields = selected_fields(request, DatasetListSerializer.Meta.fields)
+        rows = datasets
+        if fields is not None:
+            rows = rows.only(*DatasetListSerializer.model_columns(fields))
+
+        paginator, count_exact = counted_paginator(
+            datasets, page_size, scope="datasets", object_list=rows
+        )
         paginated_datasets = paginator.page(page)
 
         serializer = DatasetListSerializer(
@@ -53,52 +72,37 @@ class DatasetsList(APIView):
             "pagination": {
                 "page": page,
                 "pageSize": page_size,
-                "totalItems": total_count,
+                "totalItems": paginator.count,
                 "totalPages": paginator.num_pages,
+                "totalItemsExact": count_exact,
             },
         }
 
         return Response(response_data)
 
 
-class DatasetDetail(APIView):
+class DatasetDetail(CachedResponseMixin, APIView):
+    # relatedPapers embeds paper fields, so paper edits must bust it too.
+    cache_tags = ("dataset:{dataset_id}", "papers")
     permission_classes = [AllowAny]
 
+    @method_decorator(conditional_detail(dataset_version))
     def get(self, request, dataset_id):
         dataset = get_object_or_404(Dataset, id=dataset_id)
         serializer = DatasetListSerializer(dataset, context={"request": request})
         dataset_data = serializer.data
 
-        related_papers = []
-
-        papers = dataset.papers.all().order_by("-created_at")
-        for paper in papers:
-            authors = paper.authors.values_list("name", flat=True)
-            keywords = paper.keywords
-            venue_type = paper.venue_type if hasattr(paper, "venue_type") else "conference"
-            venue_name = (
-                paper.venue_name if hasattr(paper, "venue_name") else paper.conference
-            )
-            paper_data = {
-                "id": str(paper.id),
-                "title": paper.title,
-                "authors": authors,
-                "abstract": paper.abstract,
-                "conference": venue_name,
-                "year": paper.publication_date.year if paper.publication_date else None,
-                "field": None,
-                "venue_type": venue_type,
-                "keywords": keywords,
-                "downloadUrl": paper.pdf_url if paper.pdf_url else None,
-                "doi": paper.doi if paper.doi else None,
-            }
-            related_papers.append(paper_data)
+        related_papers, related_pagination = dataset_papers_page(dataset)
 
         similar_datasets = []
-        similar_relations = DatasetSimilarDataset.objects.filter(from_dataset=dataset)
+        # Relations are written best-first, so id order is rank order.
+        similar_relations = (
+            DatasetSimilarDataset.objects.filter(from_dataset=dataset)
+            .select_related("to_dataset")
+            .order_by("id")
+        )
         for relation in similar_relations:
             similar = relation.to_dataset
-            similar_paper_count = similar.papers.count()
             similar_data = {
                 "id": str(similar.id),
                 "name": similar.name,
@@ -107,8 +111,8 @@ class DatasetDetail(APIView):
                 "downloadUrl": similar.source_url,
                 "language": similar.language if similar.language else "English",
                 "category": similar.data_type or "Unknown",
-                "tasks": similar.tasks.values_list("name", flat=True),
-                "paperCount": similar_paper_count,
+                "tasks": list(similar.task_names),
+                "paperCount": similar.paper_count,
                 "benchmarks": similar.benchmarks if similar.benchmarks else [],
             }
             similar_datasets.append(similar_data)
@@ -116,43 +120,83 @@ class DatasetDetail(APIView):
         result = {
             "dataset": dataset_data,
             "relatedPapers": related_papers,
+            "relatedPapersPagination": related_pagination,
             "similarDatasets": similar_datasets,
         }
 
         return Response(result, status=status.HTTP_200_OK)
     
 
+class DatasetPapers(CachedResponseMixin, APIView):
+    """Keyset pages of the papers linked to a dataset (``relatedPapers`` beyond page one)."""
+
+    cache_tags = ("dataset:{dataset_id}", "papers")
+    permission_classes = [AllowAny]
+
+    def get(self, request, dataset_id):
+        dataset = get_object_or_404(Dataset.objects.only("id"), id=dataset_id)
+        page_size = int(request.query_params.get("pageSize", DATASET_PAPERS_PAGE_SIZE))
+        page_size = max(1, min(page_size, DATASET_PAPERS_MAX_PAGE_SIZE))
+        try:
+            results, pagination = dataset_papers_page(
+                dataset, request.query_params.get("cursor") or None, page_size
+            )
+        except InvalidCursor:
+            return standard_error_response(
+                request,
+                status.HTTP_400_BAD_REQUEST,
+                "INVALID_CURSOR",
+                "The pagination cursor is invalid.",
+            )
+        return Response({"results": results, "pagination": pagination}, status=status.HTTP_200_OK)
+
+
 class InterestingDatasets(APIView):
     permission_classes = [IsAuthenticated]
     
     def get(self, request):
         """
-        Get datasets marked as interesting by the authenticated user with pagination
+        Get datasets marked as interesting by the authenticated user, newest
+        bookmark first. ``?cursor=`` switches from page/pageSize to keyset pages.
         """
-        user = request.user
-        page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("pageSize", 20))
-        interesting = InterestingDataset.objects.filter(user=user)
-        dataset_ids = [item.dataset.id for item in interesting]
-        datasets = Dataset.objects.filter(id__in=dataset_ids).order_by("-created_at")
+        datasets = interesting_datasets(request.user)
         search = request.query_params.get("search")
         if search:
             datasets = datasets.filter(
                 Q(name__icontains=search) | Q(description__icontains=search)
             )
-        paginator = Paginator(datasets, page_size)
-        paginated_datasets = paginator.page(page)
+
+        if "cursor" in request.query_params:
+            try:
+                rows, pagination = paginate_by_cursor(
+                    datasets,
+                    request.query_params.get("cursor") or None,
+                    page_size,
+                    field="starred_at",
+                )
+            except InvalidCursor:
+                return standard_error_response(
+                    request,
+                    status.HTTP_400_BAD_REQUEST,
+                    "INVALID_CURSOR",
+                    "The pagination cursor is invalid.",
+                )
+        else:
+            page = int(request.query_params.get("page", 1))
+            paginator = Paginator(datasets.order_by("-starred_at", "id"), page_size)
+            rows = paginator.page(page)
+            pagination = {
+                "page": page,
+                "pageSize": page_size,
+                "totalItems": paginator.count,
+                "totalPages": paginator.num_pages,
+            }
+
         serializer = DatasetListSerializer(
-            paginated_datasets, many=True, context={"request": request}
+            rows, many=True, context={"request": request}
         )
-        pagination = {
-            "page": page,
-            "pageSize": page_size,
-            "totalItems": paginator.count,
-            "totalPages": paginator.num_pages,
-        }
-
-        return Response({"results": serializer.data, "pagination": pagination}, status=status.HTTP_200_OK   )
+        return Response({"results": serializer.data, "pagination": pagination}, status=status.HTTP_200_OK)
 
 
 class MarkDatasetInteresting(APIView):
@@ -163,13 +207,10 @@ class MarkDatasetInteresting(APIView):
 
         dataset = get_object_or_404(Dataset, id=dataset_id)
 
-        if not can_add_interesting_dataset(user, dataset):
+        allowed, created = add_to_library(InterestingDataset, user, dataset=dataset)
+        if not allowed:
             return dataset_interesting_limit_response(request)
 
-        interesting, created = InterestingDataset.objects.get_or_create(
-            user=user, dataset=dataset
-        )
-
         return Response(
             {"message": "Dataset marked as interesting", "created": created},
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
@@ -8,6 +8,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from django.db import transaction
 from django.db.models import Avg, Q, Sum
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -21,15 +22,21 @@ from rest_framework.views import APIView
 
 from users.utils import extract_metadata_with_openai, extract_text_from_pdf
 
-from ..library_limits import can_add_interesting_paper, paper_interesting_limit_response
+from ..library_items import library_items
+from ..library_limits import (
+    can_add_interesting_paper,
+    create_reserved_item,
+    paper_interesting_limit_response,
+    reserve_library_slot,
+)
+from ..response_cache import CachedResponseMixin
+from ..site_counters import site_counts
 from ..services.venue_apply import apply_venue_mapping_for_paper
 from ..models import (
-    Conference,
     Dataset,
     DownloadedPaper,
     InterestingDataset,
     InterestingPaper,
-    Journal,
     Paper,
     Profile,
     Publication,
@@ -1058,39 +1065,33 @@ class UpdateAvatar(APIView):
         )
 
 
-class VenuesCounts(APIView):
+class VenuesCounts(CachedResponseMixin, APIView):
+    cache_tags = ("stats",)
     permission_classes = [AllowAny]
     authentication_classes = []
 
     def get(self, request):
-        conferences_count = Conference.objects.count()
-        journals_count = Journal.objects.count()
+        counts = site_counts()
         output = {
-            "conferencesCount": conferences_count,
-            "journalsCount": journals_count,
+            "conferencesCount": counts["conferences"],
+            "journalsCount": counts["journals"],
         }
         return Response(output, status=status.HTTP_200_OK)
 
 
-class HomeStats(APIView):
+class HomeStats(CachedResponseMixin, APIView):
+    cache_tags = ("stats",)
     permission_classes = [AllowAny]
     authentication_classes = []
 
     def get(self, request):
-        total_papers = Paper.objects.count()
-        total_users = User.objects.count()
-        total_datasets = Dataset.objects.count()
-
-        total_conferences = Conference.objects.count()
-        total_journals = Journal.objects.count()
-        total_venues = total_conferences + total_journals
-
+        counts = site_counts()
         return Response(
             {
-                "totalPapers": total_papers,
-                "totalUsers": total_users,
-                "totalDatasets": total_datasets,
-                "totalVenues": total_venues,
+                "totalPapers": counts["papers"],
+                "totalUsers": counts["users"],
+                "totalDatasets": counts["datasets"],
+                "totalVenues": counts["conferences"] + counts["journals"],
             }
         )
 
@@ -1104,12 +1105,7 @@ class MyLibrary(APIView):
         user = request.user
 
         if section == "interesting":
-            interesting = (
-                InterestingPaper.objects.filter(user=user)
-                .select_related("paper", "paper__journal", "paper__conference")
-                .prefetch_related("paper__authors")
-                .order_by("-created_at")
-            )
+            interesting = library_items(InterestingPaper, user)
             serializer = LibraryItemSerializer(
                 interesting, many=True, context={"request": request}
             )
@@ -1193,6 +1189,11 @@ class UploadPaper(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Checked up front so a full library does not pay for the PDF/OpenAI work;
+        # the reservation below is what enforces the limit.
+        if not can_add_interesting_paper(request.user):
+            return paper_interesting_limit_response(request)
+
         pdf_text = extract_text_from_pdf(file)
 
         metadata = extract_metadata_with_openai(pdf_text, file.name)
@@ -1202,32 +1203,32 @@ class UploadPaper(APIView):
         if isinstance(year, int) and 1900 <= year <= 3000:
             publication_date = datetime(year, 1, 1).date()
 
-        paper = Paper.objects.create(
-            title=metadata.get("title") or file.name,
-            abstract=metadata.get("abstract") or "",
-            doi=metadata.get("doi") or None,
-            publication_date=publication_date,
-            keywords=metadata.get("keywords") or [],
-            bibtex=metadata.get("bibtex") or "",
-            github_url=metadata.get("sourceCode") or None,
-            # These URLFields are required by the current schema.
-            url="https://example.com",
-            pdf_url="https://example.com",
-            pdf_file=file,
-        )
-
-        if paper.pdf_file:
-            pdf_absolute_url = request.build_absolute_uri(paper.pdf_file.url)
-            paper.url = pdf_absolute_url
-            paper.pdf_url = pdf_absolute_url
-            paper.save(update_fields=["url", "pdf_url", "updated_at"])
+        with transaction.atomic():
+            if not reserve_library_slot(InterestingPaper, request.user):
+                return paper_interesting_limit_response(request)
+
+            paper = Paper.objects.create(
+                title=metadata.get("title") or file.name,
+                abstract=metadata.get("abstract") or "",
+                doi=metadata.get("doi") or None,
+                publication_date=publication_date,
+                keywords=metadata.get("keywords") or [],
+                bibtex=metadata.get("bibtex") or "",
+                github_url=metadata.get("sourceCode") or None,
+                # These URLFields are required by the current schema.
+                url="https://example.com",
+                pdf_url="https://example.com",
+                pdf_file=file,
+            )
 
-        if not can_add_interesting_paper(request.user):
-            paper.delete()
-            return paper_interesting_limit_response(request)
+            if paper.pdf_file:
+                pdf_absolute_url = request.build_absolute_uri(paper.pdf_file.url)
+                paper.url = pdf_absolute_url
+                paper.pdf_url = pdf_absolute_url
+                paper.save(update_fields=["url", "pdf_url", "updated_at"])
 
-        InterestingPaper.objects.create(user=request.user, paper=paper)
-        DownloadedPaper.objects.create(user=request.user, paper=paper)
+            create_reserved_item(InterestingPaper, request.user, paper=paper)
+            DownloadedPaper.objects.create(user=request.user, paper=paper)
 
         venue_mapping = apply_venue_mapping_for_paper(paper, update_doi=True)
         paper.refresh_from_db()
@@ -1,16 +1,22 @@
-from django.core.paginator import Paginator
-from django.db.models import Case, IntegerField, Q, Value, When
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..conditional import conditional_detail, journal_version
+from ..list_counts import counted_paginator
 from ..models import Journal
-from ..venue_papers import paginate_venue_papers
+from ..response_cache import CachedResponseMixin
+from ..venue_search import filter_venues_by_name, is_fuzzy_match
+from ..sparse_fields import selected_fields
+from ..venue_counts import SORT_BY_PAPERS_COUNT
+from ..venue_papers import VENUE_PAPER_FIELDS, paginate_venue_papers
 
 
-class JournalsList(APIView):
+class JournalsList(CachedResponseMixin, APIView):
+    cache_tags = ("journals",)
     permission_classes = [AllowAny]
     
     def get(self, request):
@@ -23,21 +29,14 @@ class JournalsList(APIView):
         impact_min = request.query_params.get("impactMin")
         impact_max = request.query_params.get("impactMax")
 
-        journals = Journal.objects.annotate(
-            quartile_order=Case(
-                When(quartile="Q1", then=Value(0)),
-                When(quartile="Q2", then=Value(1)),
-                When(quartile="Q3", then=Value(2)),
-                When(quartile="Q4", then=Value(3)),
-                default=Value(99),
-                output_field=IntegerField(),
-            )
-        ).order_by("quartile_order", "name")
+        # quartile_order is a stored column; (quartile_order, name) is indexed.
+        journals = Journal.objects.order_by("quartile_order", "name")
 
         if search:
-            journals = journals.filter(
-                Q(name__icontains=search) | Q(abbreviation__icontains=search)
-            )
+            fuzzy = is_fuzzy_match(request)
+            journals = filter_venues_by_name(journals, search, fuzzy=fuzzy)
+            if fuzzy:
+                journals = journals.order_by("-name_similarity", "quartile_order", "name")
 
         if quartile:
             journals = journals.filter(quartile=quartile)
@@ -53,13 +52,14 @@ class JournalsList(APIView):
         if impact_max is not None:
             journals = journals.filter(impact_factor__lte=float(impact_max))
 
-        paginator = Paginator(journals, page_size)
+        if request.query_params.get("sortBy") == SORT_BY_PAPERS_COUNT:
+            journals = journals.order_by("-papers_count", "name")
+
+        paginator, count_exact = counted_paginator(journals, page_size, scope="journals")
         paginated_journals = paginator.page(page)
 
         result = []
         for journal in paginated_journals:
-            papers_count = journal.papers.count()
-
             journal_data = {
                 "id": journal.id,
                 "name": journal.name,
@@ -68,7 +68,7 @@ class JournalsList(APIView):
                 "quartile": journal.quartile,
                 "publisher": journal.publisher,
                 "url": journal.url,
-                "papersCount": papers_count,
+                "papersCount": journal.papers_count,
             }
             result.append(journal_data)
 
@@ -79,17 +79,19 @@ class JournalsList(APIView):
                 "pageSize": page_size,
                 "totalItems": paginator.count,
                 "totalPages": paginator.num_pages,
+                "totalItemsExact": count_exact,
             },
         }
         return Response(response_data, status=status.HTTP_200_OK)
 
 
-class JournalDetailView(APIView):
+class JournalDetailView(CachedResponseMixin, APIView):
+    cache_tags = ("venue:{journal_id}",)
     permission_classes = [AllowAny]
 
+    @method_decorator(conditional_detail(journal_version))
     def get(self, request, journal_id):
         journal = get_object_or_404(Journal, id=journal_id)
-        papers_count = journal.papers.count()
 
         journal_data = {
             "id": journal.id,
@@ -99,18 +101,20 @@ class JournalDetailView(APIView):
             "quartile": journal.quartile,
             "publisher": journal.publisher,
             "url": journal.url,
-            "papersCount": papers_count,
+            "papersCount": journal.papers_count,
             "created_at": journal.created_at,
         }
         return Response(journal_data, status=status.HTTP_200_OK)
 
 
-class JournalPapersView(APIView):
+class JournalPapersView(CachedResponseMixin, APIView):
+    cache_tags = ("venue-papers:{journal_id}",)
     permission_classes = [AllowAny]
 
     def get(self, request, journal_id):
         journal = get_object_or_404(Journal, id=journal_id)
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("pageSize", 20))
-        data = paginate_venue_papers(journal.papers.all(), page, page_size)
+        fields = selected_fields(request, VENUE_PAPER_FIELDS)
+        data = paginate_venue_papers(journal.papers.all(), page, page_size, fields)
         return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -1,18 +1,43 @@
-from datetime import datetime
-
-from django.core.paginator import Paginator
-from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.utils.text import compress_sequence
 from rest_framework import status
 from rest_framework import filters
 from rest_framework.permissions import AllowAny
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 
+from ..conditional import conditional_detail, paper_version
+from ..cursor_pagination import MAX_CURSOR_PAGE_SIZE, InvalidCursor, paginate_by_cursor
 from ..error_responses import standard_error_response
-from ..library_limits import can_add_interesting_paper, paper_interesting_limit_response
+from ..library_items import library_items
+from ..library_limits import add_to_library, paper_interesting_limit_response
+from ..list_counts import counted_paginator
 from ..models import Paper, InterestingPaper, DownloadedPaper
+from ..paper_detail import (
+    PAPER_BATCH_MAX,
+    paper_detail_queryset,
+    parse_paper_ids,
+    papers_in_order,
+)
+from ..paper_cards import CARD_FIELDS, card_payloads, with_card_payload
+from ..paper_counters import record_download, record_view
+from ..paper_export import (
+    EXPORT_CONTENT_TYPES,
+    EXPORT_NDJSON,
+    export_chunks,
+    export_limit,
+    export_ordering,
+)
+from ..paper_facets import paper_facets
+from ..paper_filters import filter_papers, search_text
+from ..paper_search import highlight_payload
+from ..response_cache import CachedResponseMixin
+from ..sparse_fields import selected_fields
 from ..serializers import (
     LibraryItemSerializer,
     PaperDetailSerializer,
@@ -20,15 +45,82 @@ from ..serializers import (
 )
 
 
-class PaperDetailView(APIView):
+class PaperDetailView(CachedResponseMixin, APIView):
+    cache_tags = ("paper:{paper_id}",)
     permission_classes = [AllowAny]
 
+    @method_decorator(conditional_detail(paper_version))
     def get(self, request, paper_id):
-        paper = get_object_or_404(Paper, id=paper_id)
+        paper = get_object_or_404(paper_detail_queryset(request.user), id=paper_id)
         serializer = PaperDetailSerializer(paper, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+class PaperViewHit(APIView):
+    """
+    Count a paper view. The increment is buffered and flushed in bulk (see
+    ``paper_counters``), so this never writes the paper row on the request path;
+    unknown ids are dropped by the flush. Repeat views from the same viewer are
+    deduplicated and the endpoint is rate limited per user/IP.
+    """
+
+    permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "paper_view"
+
+    def post(self, request, paper_id):
+        queued = record_view(paper_id, viewer=self._viewer(request))
+        return Response({"queued": queued}, status=status.HTTP_202_ACCEPTED)
+
+    def _viewer(self, request) -> str:
+        if request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        session_key = request.session.session_key
+        if session_key:
+            return f"session:{session_key}"
+        return f"ip:{ScopedRateThrottle().get_ident(request)}"
+
+
+class PaperBatchView(APIView):
+    """
+    POST ``{"ids": [...]}`` -> ``{"results": [...], "missing": [...]}`` with
+    PaperDetailSerializer payloads in request order, loaded in a fixed number
+    of queries. Replaces one detail request per chat citation / recommendation.
+    """
+
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        data = request.data if hasattr(request.data, "get") else {}
+        ids = parse_paper_ids(data.get("ids"))
+        if ids is None:
+            return standard_error_response(
+                request,
+                status.HTTP_400_BAD_REQUEST,
+                "INVALID_PAPER_IDS",
+                "ids must be a list of paper UUIDs.",
+            )
+        if len(ids) > PAPER_BATCH_MAX:
+            return standard_error_response(
+                request,
+                status.HTTP_400_BAD_REQUEST,
+                "TOO_MANY_PAPER_IDS",
+                f"At most {PAPER_BATCH_MAX} papers can be requested at once.",
+            )
+        papers = papers_in_order(ids, request.user)
+        found = {paper.id for paper in papers}
+        serializer = PaperDetailSerializer(
+            papers, many=True, context={"request": request}
+        )
+        return Response(
+            {
+                "results": serializer.data,
+                "missing": [str(paper_id) for paper_id in ids if paper_id not in found],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 # LEGACY/UNUSED BLOCK: by-slug route is disabled in urls.py.
 """
 # LEGACY/UNUSED: /api/papers/by-slug/<slug>/ route is commented in urls.py.
@@ -49,13 +141,18 @@ class PaperBySlugView(APIView):
 """
 
 
-class PapersList(APIView):
+# Keys a PapersList row can carry; ?fields= / ?exclude= select among them.
+LIST_FIELDS = (*CARD_FIELDS, "highlight")
+
+
+class PapersList(CachedResponseMixin, APIView):
+    cache_tags = ("papers",)
     queryset = Paper.objects.all()
     serializer_class = PaperListSerializer
     permission_classes = [AllowAny]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    # ?search= is handled by full-text search (paper_search), not SearchFilter.
+    filter_backends = [filters.OrderingFilter]
     ordering_fields = ["-publication_date"]
-    search_fields = ["title"]
 
     def filter_queryset(self):
         for backend in self.filter_backends:
@@ -63,58 +160,31 @@ class PapersList(APIView):
         return self.queryset
 
     def get(self, request):
-        queryset = self.filter_queryset().select_related("journal", "conference")
-
-        year = request.query_params.get("year")
-        venue = request.query_params.get("venue")
-        venue_id = request.query_params.get("venue_id")
-        venue_type = request.query_params.get("venueType")
-        start_date = request.query_params.get("startDate")
-        end_date = request.query_params.get("endDate")
+        fields = selected_fields(request, LIST_FIELDS)
+        queryset = filter_papers(
+            self.filter_queryset(),
+            request.query_params,
+            highlight=fields is None or "highlight" in fields,
+        )
+        if "cursor" in request.query_params:
+            return self._cursor_page(request, queryset, fields)
 
+        search = search_text(request.query_params)
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("pageSize", 20))
-        task_ids_raw = request.query_params.get("taskIds", "")
-        if isinstance(task_ids_raw, str):
-            task_ids = [tid.strip() for tid in task_ids_raw.split(",") if tid.strip()]
-        elif isinstance(task_ids_raw, list):
-            task_ids = [str(tid).strip() for tid in task_ids_raw if str(tid).strip()]
-        else:
-            task_ids = []
 
-        if year:
-            queryset = queryset.filter(publication_date__year=int(year))
-
-        if venue_id:
-            queryset = queryset.filter(
-                Q(journal_id=venue_id) | Q(conference_id=venue_id)
-            )
-        elif venue:
-            queryset = queryset.filter(
-                Q(journal__name__icontains=venue)
-                | Q(conference__name__icontains=venue)
-            )
-
-        if venue_type == "journal":
-            queryset = queryset.filter(journal_id__isnull=False)
-        elif venue_type == "conference":
-            queryset = queryset.filter(conference_id__isnull=False)
-
-        if task_ids:
-            queryset = queryset.filter(tasks__id__in=task_ids).distinct()
-
-        if start_date:
-            start_date = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-            queryset = queryset.filter(crawled_at__gte=start_date)
-        if end_date:
-            end_date = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            queryset = queryset.filter(crawled_at__lte=end_date)
-
-        papers = queryset.order_by(self.ordering_fields[0])
-        paginator = Paginator(papers, page_size)
+        if search:
+            papers = queryset.order_by("-search_rank", self.ordering_fields[0], "id")
+        else:
+            papers = queryset.order_by(self.ordering_fields[0], "id")
+        paginator, count_exact = counted_paginator(
+            papers,
+            page_size,
+            scope="papers",
+            object_list=with_card_payload(papers, fields),
+        )
         paginated_papers = paginator.page(page)
-        serializer = PaperListSerializer(paginated_papers, many=True)
-        result = serializer.data
+        result = self._serialize(paginated_papers, fields)
 
         response_data = {
             "results": result,
@@ -123,11 +193,120 @@ class PapersList(APIView):
                 "pageSize": page_size,
                 "totalItems": paginator.count,
                 "totalPages": paginator.num_pages,
+                "totalItemsExact": count_exact,
             },
         }
-        
+
         return Response(response_data)
 
+    def _cursor_page(self, request, queryset, fields):
+        """Keyset page ordered by (-publication_date, id); skips COUNT(*)."""
+        try:
+            page_size = int(request.query_params.get("pageSize", 20))
+        except ValueError:
+            return standard_error_response(
+                request,
+                status.HTTP_400_BAD_REQUEST,
+                "INVALID_PAGE_SIZE",
+                "pageSize must be an integer.",
+            )
+        page_size = max(1, min(page_size, MAX_CURSOR_PAGE_SIZE))
+        try:
+            papers, pagination = paginate_by_cursor(
+                with_card_payload(queryset, fields),
+                request.query_params.get("cursor") or None,
+                page_size,
+            )
+        except InvalidCursor:
+            return standard_error_response(
+                request,
+                status.HTTP_400_BAD_REQUEST,
+                "INVALID_CURSOR",
+                "The pagination cursor is invalid.",
+            )
+        return Response(
+            {"results": self._serialize(papers, fields), "pagination": pagination}
+        )
+
+    def _serialize(self, papers, fields=None):
+        # Rows come from the pre-rendered paper_card payload, not PaperListSerializer.
+        result = []
+        for paper, item in card_payloads(papers, fields):
+            highlight = highlight_payload(paper)
+            if highlight is not None:
+                item["highlight"] = highlight
+            result.append(item)
+        return result
+
+
+class PaperFacets(CachedResponseMixin, APIView):
+    """Grouped counts per year, venue type, venue and task for the PapersList filters."""
+
+    cache_tags = ("papers",)
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        queryset = filter_papers(
+            Paper.objects.all(), request.query_params, highlight=False
+        )
+        return Response(paper_facets(queryset), status=status.HTTP_200_OK)
+
+
+class PapersExport(APIView):
+    """
+    Stream the papers matching the PapersList filters as NDJSON (default) or
+    CSV (``?exportFormat=csv``); gzip-encoded when the client accepts it.
+    ``?limit=`` is clamped to ``EXPORT_MAX_ROWS`` and exports are rate limited
+    per user/IP.
+    """
+
+    permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "paper_export"
+
+    def get(self, request):
+        export_format = request.query_params.get("exportFormat", EXPORT_NDJSON)
+        if export_format not in EXPORT_CONTENT_TYPES:
+            return standard_error_response(
+                request,
+                status.HTTP_400_BAD_REQUEST,
+                "INVALID_EXPORT_FORMAT",
+                "exportFormat must be one of: ndjson, csv.",
+            )
+        try:
+            limit = export_limit(request.query_params.get("limit"))
+        except ValueError:
+            return standard_error_response(
+                request,
+                status.HTTP_400_BAD_REQUEST,
+                "INVALID_LIMIT",
+                "limit must be a positive integer.",
+            )
+        search = search_text(request.query_params)
+        queryset = filter_papers(
+            Paper.objects.all(), request.query_params, highlight=False
+        )
+        chunks = (
+            chunk.encode("utf-8")
+            for chunk in export_chunks(
+                export_ordering(queryset, search),
+                export_format,
+                fields=selected_fields(request, CARD_FIELDS),
+                limit=limit,
+            )
+        )
+
+        gzip_body = "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", "")
+        response = StreamingHttpResponse(
+            compress_sequence(chunks) if gzip_body else chunks,
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+        )
+        if gzip_body:
+            response["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ("Accept-Encoding",))
+        response["Content-Disposition"] = f'attachment; filename="papers.{export_format}"'
+        return response
+
 
 class StarPaperView(APIView):
     permission_classes = [IsAuthenticated]
@@ -135,11 +314,9 @@ class StarPaperView(APIView):
     def post(self, request, paper_id):
         user = request.user
         paper = get_object_or_404(Paper, id=paper_id)
-        if not can_add_interesting_paper(user, paper):
+        allowed, created = add_to_library(InterestingPaper, user, paper=paper)
+        if not allowed:
             return paper_interesting_limit_response(request)
-        interesting, created = InterestingPaper.objects.get_or_create(
-            user=user, paper=paper
-        )
         return Response(
             {"message": "Paper marked as interesting", "created": created},
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
@@ -163,12 +340,7 @@ class ListDownloadedPapers(APIView):
 
     def get(self, request):
         user = request.user
-        downloaded_papers = (
-            DownloadedPaper.objects.filter(user=user)
-            .select_related("paper", "paper__journal", "paper__conference")
-            .prefetch_related("paper__authors")
-            .order_by("-created_at")
-        )
+        downloaded_papers = library_items(DownloadedPaper, user)
         serializer = LibraryItemSerializer(
             downloaded_papers, many=True, context={"request": request}
         )
@@ -184,6 +356,8 @@ class MarkPaperDownloaded(APIView):
         downloaded, created = DownloadedPaper.objects.get_or_create(
             user=user, paper=paper
         )
+        if created:
+            record_download(paper.id)
         return Response(
             data={"message": "Paper marked as downloaded", "created": created},
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
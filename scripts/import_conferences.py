@@ -9,6 +9,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'auth_project.settings')
 django.setup()
 
 # Import model Conference
+from public_api.conference_ranks import normalize_conference_rank
 from public_api.models import Conference
 
 def import_conferences():
@@ -29,7 +30,8 @@ def import_conferences():
             id=uuid.uuid4(),
             name=row['Title'],
             abbreviation=row['Acronym'] if pd.notna(row['Acronym']) else '',
-            rank=row['Rank'] if pd.notna(row['Rank']) else '',
+            # bulk_create bypasses Conference.save(); the rank CHECK only accepts A*|A|B|C|"".
+            rank=normalize_conference_rank(row['Rank'] if pd.notna(row['Rank']) else ''),
             # location không có trong dữ liệu Excel, để trống
             location='',
             url=''